@@ -0,0 +1,4 @@
+"""성능 측정 스크립트 모음
+
+저장소 최상위 디렉토리에서 `python -m benchmarks.<모듈 이름>` 형태로 실행합니다.
+"""
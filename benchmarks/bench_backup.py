@@ -0,0 +1,90 @@
+"""온라인 백업 중 쓰기 지연과 주 스레드 응답성 측정
+
+수백 MB 크기의 데이터베이스를 백업 스레드에서 백업하는 동안
+다른 연결이 10ms마다 한 건씩 쓰는 데 걸리는 시간과, 주 스레드가 5ms마다
+깨어날 때의 지연(화면 멈춤에 해당)을 측정합니다.
+한 번에 모두 복사(pages=-1)하는 경우와 페이지 단위로 나눠 복사하는 경우를 비교합니다.
+
+실행: python -m benchmarks.bench_backup [--size-mb 300]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from utils.backup import backup_database, BACKUP_PAGES
+from utils.database import Database
+from . import datagen
+
+
+# datagen으로 만든 상담 기록(색인 포함) 1MB당 대략의 기록 수
+RECORDS_PER_MB = 550
+
+
+def populate_mb(db_file, size_mb):
+    """datagen의 상담 기록으로 데이터베이스를 대략 size_mb만큼 채웁니다."""
+    datagen.populate(db_file, size_mb * RECORDS_PER_MB, seed=datagen.DEFAULT_SEED)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def measure(db_file, backup_dir, pages):
+    """백업 시간, 쓰기 지연(ms), 주 스레드 지연(ms)을 측정합니다."""
+    stop = threading.Event()
+    write_latency = []
+
+    def writer():
+        db = Database(db_file)
+        while not stop.is_set():
+            start = time.perf_counter()
+            db.add_student(f"쓰기{len(write_latency)}-{pages}")
+            write_latency.append(time.perf_counter() - start)
+            time.sleep(0.01)
+        db.close_connection()
+
+    result = {}
+
+    def backup():
+        start = time.perf_counter()
+        result['path'] = backup_database(db_file, backup_dir, keep=100, pages=pages)
+        result['time'] = time.perf_counter() - start
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    time.sleep(0.2)
+    backup_thread = threading.Thread(target=backup)
+    backup_thread.start()
+    tick_latency = []
+    while backup_thread.is_alive():
+        start = time.perf_counter()
+        time.sleep(0.005)
+        tick_latency.append(time.perf_counter() - start - 0.005)
+    stop.set()
+    writer_thread.join()
+    return result, write_latency, tick_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, 'counseling.db')
+        populate_mb(db_file, args.size_mb)
+        print(f"데이터베이스 크기: {os.path.getsize(db_file) / 1e6:.0f}MB")
+        print(f"{'방식':<16}{'백업(s)':>9}{'쓰기 p99(ms)':>14}{'쓰기 최대(ms)':>14}{'주 스레드 최대 지연(ms)':>24}")
+        for label, pages in (('한 번에', -1), (f'{BACKUP_PAGES}페이지씩', BACKUP_PAGES)):
+            result, writes, ticks = measure(db_file, os.path.join(tmp, 'backups'), pages)
+            ok = result['path'] is not None
+            print(f"{label:<16}{result['time']:>9.2f}{percentile(writes, 0.99) * 1000:>14.1f}"
+                  f"{max(writes) * 1000:>14.1f}{max(ticks) * 1000:>24.1f}{'' if ok else '  (실패)'}")
+
+
+if __name__ == '__main__':
+    main()
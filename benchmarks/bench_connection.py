@@ -0,0 +1,78 @@
+"""연결 재사용 전후의 작업별 지연 시간 비교
+
+호출마다 새 연결을 여는 기존 방식과 스레드별 연결을 유지하는 방식을
+상담 기록 50,000건 데이터베이스에서 비교합니다.
+
+실행: python -m benchmarks.bench_connection [--records 50000] [--repeat 200]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+from utils.database import Database
+from . import datagen
+
+
+class PerCallConnectionDatabase(Database):
+    """호출마다 연결을 새로 여는 기존 방식 (비교용)"""
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_file)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            yield conn
+        finally:
+            conn.close()
+
+
+def measure(db, n_students, repeat):
+    """작업별 평균 지연 시간(ms)을 반환합니다."""
+    rng = random.Random(7)
+    operations = {
+        'get_all_students': lambda: db.get_all_students(),
+        'get_student': lambda: db.get_student(rng.randint(1, n_students)),
+        'get_counsel_records': lambda: db.get_counsel_records(rng.randint(1, n_students)),
+        'get_counsel_record': lambda: db.get_counsel_record(rng.randint(1, 1000)),
+        'add_counsel_record': lambda: db.add_counsel_record(rng.randint(1, n_students), {
+            '일시': '2025-05-01 10:00', '대상': '학생', '방법': '면담', '분류': '진로', '내용': '벤치마크'}),
+        'update_student': lambda: db.update_student(1, {'이름': '벤치마크학생', '메모': '벤치마크'}),
+    }
+    results = {}
+    for name, operation in operations.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            operation()
+        results[name] = (time.perf_counter() - start) / repeat * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=500)
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, cls in (('before', PerCallConnectionDatabase), ('after', Database)):
+            db_file = os.path.join(tmp, f'{label}.db')
+            datagen.populate(db_file, args.records, n_students=args.students, seed=datagen.DEFAULT_SEED)
+            db = cls(db_file)
+            results[label] = measure(db, args.students, args.repeat)
+            db.close_connection()
+
+    print(f"{'작업':<22}{'before(ms)':>12}{'after(ms)':>12}{'배율':>8}")
+    for name in results['before']:
+        before, after = results['before'][name], results['after'][name]
+        print(f"{name:<22}{before:>12.3f}{after:>12.3f}{before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
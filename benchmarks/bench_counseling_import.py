@@ -0,0 +1,85 @@
+"""상담 기록 CSV 가져오기 처리량 측정
+
+export_counseling_to_csv로 만든 파일을 빈 데이터베이스로 가져올 때의 처리량을
+행마다 학생을 조회해 한 건씩 추가하는 방식과 비교합니다.
+검사만 하는 경우와 같은 파일을 다시 가져오는 경우(모두 중복)도 함께 측정합니다.
+
+실행: python -m benchmarks.bench_counseling_import [--records 100000]
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from utils.database import Database
+from . import datagen
+
+
+def empty_database(tmp, label, n_students=300):
+    """원본과 같은 학생만 등록된 새 데이터베이스를 만듭니다. (같은 시드로 학생 정보를 다시 생성)"""
+    db = Database(os.path.join(tmp, f'{label}.db'))
+    students = datagen.generate_students(random.Random(datagen.DEFAULT_SEED), n_students)
+    with db.get_connection() as conn:
+        conn.executemany(datagen.STUDENT_INSERT_QUERY, students)
+        conn.commit()
+    return db
+
+
+def import_per_row(db, file_path):
+    """기존 방식에 해당: 행마다 학생을 조회하고 한 건씩 추가합니다 (비교용)"""
+    with open(file_path, encoding='utf-8-sig', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader)
+        for name, counsel_date, target, method, category, content, _ in reader:
+            with db.get_connection() as conn:
+                row = conn.execute('SELECT id FROM students WHERE name = ?', (name,)).fetchone()
+            db.add_counsel_record(row[0], {'일시': counsel_date, '대상': target, '방법': method, '분류': category, '내용': content})
+
+
+def timed(label, n, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<18}{elapsed:>8.2f}s {n / elapsed:>12,.0f} 행/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--per-row', type=int, default=5000,
+                        help='한 건씩 추가하는 방식으로 측정할 행 수 (전체를 측정하면 오래 걸림)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_file = os.path.join(tmp, 'source.db')
+        datagen.populate(source_file, args.records, n_students=300, seed=datagen.DEFAULT_SEED)
+        source = Database(source_file)
+        file_path = os.path.join(tmp, 'counseling.csv')
+        source.export_counseling_to_csv(file_path)
+        source.close_connection()
+
+        sample_path = os.path.join(tmp, 'sample.csv')
+        with open(file_path, encoding='utf-8-sig', newline='') as src, \
+                open(sample_path, 'w', encoding='utf-8-sig', newline='') as dst:
+            for _ in range(args.per_row + 1):
+                dst.write(src.readline())
+
+        print(f"기록 수: {args.records:,} (파일 {os.path.getsize(file_path) / 1e6:.1f}MB)")
+        db = empty_database(tmp, 'per_row')
+        timed(f"한 건씩({args.per_row:,})", args.per_row, lambda: import_per_row(db, sample_path))
+        db.close_connection()
+
+        db = empty_database(tmp, 'bulk')
+        timed("검사만", args.records, lambda: db.import_counseling_records(file_path, dry_run=True))
+        summary = timed("일괄 가져오기", args.records, lambda: db.import_counseling_records(file_path))
+        again = timed("다시 가져오기", args.records, lambda: db.import_counseling_records(file_path))
+        print(f"추가: {summary['added']:,}건, 다시 가져올 때 추가: {again['added']:,}건")
+        db.close_connection()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""상담 내용 암호화 전후의 조회, 내보내기, 검색 처리량 비교
+
+같은 데이터(datagen으로 만든 상담 기록, 기본 100,000건)를 암호화하지 않은 데이터베이스와 암호화한 데이터베이스에 두고
+학생별 상담 기록 목록(첫 페이지), 선택한 기록 조회, 상담 기록 CSV 내보내기, 검색 시간을 비교합니다.
+목록은 내용을 복호화하지 않으므로 차이가 거의 없어야 하고(목표 10% 이내),
+내보내기는 모든 내용을 복호화하므로 목표를 50% 이내로 둡니다.
+
+실행: python -m benchmarks.bench_encryption [--records 100000]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from utils.database import Database
+from . import datagen
+
+# 항목별 목표 (암호화하지 않은 경우 대비 추가 시간 비율)
+TARGETS = {'목록': 0.10, '기록 조회': 0.50, '내보내기': 0.50}
+
+
+def measure(db, n_students, record_ids, tmp):
+    """항목별 소요 시간(초)"""
+    times = {}
+    start = time.perf_counter()
+    for student_id in range(1, n_students + 1):
+        db.get_counsel_record_page(student_id)
+    times['목록'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for record_id in record_ids:
+        db.get_counsel_record(record_id)
+    times['기록 조회'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    db.export_counseling_to_csv(os.path.join(tmp, 'export.csv'))
+    times['내보내기'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    db.search_records('잠들기 어렵고', limit=100)
+    times['검색'] = time.perf_counter() - start
+
+    # 결과가 없는 검색어: 암호화된 경우 모든 기록을 복호화하는 최악의 경우
+    start = time.perf_counter()
+    db.search_records('찾을수없는말')
+    times['검색(없음)'] = time.perf_counter() - start
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--students', type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_file = os.path.join(tmp, 'plain.db')
+        encrypted_file = os.path.join(tmp, 'encrypted.db')
+        datagen.populate(plain_file, args.records, n_students=args.students, seed=datagen.DEFAULT_SEED)
+        shutil.copy(plain_file, encrypted_file)
+
+        plain = Database(plain_file)
+        encrypted = Database(encrypted_file)
+        start = time.perf_counter()
+        encrypted.enable_encryption('벤치마크-암호')
+        print(f"기록 수: {args.records:,}, 암호화에 걸린 시간: {time.perf_counter() - start:.2f}s")
+
+        record_ids = random.Random(1).sample(range(1, args.records + 1), min(2000, args.records))
+        # 첫 측정은 페이지 캐시를 데우는 용도
+        measure(plain, args.students, record_ids, tmp)
+        measure(encrypted, args.students, record_ids, tmp)
+        plain_times = measure(plain, args.students, record_ids, tmp)
+        encrypted_times = measure(encrypted, args.students, record_ids, tmp)
+
+        print(f"{'항목':<12}{'평문(ms)':>12}{'암호화(ms)':>12}{'추가':>9}{'목표':>8}")
+        for name, plain_time in plain_times.items():
+            overhead = encrypted_times[name] / plain_time - 1
+            target = TARGETS.get(name)
+            verdict = '' if target is None else f"{target:>7.0%}{' 통과' if overhead <= target else ' 초과'}"
+            print(f"{name:<12}{plain_time * 1000:>12.1f}{encrypted_times[name] * 1000:>12.1f}{overhead:>9.0%}{verdict}")
+        print("검색: 평문은 전문 검색 색인, 암호화는 최신순으로 복호화하며 찾음 (목표 없음)")
+        plain.close_connection()
+        encrypted.close_connection()
+
+
+if __name__ == '__main__':
+    main()
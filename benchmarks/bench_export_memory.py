@@ -0,0 +1,58 @@
+"""CSV 내보내기의 최대 메모리 사용량 비교
+
+fetchall()로 모든 행을 읽은 뒤 쓰는 기존 방식과 fetchmany()로 나눠 쓰는 방식의
+최대 메모리(tracemalloc 기준)를 기록 수별로 비교합니다.
+스트리밍 방식은 기록 수가 늘어도 최대 메모리가 거의 일정해야 합니다.
+
+실행: python -m benchmarks.bench_export_memory [--scales 10000 50000 100000]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import tracemalloc
+
+from utils.database import Database, COUNSELING_EXPORT_QUERY
+from . import datagen
+
+
+def export_fetchall(db, file_path):
+    """기존 방식: 모든 행을 메모리에 올린 뒤 씁니다 (비교용)"""
+    with db.get_connection() as conn:
+        records = conn.execute(COUNSELING_EXPORT_QUERY).fetchall()
+    with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['학생이름', '상담일시', '상담대상', '상담방법', '상담분류', '상담내용', '생성일시'])
+        writer.writerows(records)
+
+
+def peak_memory(func):
+    """func 실행 중의 최대 메모리(MB)"""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[10000, 50000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'기록 수':>10}{'fetchall(MB)':>15}{'streaming(MB)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            db_file = os.path.join(tmp, f'{scale}.db')
+            datagen.populate(db_file, scale, n_students=300, seed=datagen.DEFAULT_SEED)
+            db = Database(db_file)
+            out = os.path.join(tmp, 'out.csv')
+            before = peak_memory(lambda: export_fetchall(db, out))
+            after = peak_memory(lambda: db.export_counseling_to_csv(out, progress_callback=lambda done, total: True))
+            db.close_connection()
+            print(f"{scale:>10}{before:>15.1f}{after:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
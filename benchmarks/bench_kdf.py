@@ -0,0 +1,59 @@
+"""암호 해시 비용 선택
+
+scrypt의 n(2의 거듭제곱)을 바꿔 가며 암호 한 번을 확인하는 데 걸리는 시간과 필요한 메모리를 측정하고,
+주어진 지연 예산(기본 250ms) 안에 들어가는 가장 큰 n을 추천합니다.
+비교를 위해 이전 방식(솔트 없는 SHA-256)의 시간도 출력합니다.
+
+실행: python -m benchmarks.bench_kdf [--budget-ms 250] [--repeat 5]
+"""
+
+import argparse
+import hashlib
+import time
+
+from utils.credentials import hash_password, verify_password, SCRYPT_N, SCRYPT_R, SCRYPT_P
+
+PASSWORD = '벤치마크-암호1234'
+
+
+def measure(stored, repeat):
+    """verify_password 한 번에 걸리는 시간(초)의 중앙값"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        assert verify_password(PASSWORD, stored)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=250)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-log-n', type=int, default=18)
+    args = parser.parse_args()
+
+    legacy = hashlib.sha256(PASSWORD.encode('utf-8')).hexdigest()
+    print(f"{'방식':<24}{'확인(ms)':>10}{'메모리(MB)':>12}")
+    print(f"{'SHA-256 (이전 방식)':<24}{measure(legacy, args.repeat) * 1000:>10.3f}{0:>12}")
+
+    best = None
+    for log_n in range(12, args.max_log_n + 1):
+        n = 2 ** log_n
+        elapsed = measure(hash_password(PASSWORD, n=n, r=SCRYPT_R, p=SCRYPT_P), args.repeat)
+        memory = 128 * SCRYPT_R * n / 2 ** 20
+        current = '  (현재 기본값)' if n == SCRYPT_N else ''
+        print(f"{f'scrypt n=2**{log_n} r={SCRYPT_R}':<24}{elapsed * 1000:>10.1f}{memory:>12.0f}{current}")
+        if elapsed * 1000 <= args.budget_ms:
+            best = log_n
+        else:
+            break
+
+    if best is None:
+        print(f"{args.budget_ms:.0f}ms 안에 들어가는 비용이 없습니다.")
+    else:
+        print(f"{args.budget_ms:.0f}ms 예산에 맞는 가장 큰 비용: n=2**{best} (utils/credentials.py의 SCRYPT_N)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""벤치마크용 합성 데이터 생성기
+
+실제와 비슷한 한국어 학생 이름, 연락처, 상담 기록(분류별 문장으로 만든 150~600자 내용)을
+시드로 재현 가능하게 만듭니다. 상담 일시는 평일 근무 시간이며 분류, 방법, 대상은 실제처럼 치우쳐 있습니다.
+같은 시드와 규모이면 항상 같은 데이터가 만들어집니다.
+
+    python -m benchmarks.datagen counseling.db --scale medium
+
+학생 id가 1부터 시작한다고 가정하므로 없는 파일이나 빈 데이터베이스에 채웁니다.
+"""
+
+import argparse
+import datetime
+import random
+import sqlite3
+import time
+
+from utils.config_manager import CATEGORY, TARGET, METHOD
+from utils.database import Database
+
+# 규모 이름 -> 상담 기록 수
+SCALES = {'small': 1_000, 'medium': 50_000, 'large': 500_000}
+
+DEFAULT_SEED = 42
+
+# 흔한 성씨와 대략의 비율(%)
+SURNAMES = [
+    ('김', 21), ('이', 15), ('박', 8), ('최', 5), ('정', 4), ('강', 2), ('조', 2), ('윤', 2), ('장', 2),
+    ('임', 2), ('한', 1), ('오', 1), ('서', 1), ('신', 1), ('권', 1), ('황', 1), ('안', 1), ('송', 1),
+    ('류', 1), ('전', 1), ('홍', 1), ('고', 1), ('문', 1), ('양', 1), ('손', 1), ('배', 1), ('백', 1),
+]
+GIVEN_SYLLABLES = (
+    '민 서 지 현 준 우 윤 예 하 은 도 유 수 진 주 아 원 연 채 다 시 영 재 건 태 승 성 호 경 혜 '
+    '린 나 빈 율 온 규 동 상 희 정 소 미 가 인 훈 석 찬 결 겸 혁'
+).split()
+
+# 분류별 상담 내용 문장 (분류에 없는 경우 공통 문장만 사용)
+CATEGORY_SENTENCES = {
+    '학업': ['중간고사 이후 수학 성적이 떨어져 학습 방법을 함께 점검하였다.', '수업 시간에 집중하기 어렵다고 호소함.',
+             '과제 제출이 계속 늦어져 주간 계획표를 작성하도록 안내함.', '자기주도 학습 시간을 늘리기로 약속함.'],
+    '진로': ['희망 진로로 간호사를 생각하고 있으며 관련 학과 정보를 안내함.', '진로 희망이 아직 정해지지 않아 흥미 검사를 권유함.',
+             '부모님과 희망 진로가 달라 갈등이 있다고 함.', '특성화고 진학에 대해 구체적으로 알아보기로 함.'],
+    '대인관계': ['같은 반 친구들과 오해가 생겨 점심시간에 혼자 지낸다고 함.', '모둠 활동에서 의견 충돌이 잦다고 호소함.',
+                 '친한 친구와 화해하고 싶어 하여 대화 방법을 함께 연습함.', 'SNS 단체방에서 소외감을 느낀다고 말함.'],
+    '가정 및 가족관계': ['부모님의 잦은 다툼으로 집에 있기 힘들다고 말함.', '동생을 돌보느라 공부 시간이 부족하다고 함.',
+                         '보호자와 통화하여 최근 가정 상황을 확인함.'],
+    '정신건강': ['최근 잠들기 어렵고 아침에 일어나기 힘들다고 호소함.', '시험을 앞두고 불안감이 심해져 호흡법을 안내함.',
+                 '무기력감이 2주 이상 지속되어 전문 상담 기관 연계를 검토함.'],
+    '컴퓨터 및 스마트폰 과사용': ['하루 6시간 이상 게임을 한다고 하여 사용 시간 기록을 제안함.',
+                                 '새벽까지 스마트폰을 사용하여 수업 중 조는 일이 잦음.'],
+    '학교폭력 피해': ['쉬는 시간에 특정 학생에게 놀림을 받는다고 진술함.', '피해 사실을 보호자에게 알리고 담당 부서와 공유함.'],
+    '학교폭력 가해': ['친구를 밀친 일에 대해 사실을 확인하고 재발 방지를 약속함.'],
+}
+COMMON_SENTENCES = [
+    '학생의 이야기를 충분히 들어 주고 감정을 정리하도록 도왔다.', '다음 주에 다시 만나 변화를 확인하기로 함.',
+    '담임교사로서 지속적으로 관찰할 필요가 있음.', '학생이 스스로 해결 방법을 찾아보도록 격려함.',
+    '상담 후 표정이 한결 밝아졌다.', '보호자에게 상담 내용을 간단히 안내하기로 함.',
+    '최근 출결 상황과 생활 태도에 큰 변화는 없음.', '교우 관계와 학교 생활 전반에 대해 이야기를 나눔.',
+]
+
+# 상담 분류, 대상, 방법의 대략적인 비율 (목록 순서대로, 없는 항목은 1)
+CATEGORY_WEIGHTS = {'학업': 30, '진로': 20, '대인관계': 15, '가정 및 가족관계': 8, '정신건강': 6, '정보제공': 5, '기타': 5}
+TARGET_WEIGHTS = {'학생': 85, '학부모': 12, '교사': 2, '기타': 1}
+METHOD_WEIGHTS = {'면담': 75, '전화상담': 20, '사이버상담': 5}
+
+STUDENT_INSERT_QUERY = '''
+    INSERT INTO students (name, phone, gender, birth_date, guardian_phone1, guardian_phone2, memo)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+RECORD_INSERT_QUERY = '''
+    INSERT INTO counseling_records (student_id, counsel_date, target, method, category, content)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
+def default_students(n_records):
+    """기록 수에 맞는 학생 수 (학생당 평균 20건, 30명 이상 1,000명 이하)"""
+    return min(1000, max(30, n_records // 20))
+
+
+def _weights(items, weights):
+    return [weights.get(item, 1) for item in items]
+
+
+def _phone(rng):
+    return f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+
+
+def generate_students(rng, n_students):
+    """(이름, 연락처, 성별, 생년월일, 보호자 연락처1, 보호자 연락처2, 메모) 행을 만듭니다.
+
+    이름이 겹치면 학교에서 흔히 쓰는 것처럼 뒤에 A, B, ...를 붙입니다.
+    """
+    surnames, surname_weights = zip(*SURNAMES)
+    seen = {}
+    for _ in range(n_students):
+        name = rng.choices(surnames, surname_weights)[0] + ''.join(rng.choices(GIVEN_SYLLABLES, k=2))
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        if count:
+            name += chr(ord('A') + count - 1) if count <= 26 else str(count)
+        birth = datetime.date(rng.randint(2007, 2012), rng.randint(1, 12), rng.randint(1, 28))
+        memo = rng.choice(['', '', '', '알레르기 있음', '방과후 돌봄 참여', '전학 온 학생'])
+        yield (name, _phone(rng), rng.choice(['남', '여']), birth.isoformat(),
+               _phone(rng), _phone(rng) if rng.random() < 0.3 else '', memo)
+
+
+def generate_content(rng, category):
+    """분류에 맞는 문장을 이어 150~600자 안팎의 상담 내용을 만듭니다."""
+    sentences = CATEGORY_SENTENCES.get(category, []) + COMMON_SENTENCES
+    target_length = min(600, max(150, int(rng.lognormvariate(5.6, 0.45))))
+    parts, length = [], 0
+    while length < target_length:
+        sentence = rng.choice(sentences)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(parts)
+
+
+def generate_records(rng, n_records, n_students, start_year=2021, years=5):
+    """(student_id, 일시, 대상, 방법, 분류, 내용) 행을 만듭니다. 일시는 평일 08:00~17:50입니다."""
+    start = datetime.date(start_year, 3, 1)
+    span_days = years * 365
+    category_weights = _weights(CATEGORY, CATEGORY_WEIGHTS)
+    target_weights = _weights(TARGET, TARGET_WEIGHTS)
+    method_weights = _weights(METHOD, METHOD_WEIGHTS)
+    for _ in range(n_records):
+        day = start + datetime.timedelta(days=rng.randrange(span_days))
+        while day.weekday() >= 5:  # 주말이면 다시 뽑음
+            day = start + datetime.timedelta(days=rng.randrange(span_days))
+        category = rng.choices(CATEGORY, category_weights)[0]
+        yield (
+            rng.randint(1, n_students),
+            f"{day.isoformat()} {rng.randint(8, 17):02d}:{rng.randrange(0, 60, 10):02d}",
+            rng.choices(TARGET, target_weights)[0],
+            rng.choices(METHOD, method_weights)[0],
+            category,
+            generate_content(rng, category),
+        )
+
+
+def populate(db_file, n_records, n_students=None, seed=DEFAULT_SEED):
+    """데이터베이스를 만들거나 열어 학생과 상담 기록을 채우고 (학생 수, 기록 수)를 반환합니다.
+
+    학생 id가 1부터 시작한다고 가정하므로 빈 데이터베이스에 사용합니다.
+    """
+    if n_students is None:
+        n_students = default_students(n_records)
+    Database(db_file).close_connection()  # 스키마 생성
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.executemany(STUDENT_INSERT_QUERY, generate_students(rng, n_students))
+        conn.executemany(RECORD_INSERT_QUERY, generate_records(rng, n_records, n_students))
+        conn.commit()
+    finally:
+        conn.close()
+    return n_students, n_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('db_file')
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--records', type=int, help='상담 기록 수 (--scale 대신 지정)')
+    parser.add_argument('--students', type=int)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_students, n_records = populate(args.db_file, args.records or SCALES[args.scale], args.students, args.seed)
+    print(f"학생 {n_students:,}명, 상담 기록 {n_records:,}건 생성 ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,538 @@
+"""Database 공개 메서드와 데이터베이스 워커의 성능 측정 모음
+
+datagen으로 만든 데이터베이스에서 Database의 모든 공개 메서드(내보내기, 가져오기, 나이스 내보내기 포함)와
+워커 요청 왕복 시간을 측정하여 소요 시간(repeat번 중 가장 빠른 값), 처리량, 최대 메모리(tracemalloc 기준)를
+JSON으로 저장합니다. 기준 결과와 항목별로 비교하여
+--threshold보다 느려지거나 메모리를 더 쓰는 항목이 있으면 1을 반환합니다.
+기준 결과는 --baseline으로 지정하며, 지정하지 않으면 규모별 기본 기준 파일(benchmarks/baseline_small.json 등)이
+있을 때 그 파일과 비교합니다. 기준 파일은 측정한 컴퓨터에 따라 다르므로 필요하면 --output으로 다시 만드세요.
+
+실행: python -m benchmarks.suite [--scale small|medium|large] [--output 결과.json] [--baseline 기준.json | --no-baseline]
+
+같은 규모와 시드로 만든 결과끼리만 비교하세요. 새 공개 메서드를 추가하면 CASES에도 추가합니다.
+(측정 항목이 없는 메서드는 실행할 때 경고로 표시됩니다.)
+"""
+
+import argparse
+import csv
+import datetime
+import fnmatch
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from utils.config_manager import CATEGORY
+from utils.database import Database, STUDENT_CSV_COLUMNS
+from utils.encryption import is_available as encryption_available
+from . import datagen
+
+# 기준 결과보다 이 비율 이상 느려지면 회귀로 봄
+DEFAULT_THRESHOLD = 0.20
+# 시간은 차이가 이 값(ms) 이상일 때만 비교 (1ms 안팎 항목의 흔들림 무시)
+TIME_SLACK_MS = 5.0
+# 최대 메모리는 차이가 이 값(MB) 이상일 때만 비교 (작은 값의 흔들림 무시)
+MEMORY_SLACK_MB = 1.0
+
+BENCH_PASSWORD = '벤치마크-암호'
+
+# 규모별 기본 기준 결과 파일 (규모 이름이 들어감)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_{scale}.json')
+
+# 측정하지 않는 공개 메서드 (다른 항목에서 함께 실행됨)
+NOT_MEASURED = {'get_connection', 'close_connection'}
+
+SEARCH_QUERIES = ['수학 성적', '진로 희망', '잠들기 어렵고', '게임', '찾을수없는말']
+
+
+class Context:
+    """측정 중에 공유하는 데이터베이스, 임시 폴더, 표본 id"""
+
+    def __init__(self, db_file, tmp, n_students, n_records, seed):
+        self.db_file = db_file
+        self.tmp = tmp
+        self.db = Database(db_file)
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.n_students = n_students
+        self.n_records = n_records
+        self._serial = 0
+        self._files = {}
+        self._driver = None
+
+    def student_ids(self, k):
+        return [self.rng.randint(1, self.n_students) for _ in range(k)]
+
+    def record_ids(self, k):
+        return [self.rng.randint(1, self.n_records) for _ in range(k)]
+
+    def path(self, name):
+        """임시 폴더 안의 새 파일 경로"""
+        self._serial += 1
+        return os.path.join(self.tmp, f"{self._serial}-{name}")
+
+    def exported(self, kind):
+        """가져오기에 쓸 CSV 파일 (처음 한 번만 만듦)
+
+        학생 파일은 일괄 등록 양식의 열 순서로, 같은 시드로 다시 생성한 학생 정보를 씁니다.
+        """
+        if kind not in self._files:
+            path = self.path(f'{kind}.csv')
+            if kind == 'students':
+                with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(STUDENT_CSV_COLUMNS)
+                    writer.writerows(datagen.generate_students(random.Random(self.seed), self.n_students))
+            else:
+                self.db.export_counseling_to_csv(path)
+            self._files[kind] = path
+        return self._files[kind]
+
+    def copy_db(self, source=None):
+        """(WAL을 반영한) 데이터베이스 파일의 복사본 경로"""
+        source = source or self.db_file
+        with sqlite3.connect(source) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        path = self.path('copy.db')
+        shutil.copy(source, path)
+        return path
+
+    def encrypted_template(self):
+        """암호화한 데이터베이스 복사본 (처음 한 번만 만듦)"""
+        if 'encrypted' not in self._files:
+            path = self.copy_db()
+            db = Database(path)
+            db.enable_encryption(BENCH_PASSWORD)
+            db.close_connection()
+            self._files['encrypted'] = path
+        return self._files['encrypted']
+
+    def worker(self):
+        """워커 요청을 보내고 응답을 기다리는 객체 (처음 한 번만 시작)"""
+        if self._driver is None:
+            self._driver = start_worker_driver(self.db_file)
+        return self._driver
+
+    def close(self):
+        if self._driver is not None:
+            self._driver.stop()
+        self.db.close_connection()
+
+
+def start_worker_driver(db_file):
+    """DatabaseClient로 요청을 보내고 응답을 기다리는 _WorkerDriver (PySide6는 필요할 때만 가져옴)"""
+    from PySide6.QtCore import QCoreApplication, QEventLoop, QObject
+    from utils.database_worker import DatabaseClient
+
+    class _WorkerDriver(QObject):
+        """응답 시그널은 이 객체가 있는 메인 스레드로 전달되므로 이벤트 루프가 돌기 전에 끝나지 않음"""
+
+        def __init__(self):
+            super().__init__()
+            self.app = QCoreApplication.instance() or QCoreApplication([])
+            self.client = DatabaseClient()
+            self.client.worker.db = Database(db_file)  # open_database가 기본 경로를 열지 않도록 미리 지정
+            worker = self.client.worker
+            # 각 작업의 마지막 응답 시그널
+            worker.counsel_records_ready.connect(self.finish)
+            worker.statistics_ready.connect(self.finish)
+            worker.operation_error.connect(self.finish)
+            self._pending = None
+            self._loop = QEventLoop()
+            self.client.start()
+
+        def finish(self, request_id, *args):
+            if request_id == self._pending:
+                self._loop.quit()
+
+        def call(self, operation, *args):
+            self._pending = self.client.request(operation, *args)
+            self._loop.exec()
+
+        def clear_cache(self):
+            # 워커는 응답을 보낸 뒤 대기 중이므로 여기서 비워도 겹치지 않음
+            self.client.worker.cache.clear()
+
+        def stop(self):
+            self.client.stop()
+
+    return _WorkerDriver()
+
+
+# 측정 항목: 이름 -> prepare(ctx)
+# prepare는 측정하지 않는 준비 작업을 한 뒤 (측정할 함수, 처리 단위 수, 단위 이름)을 반환합니다.
+# 처리 단위 수가 함수이면 측정한 함수를 실행한 뒤 호출하여 구합니다.
+# 이름의 '[' 앞부분은 측정하는 Database 메서드 이름이거나 'worker.'로 시작하는 워커 작업입니다.
+
+def _calls(method, args_list, unit='calls'):
+    def run():
+        for args in args_list:
+            method(*args)
+    return run, len(args_list), unit
+
+
+def _export(method, *args):
+    def prepare(ctx):
+        rows = {}
+        path = ctx.path('export.csv')
+
+        def run():
+            # GUI의 워커처럼 진행 콜백을 지정하여 측정
+            getattr(ctx.db, method)(path, *args, progress_callback=lambda done, total: rows.update(done=done) or True)
+        return run, lambda: rows.get('done', 0), 'rows'
+    return prepare
+
+
+def _student_info(name):
+    return {
+        '이름': name, '연락처': '010-1234-5678', '성별': '여', '생년월일': '2010-05-05',
+        '보호자 연락처1': '010-2345-6789', '보호자 연락처2': '', '메모': '벤치마크 학생',
+    }
+
+
+def _record(rng):
+    category = rng.choice(CATEGORY)
+    return {'일시': f"2025-{rng.randint(3, 12):02d}-{rng.randint(1, 28):02d} 10:00", '대상': '학생',
+            '방법': '면담', '분류': category, '내용': datagen.generate_content(rng, category)}
+
+
+def _add_students(ctx, n):
+    """새 학생 n명을 추가하고 (id, 이름) 목록을 반환합니다."""
+    students = []
+    for _ in range(n):
+        ctx._serial += 1
+        name = f'벤치{ctx._serial:06d}'
+        students.append((ctx.db.add_student(name, _student_info(name)), name))
+    return students
+
+
+def prepare_add_student(ctx):
+    def run():
+        _add_students(ctx, 200)
+    return run, 200, 'calls'
+
+
+def prepare_update_student(ctx):
+    students = _add_students(ctx, 200)
+    return _calls(ctx.db.update_student, [(i, {**_student_info(name), '메모': '수정함'}) for i, name in students])
+
+
+def prepare_delete_student(ctx):
+    students = _add_students(ctx, 100)
+    for student_id, _ in students:
+        for _ in range(5):
+            ctx.db.add_counsel_record(student_id, _record(ctx.rng))
+    return _calls(ctx.db.delete_student, [(i,) for i, _ in students])
+
+
+def prepare_add_counsel_record(ctx):
+    return _calls(ctx.db.add_counsel_record, [(i, _record(ctx.rng)) for i in ctx.student_ids(500)])
+
+
+def prepare_update_counsel_record(ctx):
+    return _calls(ctx.db.update_counsel_record, [(i, _record(ctx.rng)) for i in ctx.record_ids(500)])
+
+
+def prepare_delete_counsel_record(ctx):
+    student_ids = ctx.student_ids(500)
+    for student_id in student_ids:
+        ctx.db.add_counsel_record(student_id, _record(ctx.rng))
+    with ctx.db.get_connection() as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM counseling_records ORDER BY id DESC LIMIT 500")]
+    return _calls(ctx.db.delete_counsel_record_by_id, [(i,) for i in ids])
+
+
+def prepare_save_draft(ctx):
+    # 자동 저장처럼 새 기록의 임시 저장을 계속 덮어쓰고, 일부는 기록 수정의 임시 저장
+    record_ids = [None] * 400 + ctx.record_ids(100)
+    return _calls(ctx.db.save_draft, [(dict(_record(ctx.rng), 학생='벤치마크'), i) for i in record_ids])
+
+
+def prepare_delete_draft(ctx):
+    record_ids = sorted(set(ctx.record_ids(200)))
+    for record_id in record_ids:
+        ctx.db.save_draft(dict(_record(ctx.rng), 학생=''), record_id)
+    return _calls(ctx.db.delete_draft, [(i,) for i in record_ids])
+
+
+def prepare_import_students(ctx):
+    source = ctx.exported('students')
+    db = Database(ctx.path('import.db'))
+
+    def run():
+        if not db.import_csv_to_students(source):
+            raise RuntimeError("학생 정보 가져오기 실패")
+        db.close_connection()
+    return run, ctx.n_students, 'rows'
+
+
+def prepare_import_counseling(ctx, dry_run=False):
+    source = ctx.exported('counseling')
+    if dry_run:
+        db = ctx.db
+    else:
+        db = Database(ctx.path('import.db'))
+        if not db.import_csv_to_students(ctx.exported('students')):
+            raise RuntimeError("학생 정보 가져오기 실패")
+
+    def run():
+        if db.import_counseling_records(source, dry_run=dry_run) is None:
+            raise RuntimeError("상담 기록 가져오기 실패")
+        if db is not ctx.db:
+            db.close_connection()
+    return run, ctx.n_records, 'rows'
+
+
+def prepare_init_database(ctx):
+    def run():
+        for _ in range(20):
+            Database(ctx.db_file).close_connection()
+    return run, 20, 'calls'
+
+
+def prepare_enable_encryption(ctx):
+    db = Database(ctx.copy_db())
+
+    def run():
+        db.enable_encryption(BENCH_PASSWORD)
+        db.close_connection()
+    return run, ctx.n_records, 'rows'
+
+
+def prepare_unlock(ctx):
+    db = Database(ctx.encrypted_template())
+    return _calls(db.unlock, [(BENCH_PASSWORD,)])
+
+
+def prepare_change_key_password(ctx):
+    db = Database(ctx.copy_db(ctx.encrypted_template()))
+    db.unlock(BENCH_PASSWORD)
+    return _calls(db.change_key_password, [(BENCH_PASSWORD, BENCH_PASSWORD + '2')])
+
+
+def prepare_worker_student(ctx, hit):
+    driver = ctx.worker()
+    ids = ctx.student_ids(32)  # 워커 캐시 크기 이내
+    driver.clear_cache()
+    if hit:
+        for student_id in ids:
+            driver.call('get_student_info_and_counsel', student_id)
+    return _calls(driver.call, [('get_student_info_and_counsel', i) for i in ids], 'requests')
+
+
+CASES = {
+    'check_connection': lambda ctx: _calls(ctx.db.check_connection, [()] * 1000),
+    'init_database': prepare_init_database,
+    'get_summary': lambda ctx: _calls(ctx.db.get_summary, [()] * 20),
+    'get_all_students': lambda ctx: _calls(ctx.db.get_all_students, [()] * 100),
+    'get_student': lambda ctx: _calls(ctx.db.get_student, [(i,) for i in ctx.student_ids(1000)]),
+    'get_counsel_records': lambda ctx: _calls(ctx.db.get_counsel_records, [(i,) for i in ctx.student_ids(200)]),
+    'get_counsel_record_page': lambda ctx: _calls(ctx.db.get_counsel_record_page, [(i,) for i in ctx.student_ids(1000)]),
+    'get_counsel_record': lambda ctx: _calls(ctx.db.get_counsel_record, [(i,) for i in ctx.record_ids(2000)]),
+    'search_records': lambda ctx: _calls(ctx.db.search_records, [(q,) for q in SEARCH_QUERIES]),
+    'search_records[filtered]': lambda ctx: _calls(
+        ctx.db.search_records, [(q, {'분류': '학업', '시작일': '2023-03-01', '종료일': '2024-02-29'}) for q in SEARCH_QUERIES]
+    ),
+    'get_statistics': lambda ctx: _calls(
+        ctx.db.get_statistics, [(year, group_by) for year in (None, 2023) for group_by in ('category', 'method', 'target', 'month')] * 10
+    ),
+    'export_to_csv': _export('export_to_csv'),
+    'export_students_to_csv': _export('export_students_to_csv'),
+    'export_counseling_to_csv': _export('export_counseling_to_csv'),
+    'export_counseling_to_csv_for_neis': _export('export_counseling_to_csv_for_neis', '2000-01-01', '2099-12-31'),
+    'export_form_students_csv': lambda ctx: _calls(ctx.db.export_form_students_csv, [(ctx.path('form.csv'),)] * 10),
+    'import_csv_to_students': prepare_import_students,
+    'import_counseling_records': prepare_import_counseling,
+    'import_counseling_records[dry_run]': lambda ctx: prepare_import_counseling(ctx, dry_run=True),
+    'add_student': prepare_add_student,
+    'update_student': prepare_update_student,
+    'delete_student': prepare_delete_student,
+    'add_counsel_record': prepare_add_counsel_record,
+    'update_counsel_record': prepare_update_counsel_record,
+    'delete_counsel_record_by_id': prepare_delete_counsel_record,
+    'save_draft': prepare_save_draft,
+    'get_drafts': lambda ctx: _calls(ctx.db.get_drafts, [()] * 100),
+    'delete_draft': prepare_delete_draft,
+    'vacuum': lambda ctx: _calls(ctx.db.vacuum, [()]),
+    'get_query_stats': lambda ctx: _calls(ctx.db.get_query_stats, [()] * 100),
+    'reset_query_stats': lambda ctx: _calls(ctx.db.reset_query_stats, [()] * 100),
+    'enable_encryption': prepare_enable_encryption,
+    'unlock': prepare_unlock,
+    'change_key_password': prepare_change_key_password,
+    'worker.get_student_info_and_counsel[miss]': lambda ctx: prepare_worker_student(ctx, hit=False),
+    'worker.get_student_info_and_counsel[hit]': lambda ctx: prepare_worker_student(ctx, hit=True),
+    'worker.get_statistics': lambda ctx: _calls(ctx.worker().call, [('get_statistics', None, 'category')] * 50, 'requests'),
+}
+
+ENCRYPTION_CASES = {'enable_encryption', 'unlock', 'change_key_password'}
+
+
+def unmeasured_methods():
+    """CASES에 없는 Database 공개 메서드 목록"""
+    public = {name for name, _ in inspect.getmembers(Database, inspect.isfunction) if not name.startswith('_')}
+    measured = {name.split('[')[0] for name in CASES}
+    return sorted(public - measured - NOT_MEASURED)
+
+
+def measure(ctx, prepare, repeat):
+    """prepare한 함수를 repeat번 실행한 가장 빠른 시간과, 따로 한 번 더 실행한 최대 메모리를 반환합니다."""
+    times = []
+    for _ in range(repeat):
+        run, units, unit = prepare(ctx)
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    if callable(units):
+        units = units()
+    run, _, _ = prepare(ctx)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    seconds = min(times)
+    return {
+        'seconds': round(seconds, 6),
+        'median_seconds': round(statistics.median(times), 6),
+        'units': units,
+        'unit': unit,
+        'per_second': round(units / seconds, 1) if seconds > 0 else None,
+        'peak_mb': round(peak / 1024 / 1024, 3),
+    }
+
+
+def compare(results, baseline, threshold):
+    """기준 결과와 비교한 표를 출력하고 회귀한 항목 이름 목록을 반환합니다."""
+    base_meta, meta = baseline.get('meta', {}), results['meta']
+    for key in ('records', 'students', 'seed'):
+        if base_meta.get(key) != meta.get(key):
+            print(f"주의: 기준 결과의 {key}({base_meta.get(key)})가 현재({meta.get(key)})와 다릅니다.")
+    regressions = []
+    print(f"\n{'항목':<45}{'기준(ms)':>12}{'현재(ms)':>12}{'변화':>9}{'메모리(MB)':>18}")
+    for name, current in results['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            print(f"{name:<45}{'-':>12}{current['seconds'] * 1000:>12.1f}{'새 항목':>9}")
+            continue
+        change = current['seconds'] / base['seconds'] - 1 if base['seconds'] else 0.0
+        memory_change = current['peak_mb'] - base['peak_mb']
+        slower = change > threshold and (current['seconds'] - base['seconds']) * 1000 > TIME_SLACK_MS
+        heavier = memory_change > MEMORY_SLACK_MB and current['peak_mb'] > base['peak_mb'] * (1 + threshold)
+        verdict = ' 회귀' if slower or heavier else ''
+        if verdict:
+            regressions.append(name)
+        print(f"{name:<45}{base['seconds'] * 1000:>12.1f}{current['seconds'] * 1000:>12.1f}{change:>+9.0%}"
+              f"{base['peak_mb']:>9.1f}->{current['peak_mb']:<7.1f}{verdict}")
+    missing = sorted(set(baseline.get('results', {})) - set(results['results']))
+    if missing:
+        print(f"현재 결과에 없는 항목: {', '.join(missing)}")
+    return regressions
+
+
+def prepare_database(args, tmp):
+    """측정할 데이터베이스 파일을 만듭니다. --cache-dir이 있으면 같은 규모의 생성 결과를 재사용합니다."""
+    n_students = args.students or datagen.default_students(args.records)
+    name = f"bench-{args.records}-{n_students}-seed{args.seed}.db"
+    db_file = os.path.join(tmp, 'bench.db')
+    template = os.path.join(args.cache_dir, name) if args.cache_dir else None
+    if template and os.path.exists(template):
+        shutil.copy(template, db_file)
+        return db_file, n_students
+    start = time.perf_counter()
+    datagen.populate(db_file, args.records, n_students, args.seed)
+    print(f"데이터 생성: 학생 {n_students:,}명, 상담 기록 {args.records:,}건 ({time.perf_counter() - start:.1f}s)")
+    if template:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        with sqlite3.connect(db_file) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        shutil.copy(db_file, template)
+    return db_file, n_students
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=datagen.SCALES, default='small')
+    parser.add_argument('--records', type=int, help='상담 기록 수 (--scale 대신 지정)')
+    parser.add_argument('--students', type=int)
+    parser.add_argument('--seed', type=int, default=datagen.DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=3, help='항목별 반복 횟수 (가장 빠른 값을 기록)')
+    parser.add_argument('--only', nargs='+', metavar='패턴', help='이름이 패턴(fnmatch)과 맞는 항목만 측정')
+    parser.add_argument('--no-worker', action='store_true', help='워커 왕복 시간은 측정하지 않음 (PySide6 불필요)')
+    parser.add_argument('--cache-dir', help='생성한 데이터베이스를 보관하고 재사용할 폴더')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일 (기본값: 규모별 기본 기준 파일)')
+    parser.add_argument('--no-baseline', action='store_true', help='기준 결과와 비교하지 않음')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='회귀로 볼 느려진 비율 (기본값: 0.20)')
+    args = parser.parse_args()
+    if not args.baseline and not args.no_baseline and not args.records and not args.students:
+        # 기본 기준 파일은 같은 규모의 기본 학생 수로 측정한 결과이므로 규모만 지정한 경우에만 사용
+        default_baseline = DEFAULT_BASELINE.format(scale=args.scale)
+        if os.path.exists(default_baseline):
+            args.baseline = default_baseline
+    args.records = args.records or datagen.SCALES[args.scale]
+
+    names = [name for name in CASES if not args.only or any(fnmatch.fnmatch(name, p) for p in args.only)]
+    if args.no_worker:
+        names = [name for name in names if not name.startswith('worker.')]
+    if not encryption_available():
+        print("cryptography 패키지가 없어 암호화 항목은 측정하지 않습니다.")
+        names = [name for name in names if name not in ENCRYPTION_CASES]
+    for name in unmeasured_methods():
+        print(f"주의: 측정 항목이 없는 공개 메서드 {name}")
+
+    results = {
+        'meta': {
+            'records': args.records,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file, n_students = prepare_database(args, tmp)
+        results['meta']['students'] = n_students
+        ctx = Context(db_file, tmp, n_students, args.records, args.seed)
+        try:
+            print(f"\n{'항목':<45}{'시간(ms)':>12}{'처리량(/s)':>14}{'메모리(MB)':>12}")
+            for name in names:
+                result = measure(ctx, CASES[name], args.repeat)
+                results['results'][name] = result
+                print(f"{name:<45}{result['seconds'] * 1000:>12.1f}"
+                      f"{result['per_second'] or 0:>14,.0f} {result['unit']:<8}{result['peak_mb']:>6.1f}")
+        finally:
+            ctx.close()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    if args.baseline and not args.no_baseline:
+        print(f"\n기준 결과: {args.baseline}")
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if len(names) < len(CASES):
+            # 일부 항목만 측정했으면 그 항목만 비교
+            baseline['results'] = {name: r for name, r in baseline.get('results', {}).items() if name in names}
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{args.threshold:.0%} 넘게 느려지거나 메모리를 더 쓰는 항목: {', '.join(regressions)}")
+            return 1
+        print("\n회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
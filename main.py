@@ -1,14 +1,37 @@
 """
 HeartWings Lite
 마음나래 Lite의 메인 진입점
+
+python main.py --profile-startup 으로 실행하면 시작 단계별 시간과 모듈 가져오기 시간을 출력합니다.
+python main.py --cli <명령> 으로 실행하면 GUI 없이 내보내기, 가져오기, 백업 등을 실행합니다. (utils/cli.py)
+python main.py --trace trace.json 으로 실행하면 사용자 동작 추적을 기록하여 종료할 때 저장합니다. (utils/tracing.py)
 """
 
 import sys, os
-from PySide6.QtWidgets import QApplication, QMessageBox
+
+# 명령줄 모드는 Qt 위젯을 가져오지 않고 바로 실행
+if __name__ == '__main__' and sys.argv[1:2] == ['--cli']:
+    from utils.cli import run
+    sys.exit(run(sys.argv[2:]))
+from utils.startup_profile import StartupProfiler
+
+# 가장 먼저 측정을 시작해야 아래 모듈 가져오기 시간도 기록됨
+profiler = StartupProfiler(enabled='--profile-startup' in sys.argv)
+profiler.install()
+
+# --trace 파일: 시작부터 동작 추적
+from utils import tracing
+trace_file = None
+if '--trace' in sys.argv[:-1]:
+    trace_file = sys.argv[sys.argv.index('--trace') + 1]
+    tracing.enable()
+
+# 암호 대화상자까지는 최소한의 모듈만 가져옵니다. (메인 창 모듈은 암호 확인 후 가져옴)
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from utils.config_manager import is_password_set, check_password, set_password, get_font_size
 from ui.dialogs import CreatePasswordDialog, PasswordDialog
-from ui.main_window import MainApp
 
 # 스크립트의 디렉토리를 sys.path에 추가하여 resources_rc를 찾을 수 있도록 합니다.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,41 +47,44 @@ except ImportError:
 
 # 테마 관리자 모듈을 가져옵니다.
 from utils.theme_manager import ThemeManager
+profiler.phase("기본 모듈 가져오기")
 
 def main():
     """메인 애플리케이션 함수"""
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(":icons/icon.png"))
+    if trace_file:
+        app.aboutToQuit.connect(lambda: print(f"동작 추적 이벤트 {tracing.export_chrome_trace(trace_file):,}개 저장: {trace_file}"))
+    profiler.phase("QApplication 생성")
 
     # --- 테마 관리자 초기화 ---
     font_size = get_font_size()
     theme_manager = ThemeManager(font_size=f"{font_size}px")
     theme_manager.apply_theme()
+    profiler.phase("테마 적용")
 
     # 암호 설정 확인 및 처리
     if not is_password_set():
-        dialog = CreatePasswordDialog()
-        if dialog.exec():
-            password = dialog.get_password()
-            set_password(password)
-        else:
+        # 새 암호의 해시 계산과 저장은 다이얼로그가 암호 확인 스레드에서 실행함
+        dialog = CreatePasswordDialog(save=set_password)
+        if not dialog.exec():
             sys.exit(0)
 
-    # 암호 확인
-    while True:
-        dialog = PasswordDialog()
-        if dialog.exec():
-            password = dialog.get_password()
-            if check_password(password):
-                break
-            else:
-                QMessageBox.warning(None, '오류', '암호가 올바르지 않습니다.')
-        else:
-            sys.exit(0)
+    # 암호 확인 (맞는 암호를 입력해야 대화상자가 닫힘)
+    dialog = PasswordDialog(verify=check_password)
+    if not dialog.exec():
+        sys.exit(0)
+    profiler.skip()
 
     # 메인 윈도우 실행
-    main_window = MainApp(theme_manager)
+    from ui.main_window import MainApp
+    profiler.phase("메인 창 모듈 가져오기")
+    # 암호화된 데이터베이스의 데이터 키를 로그인 암호로 엶
+    main_window = MainApp(theme_manager, dialog.get_password())
+    profiler.phase("메인 창 생성")
     main_window.show()
+    # 이벤트 루프가 처음 화면을 그린 뒤 결과 출력
+    QTimer.singleShot(0, lambda: (profiler.phase("첫 화면 표시"), profiler.report()))
     sys.exit(app.exec())
 
 if __name__ == '__main__':
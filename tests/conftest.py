@@ -0,0 +1,18 @@
+"""테스트 공통 설정
+
+Qt 위젯을 화면 없이 만들 수 있도록 offscreen 플랫폼을 사용합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
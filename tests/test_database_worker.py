@@ -0,0 +1,198 @@
+"""DatabaseClient 요청이 모두 워커 스레드에서 실행되는지 확인하는 테스트"""
+
+import functools
+import inspect
+import threading
+
+import pytest
+from PySide6.QtCore import QEventLoop, QObject, QTimer, Slot
+
+import utils.database_worker as database_worker
+from utils.database import Database, DatabaseLocked
+
+REPLY_TIMEOUT_MS = 5000
+
+
+class ReplyCollector(QObject):
+    """워커의 응답 시그널을 메인 스레드에서 받아 요청 ID별로 모읍니다. (바운드 슬롯이므로 큐 연결)"""
+
+    def __init__(self, worker):
+        super().__init__()
+        self.replies = {}
+        self._loop = None
+        self._waiting = None
+        for signal in (worker.students_ready, worker.student_info_ready, worker.counsel_record_ready,
+                       worker.search_results_ready, worker.statistics_ready):
+            signal.connect(self.data_ready)
+        worker.counsel_records_ready.connect(self.page_ready)
+        worker.operation_success.connect(self.success)
+        worker.operation_error.connect(self.error)
+
+    def _reply(self, request_id, reply):
+        self.replies.setdefault(request_id, reply)
+        if request_id == self._waiting and self._loop is not None:
+            self._loop.quit()
+
+    @Slot(int, object)
+    def data_ready(self, request_id, data):
+        self._reply(request_id, ('data', data))
+
+    @Slot(int, list, bool)
+    def page_ready(self, request_id, records, has_more):
+        self._reply(request_id, ('page', records))
+
+    @Slot(int, str, object)
+    def success(self, request_id, operation, data):
+        self._reply(request_id, ('success', data))
+
+    @Slot(int, str)
+    def error(self, request_id, message):
+        self._reply(request_id, ('error', message))
+
+    def wait(self, request_id):
+        """request_id의 응답을 기다려 반환합니다."""
+        if request_id not in self.replies:
+            self._waiting = request_id
+            self._loop = QEventLoop()
+            QTimer.singleShot(REPLY_TIMEOUT_MS, self._loop.quit)
+            self._loop.exec()
+            self._loop = None
+        assert request_id in self.replies, f"요청 {request_id}의 응답이 오지 않았습니다."
+        return self.replies[request_id]
+
+
+@pytest.fixture
+def gui_thread_calls(monkeypatch):
+    """모든 공개 Database 메서드가 GUI 스레드에서 호출되면 기록하도록 감쌉니다."""
+    gui_thread = threading.get_ident()
+    calls = []
+
+    def guard(name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if threading.get_ident() == gui_thread:
+                calls.append(name)
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name, method in inspect.getmembers(Database, inspect.isfunction):
+        if not name.startswith('_'):
+            monkeypatch.setattr(Database, name, guard(name, method))
+    return calls
+
+
+@pytest.fixture
+def client(qapp, tmp_path, monkeypatch, gui_thread_calls):
+    # 워커가 기본 경로 대신 임시 데이터베이스를 열도록 함 (열기도 워커 스레드에서 실행됨)
+    db_file = str(tmp_path / 'counseling.db')
+    monkeypatch.setattr(database_worker, 'Database', lambda: Database(db_file))
+    client = database_worker.DatabaseClient()
+    collector = ReplyCollector(client.worker)
+    client.start()
+    yield client, collector
+    client.stop()
+
+
+def test_database_methods_run_on_worker_thread(client, gui_thread_calls):
+    client, collector = client
+    record = {'일시': '2025-04-01 10:00', '대상': '학생', '방법': '면담', '분류': '학업', '내용': '수학 성적 상담'}
+
+    assert collector.wait(client.request('add_student', '홍길동')) == ('success', '홍길동')
+    kind, students = collector.wait(client.request('get_all_students'))
+    assert kind == 'data' and [name for _, name in students] == ['홍길동']
+    student_id = students[0][0]
+
+    assert collector.wait(client.request('add_counsel_record', student_id, record))[0] == 'success'
+    kind, info = collector.wait(client.request('get_student_info_and_counsel', student_id))
+    assert kind == 'data' and info['이름'] == '홍길동'
+    kind, results = collector.wait(client.request('search_records', '수학', {}))
+    assert kind == 'data' and len(results) == 1
+    kind, rows = collector.wait(client.request('get_statistics', None, 'category'))
+    assert kind == 'data' and rows == [('학업', 1)]
+
+    assert gui_thread_calls == []
+
+
+@pytest.fixture
+def worker(qapp, tmp_path):
+    # 스레드 없이 요청을 바로 처리하는 워커 (시그널은 같은 스레드에서 직접 전달됨)
+    worker = database_worker.DatabaseWorker()
+    worker.db = Database(str(tmp_path / 'counseling.db'))
+    replies = []
+    worker.operation_error.connect(lambda request_id, message: replies.append(('error', request_id)))
+    worker.operation_success.connect(lambda request_id, operation, data: replies.append(('success', request_id)))
+    worker.operation_cancelled.connect(lambda request_id: replies.append(('cancelled', request_id)))
+    worker.drafts_ready.connect(lambda request_id, drafts: replies.append(('drafts', request_id)))
+    yield worker, replies
+    worker.db.close_connection()
+
+
+def _raise(*args, **kwargs):
+    raise RuntimeError('예상하지 못한 오류')
+
+
+def test_draft_errors_do_not_escape_worker(worker, monkeypatch):
+    worker, replies = worker
+    draft = {'학생': '홍길동', '일시': '2025-04-01 10:00', '대상': '학생', '방법': '면담', '분류': '학업', '내용': '작성 중'}
+    monkeypatch.setattr(worker.db, 'save_draft', _raise)
+    monkeypatch.setattr(worker.db, 'delete_draft', _raise)
+    monkeypatch.setattr(worker.db, 'get_drafts', _raise)
+
+    # 자동 저장은 오류 대화상자 없이 로그에만 남기고, 시작 시 복원 실패는 알림
+    worker.handle_request(1, 'save_draft', (None, draft))
+    worker.handle_request(2, 'delete_draft', (None,))
+    worker.handle_request(3, 'get_drafts', ())
+    assert replies == [('error', 3)]
+
+
+def test_encryption_errors_still_reply(worker, monkeypatch):
+    worker, replies = worker
+    statuses = []
+    worker.encryption_status.connect(lambda encrypted, unlocked: statuses.append((encrypted, unlocked)))
+    monkeypatch.setattr(worker.db, 'unlock', _raise)
+    monkeypatch.setattr(worker.db, 'enable_encryption', _raise)
+
+    # 로그인 후 암호화 상태 표시와 암호화 진행률 대화상자가 응답을 기다리지 않도록 함
+    worker.handle_request(1, 'unlock', ('암호',))
+    worker.handle_request(2, 'enable_encryption', ('암호',))
+    assert statuses == [(False, False)]
+    assert replies == [('error', 2)]
+
+
+def test_unlock_clears_student_cache(worker):
+    worker, replies = worker
+    worker.cache.put(1, {'id': 1, '이름': '홍길동', '메모': '(암호화됨)'}, [], False)
+    worker.handle_request(1, 'unlock', ('암호',))
+    assert worker.cache.get(1) is None
+
+
+def test_export_exception_still_replies(worker, monkeypatch, tmp_path):
+    worker, replies = worker
+
+    def locked(*args, **kwargs):
+        raise DatabaseLocked("암호화 키가 열리지 않았습니다.")
+
+    monkeypatch.setattr(worker.db, 'export_counseling_to_csv', locked)
+    monkeypatch.setattr(worker.db, 'export_form_students_csv', _raise)
+    # 진행률 대화상자가 닫히도록 예외가 나도 응답을 보냄
+    worker.handle_request(1, 'export_counseling_data', (str(tmp_path / 'out.csv'),))
+    worker.handle_request(2, 'export_form_students_csv', (str(tmp_path / 'form.csv'),))
+    assert replies == [('error', 1), ('error', 2)]
+
+
+def test_cancel_only_marks_unfinished_requests(worker, tmp_path):
+    worker, replies = worker
+    # 진행 콜백(취소 확인)이 호출되도록 기록을 하나 추가
+    worker.db.add_counsel_record(worker.db.add_student('홍길동'), {
+        '일시': '2025-04-01 10:00', '대상': '학생', '방법': '면담', '분류': '학업', '내용': '상담 내용'})
+    file_path = str(tmp_path / 'out.csv')
+    worker.handle_request(1, 'export_students_data', (file_path,))
+    # 이미 끝난 요청의 취소는 무시
+    worker.cancel_request(1)
+    assert worker._cancelled_ids == set()
+
+    # 처리 전에 취소한 요청은 취소되고, 처리 후에는 표시가 지워짐
+    worker.cancel_request(2)
+    worker.handle_request(2, 'export_counseling_data', (file_path,))
+    assert replies == [('success', 1), ('cancelled', 2)]
+    assert worker._cancelled_ids == set()
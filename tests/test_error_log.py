@@ -0,0 +1,18 @@
+"""Database 오류가 데이터베이스 파일 옆의 로그 파일에 기록되는지 확인하는 테스트"""
+
+from utils.database import Database
+from utils.query_trace import SLOW_LOG_NAME
+
+
+def test_export_error_is_logged_next_to_database(tmp_path, capsys):
+    db = Database(str(tmp_path / 'counseling.db'))
+    # 디렉터리 경로는 열 수 없으므로 내보내기가 실패함
+    assert db.export_counseling_to_csv(str(tmp_path)) is False
+    db.close_connection()
+
+    log = (tmp_path / SLOW_LOG_NAME).read_text(encoding='utf-8')
+    assert '상담 기록 CSV 내보내기 오류' in log
+    assert 'Traceback' in log
+    # 콘솔에는 추적 정보 없이 메시지만 출력
+    err = capsys.readouterr().err
+    assert '상담 기록 CSV 내보내기 오류' in err and 'Traceback' not in err
@@ -0,0 +1,54 @@
+"""CSV 내보내기 테스트"""
+
+import csv
+import os
+
+from utils.database import Database
+
+
+def _database(tmp_path):
+    db = Database(str(tmp_path / 'counseling.db'))
+    student_id = db.add_student('홍길동')
+    for day in range(1, 4):
+        db.add_counsel_record(student_id, {
+            '일시': f'2025-04-0{day} 10:00', '대상': '학생', '방법': '면담', '분류': '학업', '내용': '상담 내용',
+        })
+    return db
+
+
+def test_export_error_removes_partial_file(tmp_path):
+    db = _database(tmp_path)
+    file_path = str(tmp_path / 'export.csv')
+
+    def disk_full(done, total):
+        raise OSError(28, 'No space left on device')
+
+    assert db.export_counseling_to_csv(file_path, progress_callback=disk_full) is False
+    assert not os.path.exists(file_path)
+
+
+def test_export_cancel_removes_partial_file(tmp_path):
+    db = _database(tmp_path)
+    file_path = str(tmp_path / 'export.csv')
+    assert db.export_counseling_to_csv(file_path, progress_callback=lambda done, total: False) is False
+    assert not os.path.exists(file_path)
+
+
+def test_export_open_error_keeps_existing_file(tmp_path):
+    db = _database(tmp_path)
+    # 디렉터리 경로는 열 수 없으므로 내보내기가 실패하고 원래 있던 것은 그대로 남음
+    assert db.export_counseling_to_csv(str(tmp_path)) is False
+    assert os.path.isdir(tmp_path)
+
+
+def _read_csv(file_path):
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.reader(f))
+
+
+def test_neis_export_includes_end_date(tmp_path):
+    db = _database(tmp_path)
+    file_path = str(tmp_path / 'neis.csv')
+    # 상담 일시는 'yyyy-MM-dd HH:mm'이므로 종료일 당일 10:00 기록도 포함되어야 함
+    assert db.export_counseling_to_csv_for_neis(file_path, '2025-04-02', '2025-04-03') is True
+    assert [row[7] for row in _read_csv(file_path)[1:]] == ['20250402', '20250403']
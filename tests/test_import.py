@@ -0,0 +1,115 @@
+"""상담 기록 CSV 가져오기 테스트"""
+
+import csv
+
+import utils.database as database
+from utils.database import COUNSELING_CSV_COLUMNS, Database
+
+STUDENTS = ('홍길동', '김철수')
+RECORD_COUNT = 5
+
+
+def _database(db_file, records=True):
+    db = Database(str(db_file))
+    for name in STUDENTS:
+        student_id = db.add_student(name)
+        if not records:
+            continue
+        for day in range(1, RECORD_COUNT + 1):
+            db.add_counsel_record(student_id, {
+                '일시': f'2025-04-0{day} 10:00', '대상': '학생', '방법': '면담', '분류': '학업',
+                '내용': f'{name} 상담 내용 {day}\n둘째 줄, "따옴표"',
+            })
+    return db
+
+
+def _export(db, file_path):
+    assert db.export_counseling_to_csv(str(file_path))
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.reader(f))
+
+
+def _record_count(db):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM counseling_records").fetchone()[0]
+
+
+def test_reimport_exported_file_adds_nothing(tmp_path):
+    db = _database(tmp_path / 'counseling.db')
+    csv_path = tmp_path / 'export.csv'
+    _export(db, csv_path)
+
+    errors = []
+    summary = db.import_counseling_records(str(csv_path), errors=errors)
+    assert summary == {'valid': len(STUDENTS) * RECORD_COUNT, 'added': 0, 'invalid': 0}
+    assert errors == []
+    assert _record_count(db) == len(STUDENTS) * RECORD_COUNT
+
+
+def test_import_into_fresh_database(tmp_path):
+    source = _database(tmp_path / 'source.db')
+    csv_path = tmp_path / 'export.csv'
+    rows = _export(source, csv_path)
+
+    db = _database(tmp_path / 'counseling.db', records=False)
+    summary = db.import_counseling_records(str(csv_path))
+    assert summary == {'valid': len(STUDENTS) * RECORD_COUNT, 'added': len(STUDENTS) * RECORD_COUNT, 'invalid': 0}
+    # 여러 줄 내용과 생성일시까지 그대로 옮겨짐
+    assert _export(db, tmp_path / 'reexport.csv') == rows
+
+
+def test_import_dry_run_writes_nothing(tmp_path):
+    csv_path = tmp_path / 'export.csv'
+    _export(_database(tmp_path / 'source.db'), csv_path)
+
+    db = _database(tmp_path / 'counseling.db', records=False)
+    summary = db.import_counseling_records(str(csv_path), dry_run=True)
+    assert summary == {'valid': len(STUDENTS) * RECORD_COUNT, 'added': 0, 'invalid': 0}
+    assert _record_count(db) == 0
+
+
+def test_import_skips_unknown_students(tmp_path):
+    csv_path = tmp_path / 'import.csv'
+    with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(COUNSELING_CSV_COLUMNS)
+        writer.writerow(['홍길동', '2025-04-01 10:00', '학생', '면담', '학업', '상담 내용', ''])
+        writer.writerow(['없는학생', '2025-04-01 11:00', '학생', '면담', '학업', '상담 내용', ''])
+        writer.writerow(['김철수', '2025-04-01 12:00', '학생', '면담', '학업', '상담 내용', ''])
+
+    db = _database(tmp_path / 'counseling.db', records=False)
+    errors = []
+    summary = db.import_counseling_records(str(csv_path), errors=errors)
+    assert summary == {'valid': 2, 'added': 2, 'invalid': 1}
+    assert errors == ["3번째 행: 등록되지 않은 학생입니다: 없는학생"]
+
+
+def test_import_commits_each_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'IMPORT_BATCH_SIZE', 3)
+    csv_path = tmp_path / 'export.csv'
+    _export(_database(tmp_path / 'source.db'), csv_path)
+    db = _database(tmp_path / 'counseling.db', records=False)
+
+    # 첫 묶음을 커밋한 뒤 중단해도 그 묶음은 남음
+    assert db.import_counseling_records(str(csv_path), progress_callback=lambda done, total: False) is None
+    assert _record_count(db) == 3
+
+    # 다시 가져오면 남은 기록만 이어서 추가됨
+    progress = []
+    summary = db.import_counseling_records(str(csv_path), progress_callback=lambda *args: progress.append(args))
+    assert summary == {'valid': len(STUDENTS) * RECORD_COUNT, 'added': len(STUDENTS) * RECORD_COUNT - 3, 'invalid': 0}
+    assert _record_count(db) == len(STUDENTS) * RECORD_COUNT
+    # 묶음마다 진행 상황을 알리고, 마지막에 전체 크기로 끝남
+    assert len(progress) == len(STUDENTS) * RECORD_COUNT // 3 + 1
+    assert progress[-1][0] == progress[-1][1]
+
+
+def test_import_into_encrypted_database_skips_existing(tmp_path):
+    db = _database(tmp_path / 'counseling.db')
+    csv_path = tmp_path / 'export.csv'
+    rows = _export(db, csv_path)
+    assert db.enable_encryption('암호')
+
+    summary = db.import_counseling_records(str(csv_path))
+    assert summary == {'valid': len(STUDENTS) * RECORD_COUNT, 'added': 0, 'invalid': 0}
+    assert _export(db, tmp_path / 'reexport.csv') == rows
@@ -0,0 +1,90 @@
+"""스키마 마이그레이션 테스트"""
+
+import sqlite3
+
+from utils.migrations import LATEST_VERSION, _school_year_sql, get_schema_version, migrate
+
+
+def test_migrate_latest_schema_without_write_lock(tmp_path):
+    db_file = str(tmp_path / 'counseling.db')
+    conn = sqlite3.connect(db_file)
+    assert migrate(conn) == LATEST_VERSION
+
+    # 다른 연결이 쓰기 잠금을 잡고 있어도 이미 최신이면 기다리지 않고 반환
+    writer = sqlite3.connect(db_file)
+    writer.execute("BEGIN IMMEDIATE")
+    reader = sqlite3.connect(db_file, timeout=0)
+    try:
+        assert migrate(reader) == LATEST_VERSION
+    finally:
+        writer.rollback()
+        for c in (conn, writer, reader):
+            c.close()
+
+
+def test_migrate_applies_pending_versions(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'counseling.db'))
+    migrate(conn)
+    conn.execute("DROP TABLE counsel_drafts")
+    conn.execute(f"PRAGMA user_version = {LATEST_VERSION - 1}")
+    assert migrate(conn) == LATEST_VERSION
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM counsel_drafts").fetchone() == (0,)
+    conn.close()
+
+
+def _stats_from_records(conn):
+    """counseling_records를 직접 GROUP BY 한 결과 (counseling_stats와 같은 형태)"""
+    return conn.execute(f'''
+        SELECT {_school_year_sql('counsel_date')}, substr(counsel_date, 1, 7),
+               COALESCE(target, ''), COALESCE(method, ''), COALESCE(category, ''), COUNT(*)
+        FROM counseling_records
+        GROUP BY 1, 2, 3, 4, 5
+        ORDER BY 1, 2, 3, 4, 5
+    ''').fetchall()
+
+
+def _stats(conn):
+    return conn.execute('''
+        SELECT school_year, month, target, method, category, count
+        FROM counseling_stats
+        ORDER BY 1, 2, 3, 4, 5
+    ''').fetchall()
+
+
+def test_counseling_stats_triggers_follow_records(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'counseling.db'))
+    migrate(conn)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executemany("INSERT INTO students (name) VALUES (?)", [('홍길동',), ('김철수',)])
+    hong, kim = (row[0] for row in conn.execute("SELECT id FROM students ORDER BY id"))
+
+    # 삽입 (2월은 전 학년도로 집계)
+    insert = '''INSERT INTO counseling_records (student_id, counsel_date, target, method, category, content)
+                VALUES (?, ?, ?, ?, ?, ?)'''
+    conn.executemany(insert, [
+        (hong, '2025-02-28 10:00', '학생', '면담', '학업', '내용 1'),
+        (hong, '2025-03-02 10:00', '학생', '면담', '학업', '내용 2'),
+        (hong, '2025-03-05 10:00', '학부모', '전화', '학업', '내용 3'),
+        (kim, '2025-03-05 11:00', '학생', '면담', '학업', '내용 4'),
+        (kim, '2025-04-01 09:00', '학생', '메신저', '진로', '내용 5'),
+    ])
+    assert _stats(conn) == _stats_from_records(conn)
+
+    # 일시(학년도와 월이 바뀜), 대상, 분류 수정
+    conn.execute("UPDATE counseling_records SET counsel_date = '2025-03-10 10:00' WHERE content = '내용 1'")
+    conn.execute("UPDATE counseling_records SET target = '교사' WHERE content = '내용 2'")
+    conn.execute("UPDATE counseling_records SET category = '생활' WHERE content = '내용 3'")
+    # 집계 열이 아닌 내용만 바꾸면 건수는 그대로
+    conn.execute("UPDATE counseling_records SET content = '내용 4 수정' WHERE content = '내용 4'")
+    assert _stats(conn) == _stats_from_records(conn)
+
+    # 기록 삭제
+    conn.execute("DELETE FROM counseling_records WHERE content = '내용 5'")
+    assert _stats(conn) == _stats_from_records(conn)
+
+    # 학생 삭제 시 기록이 함께 삭제되고 건수가 0이 된 행도 남지 않음
+    conn.execute("DELETE FROM students WHERE id = ?", (hong,))
+    assert conn.execute("SELECT COUNT(*) FROM counseling_records").fetchone() == (1,)
+    assert _stats(conn) == _stats_from_records(conn) == [(2025, '2025-03', '학생', '면담', '학업', 1)]
+    conn.close()
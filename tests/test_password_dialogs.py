@@ -0,0 +1,48 @@
+"""암호 다이얼로그가 해시 계산을 GUI 스레드 밖에서 실행하는지 확인하는 테스트"""
+
+import threading
+
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QDialog
+
+from ui.dialogs import CreatePasswordDialog
+from utils.config_manager import Settings, check_password, set_password
+
+SAVE_TIMEOUT_MS = 5000
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    # 공용 Settings 대신 임시 settings.ini 사용
+    settings = Settings(str(tmp_path / 'settings.ini'))
+    monkeypatch.setattr(Settings, '_instance', settings)
+    yield settings
+    settings.flush()
+
+
+def test_create_password_saves_off_gui_thread(qapp, settings):
+    gui_thread = threading.get_ident()
+    save_threads = []
+
+    def save(password):
+        save_threads.append(threading.get_ident())
+        return set_password(password)
+
+    dialog = CreatePasswordDialog(save=save)
+    dialog.password_edit.setText('1234')
+    dialog.confirm_edit.setText('1234')
+    loop = QEventLoop()
+    dialog.finished.connect(loop.quit)
+    QTimer.singleShot(SAVE_TIMEOUT_MS, loop.quit)
+
+    dialog.accept()
+    # 저장하는 동안 버튼이 비활성화되고 다이얼로그는 닫히지 않음
+    assert not dialog.buttons.isEnabled()
+    dialog.reject()
+    loop.exec()
+
+    assert dialog.result() == QDialog.Accepted
+    assert dialog.buttons.isEnabled()
+    assert len(save_threads) == 1 and save_threads[0] != gui_thread
+    assert check_password('1234')
@@ -0,0 +1,20 @@
+"""암호 대화상자 전에 가져오는 모듈이 무거운 모듈을 끌어오지 않는지 확인하는 테스트"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main.py가 암호 확인 전에 가져오는 모듈
+PRE_LOGIN_IMPORTS = 'import utils.config_manager, ui.dialogs'
+
+# 메인 창이나 진단 정보를 열 때만 필요한 모듈
+DEFERRED_MODULES = ['utils.query_trace', 'utils.database', 'ui.diagnostics', 'ui.main_window']
+
+
+def test_password_dialog_imports_stay_minimal():
+    code = f"import sys; {PRE_LOGIN_IMPORTS}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
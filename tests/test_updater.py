@@ -0,0 +1,121 @@
+"""업데이트 확인 테스트
+
+GitHub API 대신 127.0.0.1에 띄운 http.server의 주소를 api_url로 넘겨 확인합니다.
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.config_manager import Settings, UPDATE_SECTION, get_update_cache, set_update_cache
+from utils.updater import UpdateChecker, is_newer_version
+
+ETAG = '"release-9.0"'
+NOTES = '- 새 기능\n- 버그 수정'
+
+
+class ReleaseHandler(BaseHTTPRequestHandler):
+    """최신 릴리스 하나를 ETag와 함께 돌려주고, If-None-Match가 같으면 304를 돌려줍니다."""
+
+    def do_GET(self):
+        self.server.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({'tag_name': 'v9.0', 'body': NOTES}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    # 공용 Settings 대신 임시 settings.ini 사용
+    settings = Settings(str(tmp_path / 'settings.ini'))
+    monkeypatch.setattr(Settings, '_instance', settings)
+    yield settings
+    settings.flush()
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ReleaseHandler)
+    server.requests = []  # 요청마다 받은 If-None-Match 값
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _checker(url):
+    checker = UpdateChecker('owner', 'repo', api_url=url)
+    results = {'update': [], 'error': []}
+    checker.update_available.connect(lambda version, notes: results['update'].append((version, notes)))
+    checker.error_occurred.connect(results['error'].append)
+    return checker, results
+
+
+def test_update_check_caches_and_revalidates(qapp, settings, server):
+    checker, results = _checker(f'http://127.0.0.1:{server.server_port}/releases/latest')
+
+    # 처음 확인: 200 응답과 ETag 저장
+    checker.check_for_updates()
+    assert server.requests == [None]
+    assert results['update'] == [('9.0', NOTES)]
+    cache = get_update_cache()
+    assert cache['etag'] == ETAG and cache['latest_version'] == '9.0' and cache['notes'] == NOTES
+
+    # 주기 안에서는 요청하지 않고 저장된 결과 사용
+    checker.check_for_updates()
+    assert server.requests == [None]
+    assert results['update'][-1] == ('9.0', NOTES)
+
+    # 주기가 지나면 If-None-Match로 다시 확인하고, 304이면 저장된 버전과 내용 사용
+    set_update_cache(0)
+    checker.check_for_updates()
+    assert server.requests == [None, ETAG]
+    assert results['update'] == [('9.0', NOTES)] * 3
+    assert get_update_cache()['last_checked'] > 0
+    assert results['error'] == []
+
+
+def test_update_check_connection_refused(qapp, settings):
+    # 사용하지 않는 포트를 잡았다가 닫아 연결이 거부되도록 함
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    checker, results = _checker(f'http://127.0.0.1:{port}/releases/latest')
+
+    checker.check_for_updates()
+    assert results['update'] == []
+    assert len(results['error']) == 1
+
+
+def test_update_check_ignores_malformed_cache(qapp, settings, server):
+    settings.set(UPDATE_SECTION, 'latest_version', '9.0')
+    settings.set(UPDATE_SECTION, 'last_checked', 'not a number')
+    settings.set(UPDATE_SECTION, 'notes', '{broken')
+    checker, results = _checker(f'http://127.0.0.1:{server.server_port}/releases/latest')
+
+    checker.check_for_updates()
+    assert server.requests == [None]
+    assert results['update'] == [('9.0', NOTES)]
+    assert results['error'] == []
+
+
+def test_is_newer_version():
+    assert is_newer_version('1.10', '1.9')
+    assert is_newer_version('v1.4.1', '1.4')
+    assert not is_newer_version('1.4.0', '1.4')
+    assert not is_newer_version('1.9', '1.10')
@@ -0,0 +1,49 @@
+"""
+아이템 델리게이트 모듈
+목록 항목을 직접 그리는 델리게이트 클래스를 포함합니다.
+"""
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from ui.models import CounselRecordModel
+from utils import tracing
+
+
+class CounselRecordDelegate(QStyledItemDelegate):
+    """상담 기록 요약을 '일시/대상/방법/분류' 줄과 미리보기 줄, 두 줄로 그리는 델리게이트
+
+    항목 높이가 고정되어 있어 보이는 항목만 배치하고 그립니다.
+    """
+
+    PADDING = 6
+
+    @tracing.traced(cat=tracing.RENDER_CAT)
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ''
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        # 배경과 선택 표시는 스타일에 맡김
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        rect = opt.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        metrics = opt.fontMetrics
+        selected = bool(opt.state & QStyle.State_Selected)
+        text_role = QPalette.HighlightedText if selected else QPalette.Text
+        preview_role = QPalette.HighlightedText if selected else QPalette.PlaceholderText
+
+        header = metrics.elidedText(index.data(CounselRecordModel.HEADER_ROLE) or '', Qt.ElideRight, rect.width())
+        preview = metrics.elidedText(index.data(CounselRecordModel.PREVIEW_ROLE) or '', Qt.ElideRight, rect.width())
+
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(text_role))
+        painter.drawText(rect.left(), rect.top() + metrics.ascent(), header)
+        painter.setPen(opt.palette.color(preview_role))
+        painter.drawText(rect.left(), rect.top() + metrics.height() + metrics.ascent(), preview)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), option.fontMetrics.height() * 2 + self.PADDING * 2)
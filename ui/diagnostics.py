@@ -0,0 +1,139 @@
+"""
+진단 정보 다이얼로그 모듈
+SQL 실행 시간과 학생 정보 캐시 적중률을 보여 주고 동작 추적을 시작/저장하는 다이얼로그를 포함합니다.
+(설정 탭에서 처음 열 때 가져오므로 암호 대화상자 전에는 가져오지 않습니다.)
+"""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QDialogButtonBox, QMessageBox, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog
+)
+from PySide6.QtCore import Qt
+from utils.query_trace import HISTOGRAM_BOUNDS_MS
+from utils import tracing
+
+
+class DiagnosticsDialog(QDialog):
+    """진단 정보 다이얼로그
+
+    프로그램을 실행한 뒤 시간이 많이 걸린 SQL 문장과 횟수, 학생 정보 캐시 적중률,
+    느린 문장 로그 파일 위치를 보여 줍니다. 문제를 알려 올 때 이 화면과 로그 파일을 함께 받습니다.
+    동작 추적을 시작하면 창을 닫아도 계속 기록되며, 다시 열어 Chrome trace 파일로 저장합니다.
+    """
+
+    COLUMNS = ['문장', '횟수', '평균(ms)', '최대(ms)', '합계(ms)']
+
+    def __init__(self, db_client, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('진단 정보')
+        self.resize(800, 500)
+        self.db_client = db_client
+        self.request_id = 0
+
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel('')
+        self.status_label.setProperty("class", "caption")
+        self.status_label.setWordWrap(True)
+        self.status_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.status_label)
+
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Close, self)
+        refresh_btn = QPushButton('새로 고침')
+        refresh_btn.clicked.connect(self.refresh)
+        reset_btn = QPushButton('기록 초기화')
+        reset_btn.clicked.connect(lambda: self.refresh(True))
+        self.buttons.addButton(refresh_btn, QDialogButtonBox.ActionRole)
+        self.buttons.addButton(reset_btn, QDialogButtonBox.ResetRole)
+        self.trace_btn = QPushButton()
+        self.trace_btn.clicked.connect(self.toggle_tracing)
+        self.buttons.addButton(self.trace_btn, QDialogButtonBox.ActionRole)
+        self.show_tracing_status()
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+
+        db_client.worker.diagnostics_ready.connect(self.show_diagnostics)
+        self.refresh()
+
+    def refresh(self, reset=False):
+        self.request_id = self.db_client.request('get_diagnostics', reset)
+
+    @tracing.traced_reply
+    def show_diagnostics(self, request_id, diagnostics):
+        if request_id != self.request_id:
+            return
+        queries = diagnostics['queries']
+        statements = queries['statements']
+        self.table.setRowCount(len(statements))
+        for row, stat in enumerate(statements):
+            values = [stat['statement'], f"{stat['count']:,}", f"{stat['mean_ms']:.2f}",
+                      f"{stat['max_ms']:.1f}", f"{stat['total_ms']:,.1f}"]
+            tooltip = self.histogram_text(stat['histogram'])
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                item.setToolTip(stat['statement'] + '\n\n' + tooltip if column == 0 else tooltip)
+                self.table.setItem(row, column, item)
+
+        cache = diagnostics['cache']
+        lookups = cache['hits'] + cache['misses']
+        hit_rate = f" ({cache['hits'] / lookups:.0%})" if lookups else ''
+        self.status_label.setText(
+            f"학생 정보 캐시: 적중 {cache['hits']:,}회, 실패 {cache['misses']:,}회{hit_rate}\n"
+            f"SQL 오류: {queries['errors']:,}건\n"
+            f"{queries['slow_ms']}ms 이상 걸린 문장과 오류 기록: {queries['log_file'] or '없음'}"
+        )
+
+    def show_tracing_status(self):
+        self.trace_btn.setText('동작 추적 저장...' if tracing.enabled else '동작 추적 시작')
+
+    def toggle_tracing(self):
+        # 추적을 시작하거나, 추적 중이면 멈추고 파일로 저장 (저장을 취소하면 계속 추적)
+        if not tracing.enabled:
+            tracing.enable()
+            QMessageBox.information(
+                self, '동작 추적', '동작 추적을 시작했습니다.\n느린 동작을 재현한 뒤 이 화면에서 저장하세요.'
+            )
+        else:
+            file_path, _ = QFileDialog.getSaveFileName(self, '동작 추적 저장', 'trace.json', 'JSON 파일 (*.json)')
+            if not file_path:
+                return
+            tracing.disable()
+            try:
+                count = tracing.export_chrome_trace(file_path)
+            except OSError as e:
+                QMessageBox.critical(self, '오류', f"동작 추적 저장 실패: {e}")
+            else:
+                QMessageBox.information(
+                    self, '동작 추적', f"이벤트 {count:,}개를 저장했습니다.\nchrome://tracing 또는 ui.perfetto.dev에서 열 수 있습니다."
+                )
+        self.show_tracing_status()
+
+    @staticmethod
+    def histogram_text(histogram):
+        # 실행 시간 구간별 횟수 (예: "1ms 미만: 120회")
+        lines = []
+        lower = None
+        for bound, count in zip(HISTOGRAM_BOUNDS_MS + (None,), histogram):
+            if bound is None:
+                label = f"{lower}ms 이상"
+            elif lower is None:
+                label = f"{bound}ms 미만"
+            else:
+                label = f"{lower}~{bound}ms"
+            lower = bound
+            if count:
+                lines.append(f"{label}: {count:,}회")
+        return '\n'.join(lines)
+
+    def done(self, result):
+        self.db_client.worker.diagnostics_ready.disconnect(self.show_diagnostics)
+        super().done(result)
@@ -7,10 +7,25 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QDialogButtonBox,
     QLineEdit, QComboBox, QDateTimeEdit, QTextEdit, QMessageBox
 )
-from PySide6.QtCore import QDateTime
+from PySide6.QtCore import QDateTime, QObject, QThread, Signal, Slot, Qt
 from utils.config_manager import TARGET, METHOD, CATEGORY
 
 
+class PasswordVerifier(QObject):
+    """암호 확인 스레드에서 암호를 확인하는 워커 (해시 계산 중에도 화면이 멈추지 않도록 함)"""
+
+    finished = Signal(bool)
+
+    def __init__(self, verify, password):
+        super().__init__()
+        self.verify = verify
+        self.password = password
+
+    @Slot()
+    def run(self):
+        self.finished.emit(bool(self.verify(self.password)))
+
+
 class PasswordDialogBase(QDialog):
     """암호 다이얼로그의 기본 클래스"""
     def __init__(self, parent=None):
@@ -25,11 +40,49 @@ class PasswordDialogBase(QDialog):
         self.layout.addLayout(self.form_layout)
         self.layout.addWidget(self.buttons)
 
+        self.verify_thread = None
+        self.verifier = None
+
+    def verify_in_background(self, verify, password):
+        # 암호 확인 스레드에서 verify(password)를 실행하고, 끝나면 handle_verified를 호출
+        self.buttons.setEnabled(False)
+        self.setCursor(Qt.WaitCursor)
+        self.verify_thread = QThread(self)
+        self.verifier = PasswordVerifier(verify, password)
+        self.verifier.moveToThread(self.verify_thread)
+        self.verify_thread.started.connect(self.verifier.run)
+        self.verifier.finished.connect(self.verify_thread.quit)
+        self.verifier.finished.connect(self.finish_verification)
+        self.verify_thread.start()
+
+    def finish_verification(self, ok):
+        self.verify_thread.wait()
+        self.verify_thread.deleteLater()
+        self.verify_thread = None
+        self.verifier = None
+        self.buttons.setEnabled(True)
+        self.unsetCursor()
+        self.handle_verified(ok)
+
+    def handle_verified(self, ok):
+        # 하위 클래스에서 확인 결과를 처리
+        pass
+
+    def reject(self):
+        # 확인 중에는 닫지 않음 (Esc 키 포함)
+        if self.verify_thread is None:
+            super().reject()
+
 class CreatePasswordDialog(PasswordDialogBase):
-    """새 암호 생성 다이얼로그"""
-    def __init__(self, parent=None):
+    """새 암호 생성 다이얼로그
+
+    save가 주어지면 확인 버튼을 눌렀을 때 암호 확인 스레드에서 save(암호)를 실행하고
+    (해시 계산 중에도 화면이 멈추지 않도록 함), 저장에 성공했을 때만 닫힙니다.
+    """
+    def __init__(self, parent=None, save=None):
         super().__init__(parent)
         self.setWindowTitle('새 암호 생성')
+        self.save = save
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
         self.confirm_edit = QLineEdit()
@@ -43,32 +96,64 @@ class CreatePasswordDialog(PasswordDialogBase):
             if len(self.password_edit.text()) < 4:
                 QMessageBox.warning(self, '오류', '암호는 4자 이상이어야 합니다.')
                 return
-            super().accept()
+            if self.save is None:
+                super().accept()
+            else:
+                self.verify_in_background(self.save, self.password_edit.text())
         else:
             QMessageBox.warning(self, '오류', '암호가 일치하지 않습니다.')
 
+    def handle_verified(self, ok):
+        if ok:
+            super().accept()
+        else:
+            QMessageBox.warning(self, '오류', '암호를 저장하지 못했습니다.')
+
     def get_password(self):
         return self.password_edit.text()
 
 
 class PasswordDialog(PasswordDialogBase):
-    """암호 입력 다이얼로그"""
-    def __init__(self, parent=None):
+    """암호 입력 다이얼로그
+
+    verify가 주어지면 확인 버튼을 눌렀을 때 암호 확인 스레드에서 verify(암호)를 실행하고,
+    암호가 맞을 때만 닫힙니다. (틀리면 경고 후 다시 입력)
+    """
+    def __init__(self, parent=None, verify=None):
         super().__init__(parent)
         self.setWindowTitle('암호 입력')
+        self.verify = verify
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
         self.form_layout.addRow('암호:', self.password_edit)
 
+    def accept(self):
+        if self.verify is None:
+            super().accept()
+        else:
+            self.verify_in_background(self.verify, self.password_edit.text())
+
+    def handle_verified(self, ok):
+        if ok:
+            super().accept()
+        else:
+            QMessageBox.warning(self, '오류', '암호가 올바르지 않습니다.')
+            self.password_edit.clear()
+            self.password_edit.setFocus()
+
     def get_password(self):
         return self.password_edit.text()
 
 
 class ChangePasswordDialog(PasswordDialogBase):
-    """암호 변경 다이얼로그"""
-    def __init__(self, parent=None):
+    """암호 변경 다이얼로그
+
+    verify가 주어지면 기존 암호를 암호 확인 스레드에서 확인한 뒤에만 닫힙니다.
+    """
+    def __init__(self, parent=None, verify=None):
         super().__init__(parent)
         self.setWindowTitle('암호 변경')
+        self.verify = verify
         self.old_password_edit = QLineEdit()
         self.old_password_edit.setEchoMode(QLineEdit.Password)
         self.new_password_edit = QLineEdit()
@@ -85,10 +170,20 @@ class ChangePasswordDialog(PasswordDialogBase):
             if len(self.new_password_edit.text()) < 4:
                 QMessageBox.warning(self, '오류', '새 암호는 4자 이상이어야 합니다.')
                 return
-            super().accept()
+            if self.verify is None:
+                super().accept()
+            else:
+                self.verify_in_background(self.verify, self.old_password_edit.text())
         else:
             QMessageBox.warning(self, '오류', '새 암호가 일치하지 않습니다.')
 
+    def handle_verified(self, ok):
+        if ok:
+            super().accept()
+        else:
+            QMessageBox.warning(self, '오류', '기존 암호가 올바르지 않습니다.')
+            self.old_password_edit.setFocus()
+
     def get_passwords(self):
         return (
             self.old_password_edit.text(),
@@ -141,6 +236,21 @@ class EditCounselDialog(QDialog):
         layout.addLayout(form_layout)
         layout.addWidget(self.buttons)
 
+    def restore_draft(self, draft):
+        # 저장하지 않고 남은 수정 내용으로 입력 값을 바꿈
+        date_time = QDateTime.fromString(draft['일시'] or '', "yyyy-MM-dd HH:mm")
+        if date_time.isValid():
+            self.datetime_edit.setDateTime(date_time)
+        self.target_combo.setCurrentText(draft['대상'])
+        self.method_combo.setCurrentText(draft['방법'])
+        self.category_combo.setCurrentText(draft['분류'])
+        self.counsel_input.setPlainText(draft['내용'])
+        self.setWindowTitle(f"상담기록 수정 (임시 저장 {draft['저장일시']} 복원)")
+
+    def get_draft(self):
+        # 임시 저장할 입력 값 (내용의 앞뒤 공백도 그대로 저장)
+        return dict(self.get_data(), 학생='', 내용=self.counsel_input.toPlainText())
+
     def get_data(self):
         return {
             '일시': self.datetime_edit.dateTime().toString("yyyy-MM-dd HH:mm"),
@@ -148,4 +258,4 @@ class EditCounselDialog(QDialog):
             '방법': self.method_combo.currentText(),
             '분류': self.category_combo.currentText(),
             '내용': self.counsel_input.toPlainText().strip()
-        } 
\ No newline at end of file
+        } 
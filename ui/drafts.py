@@ -0,0 +1,90 @@
+"""
+임시 저장 모듈
+작성 중인 상담 내용을 자동으로 임시 저장하는 클래스를 포함합니다.
+"""
+
+import time
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QComboBox, QDateTimeEdit, QTextEdit
+
+# 입력이 멈춘 뒤 임시 저장까지 기다리는 시간(ms)
+DRAFT_SAVE_DELAY_MS = 1000
+
+# 쉬지 않고 입력해도 이 시간(초)이 지나면 한 번 저장
+DRAFT_MAX_DELAY = 10
+
+
+class DraftAutosaver(QObject):
+    """작성 중인 상담 내용을 워커 스레드를 통해 counsel_drafts 테이블에 임시 저장하는 클래스
+
+    입력이 DRAFT_SAVE_DELAY_MS 동안 멈추면 연속된 입력을 모아 한 번 저장하고,
+    마지막으로 저장한 내용과 같으면 요청하지 않습니다. 내용을 모두 지우면 임시 저장도 지웁니다.
+    저장은 워커 스레드에서 실행되므로 입력 중에 디스크 쓰기를 기다리지 않습니다.
+    collect()는 '학생', '일시', '대상', '방법', '분류', '내용' 키를 가진 현재 입력 값을 반환합니다.
+    """
+
+    def __init__(self, db_client, collect, record_id=None, parent=None):
+        super().__init__(parent)
+        self.db_client = db_client
+        self.collect = collect
+        self.record_id = record_id # None이면 상담 기록 탭의 새 기록
+        self._saved = None         # 마지막으로 저장 요청한 값 (저장된 것이 없으면 None)
+        self._first_change = None  # 저장하지 않은 첫 변경 시각
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DRAFT_SAVE_DELAY_MS)
+        self.timer.timeout.connect(self.save)
+
+    def watch(self, *widgets):
+        """위젯의 값이 바뀔 때마다 임시 저장을 예약합니다."""
+        for widget in widgets:
+            if isinstance(widget, QTextEdit):
+                widget.textChanged.connect(self.schedule)
+            elif isinstance(widget, QComboBox):
+                widget.currentTextChanged.connect(self.schedule)
+            elif isinstance(widget, QDateTimeEdit):
+                widget.dateTimeChanged.connect(self.schedule)
+
+    def schedule(self, *args):
+        # 저장 타이머 재시작 (오래 쉬지 않고 입력하면 바로 저장)
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        if now - self._first_change >= DRAFT_MAX_DELAY:
+            self.save()
+        else:
+            self.timer.start()
+
+    def mark_saved(self, draft):
+        """draft가 이미 저장되어 있음을 표시합니다. (복원한 임시 저장을 다시 쓰지 않도록)"""
+        self._saved = draft
+
+    def save(self):
+        """바뀐 내용이 있으면 바로 임시 저장을 요청합니다."""
+        self.timer.stop()
+        self._first_change = None
+        draft = self.collect()
+        if not draft['내용'].strip():
+            if self._saved is not None:
+                self.discard()
+            return
+        if draft != self._saved:
+            self._saved = draft
+            self.db_client.request('save_draft', self.record_id, draft)
+
+    def flush(self):
+        """예약된 저장이 있으면 바로 요청합니다. (프로그램 종료 전)"""
+        if self.timer.isActive():
+            self.save()
+
+    def stop(self):
+        """예약된 저장을 취소합니다. (입력한 내용을 저장하여 임시 저장이 필요 없을 때)"""
+        self.timer.stop()
+        self._first_change = None
+        self._saved = None
+
+    def discard(self):
+        """예약된 저장을 취소하고 임시 저장을 지웁니다."""
+        self.stop()
+        self.db_client.request('delete_draft', self.record_id)
@@ -1,27 +1,46 @@
 # 메인 윈도우 모듈
 from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QTextEdit, QPushButton, QInputDialog, QMessageBox, QLabel,
-    QComboBox, QDateTimeEdit, QLineEdit, QFormLayout, QListWidgetItem,
-    QFileDialog, QPlainTextEdit, QDateEdit, QGroupBox
+    QListWidget, QListWidgetItem, QListView, QTextEdit, QPushButton, QInputDialog, QMessageBox, QLabel,
+    QComboBox, QDateTimeEdit, QLineEdit, QFormLayout,
+    QFileDialog, QPlainTextEdit, QDateEdit, QGroupBox, QProgressDialog, QCompleter, QSpinBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
 )
-import webbrowser
-from PySide6.QtCore import QDateTime, Qt, QSize, QThread, Signal
+import os
+from PySide6.QtCore import QDateTime, Qt, QSize, QThread, QTimer
 
 from ui.dialogs import (
-    ChangePasswordDialog, EditCounselDialog
+    ChangePasswordDialog, PasswordDialog, EditCounselDialog
+)
+from ui.models import StudentListModel, CounselRecordModel
+from ui.drafts import DraftAutosaver
+from ui.delegates import CounselRecordDelegate
+from utils.config_manager import (
+    check_password, get_font_size, set_font_size, get_backup_settings, set_backup_settings,
+    CATEGORY, TARGET, METHOD, GENDER
 )
-from utils.config_manager import check_password, set_password, get_font_size, set_font_size, CATEGORY, TARGET, METHOD, GENDER
 from utils.updater import CURRENT_VERSION, UpdateChecker
 from utils.theme_manager import ThemeManager
-from utils.database_worker import DatabaseWorker
-from utils.license import LICENSE
+from utils.database_worker import DatabaseClient
+from utils.database import default_db_file
+from utils.backup import BackupService, list_backups
+from utils.encryption import is_available as encryption_available
+from utils import tracing
+
+
+# 검색어 입력이 멈춘 뒤 검색을 시작할 때까지의 대기 시간(ms)
+SEARCH_DEBOUNCE_MS = 300
+
+# 상담 통계 탭의 집계 기준 (표시 이름, Database.get_statistics의 group_by)
+STATISTICS_GROUPS = [('분류', 'category'), ('방법', 'method'), ('대상', 'target'), ('월', 'month')]
+
+# 메인 창이 뜬 뒤 업데이트 확인을 시작할 때까지의 대기 시간(ms)
+UPDATE_CHECK_DELAY_MS = 3000
 
 
 class MainApp(QMainWindow):
-    update_student_data_signal = Signal(int, dict)
     #메인 애플리케이션 윈도우 클래스
-    def __init__(self, theme_manager: ThemeManager):
+    def __init__(self, theme_manager: ThemeManager, password=None):
         super().__init__()
         self.setWindowTitle('마음나래 Lite')
         self.setGeometry(100, 100, 900, 800)
@@ -29,21 +48,52 @@ class MainApp(QMainWindow):
 
         self.theme_manager = theme_manager
 
-        # 데이터베이스 설정 (워커 스레드로 이동)
-        self.db_thread = QThread()
-        self.db_worker = DatabaseWorker()
-        self.db_worker.moveToThread(self.db_thread)
+        # 데이터베이스 설정 (요청은 상주하는 워커 스레드에서 처리)
+        self.db_client = DatabaseClient(self)
+        self.db_worker = self.db_client.worker
+        self.student_request_id = 0 # 가장 최근의 학생 정보 조회 요청 ID
+        self.edit_record_request_id = 0 # 수정할 상담 기록 조회 요청 ID
+        self.detail_record_request_id = 0 # 선택한 상담 기록의 전체 내용 조회 요청 ID
+        self.progress_dialog = None # 진행 중인 내보내기의 진행률 대화상자
+        self.progress_request_id = 0
 
         # DatabaseWorker 시그널 연결
         self.db_worker.students_ready.connect(self.handle_students_ready)
         self.db_worker.student_info_ready.connect(self.handle_student_info_ready)
-        self.db_worker.student_data_for_update_ready.connect(self.handle_student_data_for_update)
         self.db_worker.counsel_records_ready.connect(self.handle_counsel_records_ready)
         self.db_worker.counsel_record_ready.connect(self.handle_counsel_record_ready)
+        self.db_worker.search_results_ready.connect(self.handle_search_results_ready)
+        self.db_worker.statistics_ready.connect(self.handle_statistics_ready)
+        self.db_worker.import_failed.connect(self.handle_import_failed)
         self.db_worker.operation_success.connect(self.handle_db_operation_success)
         self.db_worker.operation_error.connect(self.handle_db_operation_error)
-        self.update_student_data_signal.connect(self.db_worker.update_student)
-        self.db_worker.import_students_data_ready.connect(self.db_worker.import_students_data)
+        self.db_worker.operation_cancelled.connect(self.handle_db_operation_cancelled)
+        self.db_worker.progress_changed.connect(self.handle_progress_changed)
+        self.db_worker.encryption_status.connect(self.handle_encryption_status)
+        self.db_encrypted = False
+        self.db_unlocked = True
+        self.encryption_status_label = None # 설정 탭을 처음 열 때 생성
+
+        # 자동 백업 (전용 스레드에서 실행)
+        db_file = default_db_file()
+        self.backup_service = BackupService(db_file, os.path.join(os.path.dirname(db_file), 'backups'), self)
+        self.backup_service.worker.finished.connect(self.handle_backup_finished)
+        self.backup_service.worker.failed.connect(self.handle_backup_failed)
+        self.manual_backup_pending = False
+        self.backup_status_label = None # 설정 탭을 처음 열 때 생성
+        self.backup_service.start(*get_backup_settings())
+
+        # 학생 목록 뷰와 이름 콤보박스가 함께 사용하는 모델
+        self.student_model = StudentListModel(self)
+        self.db_worker.student_inserted.connect(self.student_model.insert_student)
+        self.db_worker.student_removed.connect(self.student_model.remove_student)
+        self.db_worker.student_renamed.connect(self.student_model.rename_student)
+        # 선택한 학생의 상담 기록 요약 (페이지 단위로 불러옴)
+        self.counsel_model = CounselRecordModel(self.db_client, self)
+        self.db_client.start()
+        # 암호화된 데이터베이스이면 다른 요청보다 먼저 로그인 암호로 데이터 키를 엶
+        if password is not None:
+            self.db_client.request('unlock', password)
 
         #탭 UI 구현
         self.tabs = QTabWidget()
@@ -52,11 +102,23 @@ class MainApp(QMainWindow):
         self.tabs.addTab(self.student_tab, '학생 정보')
         self.counsel_tab = QWidget()
         self.tabs.addTab(self.counsel_tab, '상담 기록')
+        self.search_tab = QWidget()
+        self.tabs.addTab(self.search_tab, '상담 검색')
+        self.stats_tab = QWidget()
+        self.tabs.addTab(self.stats_tab, '상담 통계')
         self.credit_tab = QWidget()
         self.tabs.addTab(self.credit_tab, '프로그램 정보 및 설정')
         self.init_student_tab()
         self.init_counsel_tab()
-        self.init_credit_tab()
+        self.init_search_tab()
+        self.init_stats_tab()
+        # 지난 실행에서 저장하지 못한 상담 내용 복원 (암호화된 데이터베이스는 데이터 키를 연 뒤 조회됨)
+        self.record_drafts = {} # 상담 기록 id -> 수정 화면을 열 때 복원할 임시 저장
+        self.db_worker.drafts_ready.connect(self.restore_drafts)
+        self.db_client.request('get_drafts')
+        # 프로그램 정보 및 설정 탭은 처음 열 때 구성
+        self.credit_tab_ready = False
+        self.tabs.currentChanged.connect(self.handle_tab_changed)
 
         # 업데이트 확인 스레드 설정
         self.update_thread = QThread()
@@ -68,16 +130,34 @@ class MainApp(QMainWindow):
         self.update_checker.update_available.connect(self.show_update_dialog)
         self.update_checker.error_occurred.connect(self.show_update_error)
         
-        # 스레드 시작
-        self.update_thread.start()
+        # 창이 뜬 뒤 잠시 후 확인 시작 (시작 시간에 포함되지 않도록, 그 전에 창을 닫으면 closeEvent에서 취소)
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(UPDATE_CHECK_DELAY_MS)
+        self.update_timer.timeout.connect(self.update_thread.start)
+        self.update_timer.start()
+
+    @tracing.user_action('open_tab')
+    def handle_tab_changed(self, index):
+        # 상담 통계 탭은 열 때마다 다시 집계 (요약 테이블만 읽으므로 빠름)
+        if self.tabs.widget(index) is self.stats_tab:
+            self.refresh_statistics()
+        # 프로그램 정보 및 설정 탭을 처음 열 때 구성
+        if not self.credit_tab_ready and self.tabs.widget(index) is self.credit_tab:
+            self.credit_tab_ready = True
+            self.init_credit_tab()
 
     def closeEvent(self, event):
-        # 어플리케이션 종료 시 업데이트 스레드 정리
+        # 어플리케이션 종료 시 업데이트 스레드 정리 (아직 시작 전이면 시작하지 않도록 타이머를 멈춤)
+        self.update_timer.stop()
         self.update_thread.quit()
         self.update_thread.wait()
-        self.db_thread.quit()
-        self.db_thread.wait()
-        self.db_worker.close_connection()
+        # 예약된 임시 저장을 연결을 닫기 전에 요청
+        self.counsel_autosaver.flush()
+        self.db_client.stop()
+        # 창을 먼저 숨기고 바뀐 내용이 있으면 마지막으로 백업
+        self.hide()
+        self.backup_service.stop()
         super().closeEvent(event)
 
     def show_update_dialog(self, latest_version, update_content):
@@ -91,6 +171,7 @@ class MainApp(QMainWindow):
             QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
+            import webbrowser
             webbrowser.open("https://github.com/ghchoi48/HomeRoom-Counseling-Manager/releases")
         self.update_thread.quit()
         self.update_thread.wait()
@@ -102,16 +183,15 @@ class MainApp(QMainWindow):
         self.update_thread.wait()
 
     # --- DatabaseWorker 시그널 핸들러 ---
-    def handle_students_ready(self, students):
-        self.student_list.clear()
-        self.student_list.addItems(students)
-        self.name_combo.clear()
-        self.name_combo.addItems(students)
-        self.db_thread.quit() # 작업 완료 후 스레드 종료
-        self.db_thread.wait()
-
-    def handle_student_info_ready(self, info):
+    @tracing.traced_reply
+    def handle_students_ready(self, request_id, students):
+        self.student_model.set_students(students)
+
+    @tracing.traced_reply
+    def handle_student_info_ready(self, request_id, info):
         # 학생 정보 표시
+        if request_id != self.student_request_id: # 이전 학생에 대한 응답은 무시
+            return
         if not info:
             return
         self.name_edit.setText(info.get('이름', ''))
@@ -130,97 +210,134 @@ class MainApp(QMainWindow):
         if info.get('메모'):
             self.memo_edit.setText(info['메모'])
 
-    def handle_student_data_for_update(self, student_data):
-        if not student_data:
-            QMessageBox.critical(self, "오류", "학생 정보를 데이터베이스에서 찾을 수 없습니다.")
+    @tracing.traced_reply
+    def handle_counsel_records_ready(self, request_id, records, has_more):
+        # 상담 기록 요약 페이지 표시
+        if not self.counsel_model.add_page(request_id, records, has_more):
             return
-        
-        student_id = student_data['id']
-        updated_name = self.name_edit.text().strip()
-
-        info = {
-            '이름': updated_name,
-            '성별': self.gender_edit.currentText(),
-            '생년월일': self.birth_edit.dateTime().toString("yyyy-MM-dd"),
-            '연락처': self.phone_edit.text(),
-            '보호자 연락처1': self.family_phone_edit1.text(),
-            '보호자 연락처2': self.family_phone_edit2.text(),
-            '메모': self.memo_edit.toPlainText()
-        }
-        self.update_student_data_signal.emit(student_id, info)
-        self.db_thread.start()
-
-    def handle_counsel_records_ready(self, records):
-        # 상담 기록 표시
-        self.counsel_record_list.clear()
-        if not records:
-            self.counsel_record_list.addItem('상담 기록이 없습니다.')
-            self.counsel_record_list.setEnabled(False)
+        has_records = self.counsel_model.rowCount() > 0
+        self.counsel_record_list.setEnabled(has_records)
+        if not has_records:
+            self.counsel_detail.setPlaceholderText('상담 기록이 없습니다.')
+
+    @tracing.user_action('select_counsel_record')
+    def handle_current_record_changed(self, current, previous):
+        # 선택한 상담 기록의 전체 내용만 불러옴
+        self.counsel_detail.clear()
+        self.detail_record_request_id = 0
+        if current.isValid():
+            self.detail_record_request_id = self.db_client.request('get_counsel_record', current.data(Qt.UserRole))
+
+    def start_progress_request(self, title, operation, *args):
+        # 진행률 대화상자를 띄우고 취소할 수 있는 작업을 요청 (내보내기, 가져오기)
+        with tracing.action(operation):
+            request_id = self.db_client.request(operation, *args)
+        dialog = QProgressDialog(title, '취소', 0, 0, self)
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(500)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(self.cancel_progress_request)
+        self.progress_dialog = dialog
+        self.progress_request_id = request_id
+
+    def cancel_progress_request(self):
+        # 진행률 대화상자의 취소 버튼
+        self.db_client.cancel(self.progress_request_id)
+
+    def close_progress_dialog(self, request_id):
+        # 해당 요청의 진행률 대화상자 닫기
+        if self.progress_dialog is None or request_id != self.progress_request_id:
             return
-            
-        self.counsel_record_list.setEnabled(True)
-        for rec in records:
-            summary = f"[{rec['일시']}] ({rec['대상']}, {rec['방법']}, {rec['분류']})\n{rec['내용']}\n"
-            item = QListWidgetItem(summary)
-            item.setData(Qt.UserRole, rec['id'])
-            self.counsel_record_list.addItem(item)
-        self.db_thread.quit() # 작업 완료 후 스레드 종료
-        self.db_thread.wait()
-
-    def handle_db_operation_success(self, operation_type, data):
+        dialog = self.progress_dialog
+        self.progress_dialog = None
+        dialog.hide() # close()는 canceled 시그널을 보내므로 숨긴 뒤 삭제
+        dialog.deleteLater()
+
+    @tracing.traced_reply
+    def handle_progress_changed(self, request_id, done, total):
+        if self.progress_dialog is None or request_id != self.progress_request_id:
+            return
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(done)
+
+    @tracing.traced_reply
+    def handle_db_operation_cancelled(self, request_id):
+        self.close_progress_dialog(request_id)
+
+    @tracing.traced_reply
+    def handle_db_operation_success(self, request_id, operation_type, data):
+        self.close_progress_dialog(request_id)
+        # 학생 목록은 워커가 보내는 변경분(student_inserted 등)으로 이미 갱신됨
         if operation_type == "add_student":
-            self.student_list.addItem(data)
-            self.student_list.sortItems()
-            self.refresh_student_list()
+            pass
         elif operation_type == "delete_student":
-            row = self.student_list.currentRow()
-            self.student_list.takeItem(row)
-            self.counsel_record_list.clear()
-            self.name_edit.clear()
-            self.phone_edit.clear()
-            self.refresh_student_list()
             QMessageBox.information(self, "삭제 완료", "학생 정보가 성공적으로 삭제되었습니다.")
         elif operation_type == "update_student":
             QMessageBox.information(self, "저장 완료", "학생 정보가 성공적으로 저장되었습니다.")
-            # UI의 학생 목록 업데이트
-            current_item = self.student_list.currentItem()
-            if current_item:
-                current_item.setText(data['이름'])
-            self.student_list.sortItems()
             # After updating, re-display the current student's info to refresh the form
-            if current_item:
-                self.display_student_info_and_counsel(current_item.text())
+            self.display_student_info_and_counsel(self.current_student_id())
         elif operation_type == "add_counsel_record":
-            # 학생 정보 탭의 상담 기록 갱신
-            name = self.name_combo.currentText()
-            if self.student_list.currentItem() and self.student_list.currentItem().text() == name:
-                self.db_worker.get_student_info_and_counsel(name)
-                self.db_thread.start()
+            # 학생 정보 탭에서 같은 학생을 보고 있으면 상담 기록 갱신
+            if self.current_student_id() == data:
+                self.request_student_info_and_counsel(data)
             self.counsel_input.clear()
+            self.counsel_autosaver.discard()
             QMessageBox.information(self, "저장 완료", "상담 기록이 추가되었습니다.")
         elif operation_type == "update_counsel_record":
             QMessageBox.information(self, "성공", "상담기록이 수정되었습니다.")
-            student_name = self.student_list.currentItem().text() if self.student_list.currentItem() else None
-            if student_name:
-                self.db_worker.get_student_info_and_counsel(student_name)
-                self.db_thread.start()
+            student_id = self.current_student_id()
+            if student_id is not None:
+                self.request_student_info_and_counsel(student_id)
         elif operation_type == "delete_counsel_record":
-            student_name = self.student_list.currentItem().text() if self.student_list.currentItem() else None
-            if student_name:
-                self.db_worker.get_student_info_and_counsel(student_name)
-                self.db_thread.start()
+            student_id = self.current_student_id()
+            if student_id is not None:
+                self.request_student_info_and_counsel(student_id)
+        elif operation_type == "change_password":
+            QMessageBox.information(self, '성공', '암호가 성공적으로 변경되었습니다.')
+        elif operation_type == "enable_encryption":
+            QMessageBox.information(self, "암호화 완료", "상담 내용과 학생 메모를 암호화했습니다.")
+            student_id = self.current_student_id()
+            if student_id is not None:
+                self.request_student_info_and_counsel(student_id)
         elif operation_type == "export":
             QMessageBox.information(self, "성공", data)
         elif operation_type == "import":
             QMessageBox.information(self, "성공", data)
             self.refresh_student_list()
-        self.db_thread.quit() # 작업 완료 후 스레드 종료
-        self.db_thread.wait()
-
-    def handle_db_operation_error(self, error_message):
+        elif operation_type == "check_counseling_import":
+            self.confirm_counseling_import(data)
+        elif operation_type == "import_counseling":
+            message = f"상담 기록 {data['added']}건을 가져왔습니다."
+            duplicates = data['valid'] - data['added']
+            if duplicates:
+                message += f"\n이미 있는 기록 {duplicates}건은 건너뛰었습니다."
+            if data['invalid']:
+                message += f"\n잘못된 행 {data['invalid']}건은 건너뛰었습니다."
+            self.show_message_with_details(QMessageBox.Information, "성공", message, data['errors'])
+            student_id = self.current_student_id()
+            if student_id is not None:
+                self.request_student_info_and_counsel(student_id)
+
+    @tracing.traced_reply
+    def handle_db_operation_error(self, request_id, error_message):
+        self.close_progress_dialog(request_id)
         QMessageBox.critical(self, "오류", error_message)
-        self.db_thread.quit() # 작업 완료 후 스레드 종료
-        self.db_thread.wait()
+
+    @tracing.traced_reply
+    def handle_import_failed(self, request_id, error_message, errors):
+        # 가져오기 실패
+        self.close_progress_dialog(request_id)
+        self.show_message_with_details(QMessageBox.Critical, "오류", error_message, errors)
+
+    def show_message_with_details(self, icon, title, message, details, buttons=QMessageBox.Ok):
+        # 행별 오류 등 긴 목록은 자세히 보기에 표시
+        box = QMessageBox(icon, title, message, buttons, self)
+        if details:
+            box.setInformativeText(details[0])
+            box.setDetailedText('\n'.join(details))
+        return box.exec()
 
     def init_student_tab(self):
         # 학생 정보탭 초기화 함수
@@ -234,7 +351,9 @@ class MainApp(QMainWindow):
         student_list_title = QLabel("학생 목록")
         student_list_title.setProperty("class", "subtitle")
         left_layout.addWidget(student_list_title)
-        self.student_list = QListWidget()
+        self.student_list = QListView()
+        self.student_list.setModel(self.student_model)
+        self.student_list.setUniformItemSizes(True)
         left_layout.addWidget(self.student_list)
         
         
@@ -296,8 +415,14 @@ class MainApp(QMainWindow):
         counsel_record_title = QLabel("상담 기록")
         counsel_record_title.setProperty("class", "subtitle")
         right_layout.addWidget(counsel_record_title)
-        self.counsel_record_list = QListWidget()
-        right_layout.addWidget(self.counsel_record_list)
+        self.counsel_record_list = QListView()
+        self.counsel_record_list.setModel(self.counsel_model)
+        self.counsel_record_list.setItemDelegate(CounselRecordDelegate(self.counsel_record_list))
+        self.counsel_record_list.setUniformItemSizes(True)
+        right_layout.addWidget(self.counsel_record_list, 3)
+        self.counsel_detail = QPlainTextEdit()
+        self.counsel_detail.setReadOnly(True)
+        right_layout.addWidget(self.counsel_detail, 2)
         
         buttons_layout = QHBoxLayout()
         btn_edit_record = QPushButton('상담기록 수정')
@@ -310,14 +435,29 @@ class MainApp(QMainWindow):
         layout.addLayout(right_layout, 3)
         
         # 신호 연결
-        self.student_list.currentTextChanged.connect(self.display_student_info_and_counsel)
+        self.student_list.selectionModel().currentChanged.connect(self.handle_current_student_changed)
+        self.counsel_record_list.selectionModel().currentChanged.connect(self.handle_current_record_changed)
         btn_add.clicked.connect(self.add_student)
         btn_del.clicked.connect(self.delete_student)
         btn_save_info.clicked.connect(self.save_student_info)
         btn_edit_record.clicked.connect(self.edit_counsel_record)
         btn_del_record.clicked.connect(self.delete_counsel_record)
 
-    def display_student_info_and_counsel(self, student_name):
+    def current_student_name(self):
+        # 학생 목록에서 선택된 학생의 이름 (없으면 None)
+        index = self.student_list.currentIndex()
+        return index.data(Qt.DisplayRole) if index.isValid() else None
+
+    def current_student_id(self):
+        # 학생 목록에서 선택된 학생의 id (없으면 None)
+        index = self.student_list.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
+    @tracing.user_action('select_student')
+    def handle_current_student_changed(self, current, previous):
+        self.display_student_info_and_counsel(current.data(Qt.UserRole) if current.isValid() else None)
+
+    def display_student_info_and_counsel(self, student_id):
         # 학생 정보 및 상담 내역 표시 함수
 
         # UI 초기화
@@ -328,113 +468,150 @@ class MainApp(QMainWindow):
         self.family_phone_edit1.clear()
         self.family_phone_edit2.clear()
         self.memo_edit.clear()
-        self.counsel_record_list.clear()
+        self.counsel_model.clear()
+        self.counsel_detail.clear()
         
-        if not student_name:
+        if student_id is None:
             return
             
         # 학생 정보 및 상담 기록 조회 요청
-        self.db_worker.get_student_info_and_counsel(student_name)
-        self.db_thread.start()
+        self.request_student_info_and_counsel(student_id)
 
+    def request_student_info_and_counsel(self, student_id):
+        # 학생 정보와 상담 기록 첫 페이지를 (다시) 불러옴
+        self.student_request_id = self.db_client.request('get_student_info_and_counsel', student_id)
+        self.counsel_model.load_student(student_id, self.student_request_id)
+        self.counsel_detail.setPlaceholderText('상담 기록을 선택하면 전체 내용이 표시됩니다.')
+
+    @tracing.user_action()
     def save_student_info(self):
         # 학생 정보 저장 함수
 
-        current_item = self.student_list.currentItem()
-        if not current_item:
+        student_id = self.current_student_id()
+        if student_id is None:
             QMessageBox.warning(self, "선택 오류", "학생을 선택하세요.")
             return
 
-        original_name = current_item.text()
+        original_name = self.current_student_name()
         updated_name = self.name_edit.text().strip()
 
         if not updated_name:
             QMessageBox.warning(self, "입력 오류", "학생 이름은 비워둘 수 없습니다.")
             self.name_edit.setText(original_name) # 원래 이름으로 복원
             return
+        if updated_name != original_name and self.student_model.contains_name(updated_name):
+            QMessageBox.warning(self, "입력 오류", f"'{updated_name}' 학생은 이미 존재합니다.")
+            return
 
-        # 선택된 학생 정보 불러오기
-        self.db_worker.get_student_by_name_for_update(original_name)
-        self.db_thread.start()
+        info = {
+            '이름': updated_name,
+            '성별': self.gender_edit.currentText(),
+            '생년월일': self.birth_edit.dateTime().toString("yyyy-MM-dd"),
+            '연락처': self.phone_edit.text(),
+            '보호자 연락처1': self.family_phone_edit1.text(),
+            '보호자 연락처2': self.family_phone_edit2.text(),
+            '메모': self.memo_edit.toPlainText()
+        }
+        self.db_client.request('update_student', student_id, info)
 
+    @tracing.user_action()
     def edit_counsel_record(self):
         # 상담 기록 수정 함수
 
-        student_name = self.student_list.currentItem().text() if self.student_list.currentItem() else None
+        student_name = self.current_student_name()
         if not student_name:
             QMessageBox.warning(self, "선택 오류", "학생을 선택하세요.")
             return
         
-        current_item = self.counsel_record_list.currentItem()
-        if not current_item or not current_item.data(Qt.UserRole):
+        current_index = self.counsel_record_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "선택 오류", "수정할 상담기록을 선택하세요.")
             return
 
-        record_id = current_item.data(Qt.UserRole)
-        self.db_worker.get_counsel_record(record_id)
-        self.db_thread.start()
+        record_id = current_index.data(Qt.UserRole)
+        self.edit_record_request_id = self.db_client.request('get_counsel_record', record_id)
 
-    def handle_counsel_record_ready(self, record_to_edit):
+    @tracing.traced_reply
+    def handle_counsel_record_ready(self, request_id, record_to_edit):
+        if request_id == self.detail_record_request_id:
+            self.counsel_detail.setPlainText(record_to_edit.get('내용', ''))
+            return
+        if request_id != self.edit_record_request_id:
+            return
         if not record_to_edit:
             QMessageBox.critical(self, "오류", "상담기록을 불러오지 못했습니다.")
             return
 
+        record_id = record_to_edit['id']
         dialog = EditCounselDialog(record_to_edit, self)
+        autosaver = DraftAutosaver(self.db_client, dialog.get_draft, record_id, dialog)
+        draft = self.record_drafts.pop(record_id, None)
+        if draft is not None:
+            dialog.restore_draft(draft)
+            autosaver.mark_saved(dialog.get_draft())
+        autosaver.watch(dialog.datetime_edit, dialog.target_combo, dialog.method_combo, dialog.category_combo,
+                        dialog.counsel_input)
         if dialog.exec():
             updated_data = dialog.get_data()
             if not updated_data['내용']:
+                autosaver.discard()
                 QMessageBox.warning(self, "입력 오류", "상담 내용을 입력하세요.")
                 return
-            self.db_worker.update_counsel_record(record_to_edit['id'], updated_data)
-            self.db_thread.start()
+            # 수정이 저장되면 임시 저장은 Database에서 함께 지워짐
+            autosaver.stop()
+            self.db_client.request('update_counsel_record', record_id, updated_data)
+        else:
+            autosaver.discard()
 
+    @tracing.user_action()
     def delete_counsel_record(self):
         # 상담 기록 삭제 함수
 
-        student_name = self.student_list.currentItem().text() if self.student_list.currentItem() else None
+        student_name = self.current_student_name()
         if not student_name:
             QMessageBox.warning(self, "선택 오류", "학생을 선택하세요.")
             return
         
-        current_item = self.counsel_record_list.currentItem()
-        if not current_item or not current_item.data(Qt.UserRole):
+        current_index = self.counsel_record_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "선택 오류", "삭제할 상담기록을 선택하세요.")
             return
             
-        record_id = current_item.data(Qt.UserRole)
+        record_id = current_index.data(Qt.UserRole)
         
         reply = QMessageBox.question(
             self, '상담기록 삭제', "선택한 상담기록을 삭제하시겠습니까?",
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.db_worker.delete_counsel_record_by_id(record_id)
-            self.db_thread.start()
+            self.db_client.request('delete_counsel_record_by_id', record_id)
 
+    @tracing.user_action()
     def add_student(self):
         # 학생 추가 함수
 
         text, ok = QInputDialog.getText(self, '학생 추가', '학생 이름을 입력하세요:')
         if ok and text:
-            self.db_worker.add_student(text)
-            self.db_thread.start()
+            if self.student_model.contains_name(text):
+                QMessageBox.warning(self, "입력 오류", "이미 존재하는 학생입니다.")
+                return
+            self.db_client.request('add_student', text)
 
+    @tracing.user_action()
     def delete_student(self):
         # 학생 삭제 함수
         
-        current_item = self.student_list.currentItem()
-        if not current_item:
+        name = self.current_student_name()
+        if not name:
             QMessageBox.warning(self, "선택 오류", "삭제할 학생을 선택하세요.")
             return
-            
-        name = current_item.text()
+
         reply = QMessageBox.question(
             self, '학생 삭제', f'{name} 학생을 삭제하시겠습니까?',
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.db_worker.delete_student(name)
-            self.db_thread.start()
+            self.db_client.request('delete_student', self.current_student_id())
 
     def init_counsel_tab(self):
         # 상담 기록 탭 초기화
@@ -450,8 +627,13 @@ class MainApp(QMainWindow):
         row1.addWidget(QLabel('학생 이름'))
         self.name_combo = QComboBox()
         self.name_combo.setMaximumWidth(200)
-        self.db_worker.get_all_students()
-        self.db_thread.start()
+        self.name_combo.setModel(self.student_model)
+        self.name_combo.setEditable(True)
+        self.name_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.name_combo.completer().setCompletionMode(QCompleter.PopupCompletion)
+        self.name_combo.completer().setFilterMode(Qt.MatchContains)
+        self.name_combo.setCurrentIndex(-1)
+        self.db_client.request('get_all_students')
         row1.addWidget(self.name_combo)
         row1.addStretch()
 
@@ -503,6 +685,52 @@ class MainApp(QMainWindow):
         layout.addWidget(btn_add_counsel)
         btn_add_counsel.clicked.connect(self.add_counsel_record)
 
+        # 작성 중인 상담 내용 자동 임시 저장
+        self.counsel_autosaver = DraftAutosaver(self.db_client, self.counsel_draft, parent=self)
+        self.counsel_autosaver.watch(self.name_combo, self.datetime_edit, self.target_combo, self.method_combo,
+                                     self.category_combo, self.counsel_input)
+
+    def counsel_draft(self):
+        # 상담 기록 탭의 임시 저장할 입력 값 (내용의 앞뒤 공백도 그대로 저장)
+        return {
+            '학생': self.name_combo.currentText(),
+            '일시': self.datetime_edit.dateTime().toString("yyyy-MM-dd HH:mm"),
+            '대상': self.target_combo.currentText(),
+            '방법': self.method_combo.currentText(),
+            '분류': self.category_combo.currentText(),
+            '내용': self.counsel_input.toPlainText(),
+        }
+
+    @tracing.traced_reply
+    def restore_drafts(self, request_id, drafts):
+        # 상담 기록 탭의 새 기록은 입력란에 바로 복원하고, 기록 수정 내용은 수정 화면을 열 때 복원
+        messages = []
+        for draft in drafts:
+            if draft['record_id'] is not None:
+                self.record_drafts[draft['record_id']] = draft
+                continue
+            # 입력 중인 내용이 있으면 덮어쓰지 않음
+            if self.counsel_input.toPlainText().strip():
+                continue
+            self.name_combo.setCurrentText(draft['학생'])
+            date_time = QDateTime.fromString(draft['일시'] or '', "yyyy-MM-dd HH:mm")
+            if date_time.isValid():
+                self.datetime_edit.setDateTime(date_time)
+            self.target_combo.setCurrentText(draft['대상'])
+            self.method_combo.setCurrentText(draft['방법'])
+            self.category_combo.setCurrentText(draft['분류'])
+            self.counsel_input.setPlainText(draft['내용'])
+            self.counsel_autosaver.mark_saved(self.counsel_draft())
+            self.tabs.setCurrentWidget(self.counsel_tab)
+            messages.append(f"{draft['저장일시']}에 작성하던 상담 내용을 상담 기록 탭에 복원했습니다.")
+        if self.record_drafts:
+            messages.append(
+                f"수정하던 상담 기록 {len(self.record_drafts)}건의 내용은 해당 기록의 수정 화면을 열면 복원됩니다."
+            )
+        if messages:
+            QMessageBox.information(self, "임시 저장 복원", "저장하지 않고 종료된 내용이 있습니다.\n\n" + "\n".join(messages))
+
+    @tracing.user_action()
     def add_counsel_record(self):
         # 상담 기록 추가 함수
 
@@ -510,6 +738,10 @@ class MainApp(QMainWindow):
         if not name:
             QMessageBox.warning(self, "선택 오류", "학생 이름을 입력하거나 선택하세요.")
             return
+        student_id = self.student_model.id_of_name(name)
+        if student_id is None:
+            QMessageBox.warning(self, "입력 오류", "학생 이름이 존재하지 않습니다. 정확한 이름을 입력하세요.")
+            return
             
         dt = self.datetime_edit.dateTime().toString("yyyy-MM-dd HH:mm")
         target = self.target_combo.currentText()
@@ -522,32 +754,222 @@ class MainApp(QMainWindow):
             return
             
         new_record = {'일시': dt, '대상': target, '방법': method, '분류': category, '내용': content}
-        self.db_worker.add_counsel_record(name, new_record)
-        self.db_thread.start()
+        self.db_client.request('add_counsel_record', student_id, new_record)
 
     def refresh_student_list(self):
         # 학생 목록 새로고침 함수
 
-        # 학생 추가/삭제 후 상담 기록 탭의 콤보박스 갱신
-        self.name_combo.clear()
-        self.db_worker.get_all_students()
-        self.db_thread.start()
+        # 학생 목록 모델 전체를 다시 불러옴 (일괄 가져오기 후)
+        self.db_client.request('get_all_students')
+
+    def init_search_tab(self):
+        # 상담 검색 탭 초기화
 
+        layout = QVBoxLayout()
+        self.search_tab.setLayout(layout)
+
+        search_row = QHBoxLayout()
+        search_row.addWidget(QLabel('검색어'))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("상담 내용에서 찾을 단어를 입력하세요. 여러 단어는 모두 포함된 기록을 찾습니다.")
+        self.search_edit.setClearButtonEnabled(True)
+        search_row.addWidget(self.search_edit, 1)
+        self.search_category_combo = QComboBox()
+        self.search_category_combo.addItem('전체 분류')
+        self.search_category_combo.addItems(CATEGORY)
+        search_row.addWidget(self.search_category_combo)
+        layout.addLayout(search_row)
+
+        self.search_result_list = QListWidget()
+        self.search_result_list.setWordWrap(True)
+        layout.addWidget(self.search_result_list)
+        self.search_status = QLabel('결과를 두 번 누르면 해당 학생의 정보로 이동합니다.')
+        self.search_status.setProperty("class", "caption")
+        layout.addWidget(self.search_status)
+
+        # 입력이 잠시 멈춘 뒤에만 검색 요청 (디바운스)
+        self.search_request_id = 0
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_edit.textChanged.connect(self.schedule_search)
+        self.search_category_combo.currentIndexChanged.connect(self.schedule_search)
+        self.search_result_list.itemDoubleClicked.connect(self.open_search_result)
+
+    def schedule_search(self, *args):
+        # 검색 타이머 재시작
+        self.search_timer.start()
+
+    @tracing.user_action('search')
+    def run_search(self):
+        # 상담 기록 검색 요청
+        query = self.search_edit.text().strip()
+        if not query:
+            self.search_request_id = 0
+            self.search_result_list.clear()
+            return
+        filters = {}
+        if self.search_category_combo.currentIndex() > 0:
+            filters['분류'] = self.search_category_combo.currentText()
+        self.search_request_id = self.db_client.request('search_records', query, filters)
+
+    @tracing.traced_reply
+    def handle_search_results_ready(self, request_id, results):
+        # 가장 최근 검색어의 결과만 표시
+        if request_id != self.search_request_id:
+            return
+        self.search_result_list.clear()
+        for rec in results:
+            item = QListWidgetItem(f"[{rec['일시']}] {rec['이름']} ({rec['분류']})\n{rec['스니펫']}")
+            item.setData(Qt.UserRole, rec['student_id'])
+            self.search_result_list.addItem(item)
+        self.search_status.setText(f"검색 결과 {len(results)}건 · 결과를 두 번 누르면 해당 학생의 정보로 이동합니다.")
+
+    @tracing.user_action()
+    def open_search_result(self, item):
+        # 검색 결과의 학생을 학생 정보 탭에서 선택
+        row = self.student_model.row_of(item.data(Qt.UserRole))
+        if row < 0:
+            return
+        self.tabs.setCurrentWidget(self.student_tab)
+        self.student_list.setCurrentIndex(self.student_model.index(row))
+
+    def init_stats_tab(self):
+        # 상담 통계 탭 초기화
+
+        layout = QVBoxLayout()
+        self.stats_tab.setLayout(layout)
+
+        option_row = QHBoxLayout()
+        option_row.addWidget(QLabel('학년도'))
+        self.stats_year_combo = QComboBox()
+        self.stats_year_combo.addItem('전체 학년도', None)
+        option_row.addWidget(self.stats_year_combo)
+        option_row.addWidget(QLabel('집계 기준'))
+        self.stats_group_combo = QComboBox()
+        for label, group_by in STATISTICS_GROUPS:
+            self.stats_group_combo.addItem(label, group_by)
+        option_row.addWidget(self.stats_group_combo)
+        option_row.addStretch(1)
+        layout.addLayout(option_row)
+
+        self.stats_table = QTableWidget(0, 3)
+        self.stats_table.setHorizontalHeaderLabels(['분류', '건수', '비율'])
+        self.stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.stats_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        layout.addWidget(self.stats_table)
+        self.stats_status = QLabel('')
+        self.stats_status.setProperty("class", "caption")
+        layout.addWidget(self.stats_status)
+
+        self.stats_years_request_id = 0 # 학년도 목록 조회 요청 ID
+        self.stats_request_id = 0 # 가장 최근의 통계 조회 요청 ID
+        self.stats_year_combo.currentIndexChanged.connect(self.request_statistics)
+        self.stats_group_combo.currentIndexChanged.connect(self.request_statistics)
+
+    def refresh_statistics(self):
+        # 학년도 목록을 다시 불러온 뒤 통계 조회
+        self.stats_years_request_id = self.db_client.request('get_statistics', None, 'school_year')
+
+    @tracing.user_action()
+    def request_statistics(self, *args):
+        # 선택한 학년도와 집계 기준으로 통계 조회 요청
+        self.stats_request_id = self.db_client.request(
+            'get_statistics', self.stats_year_combo.currentData(), self.stats_group_combo.currentData()
+        )
+
+    @tracing.traced_reply
+    def handle_statistics_ready(self, request_id, rows):
+        if request_id == self.stats_years_request_id:
+            self.update_stats_years([row[0] for row in rows])
+        elif request_id == self.stats_request_id:
+            self.show_statistics(rows)
+
+    def update_stats_years(self, years):
+        # 학년도 콤보박스를 최신순으로 다시 채우고 선택을 유지 (처음에는 가장 최근 학년도 선택)
+        selected = self.stats_year_combo.currentData()
+        first_load = self.stats_year_combo.count() == 1
+        self.stats_year_combo.blockSignals(True)
+        self.stats_year_combo.clear()
+        self.stats_year_combo.addItem('전체 학년도', None)
+        for year in sorted(years, reverse=True):
+            self.stats_year_combo.addItem(f'{year}학년도', year)
+        if first_load and years:
+            selected = max(years)
+        self.stats_year_combo.setCurrentIndex(max(0, self.stats_year_combo.findData(selected)))
+        self.stats_year_combo.blockSignals(False)
+        self.request_statistics()
+
+    def show_statistics(self, rows):
+        # 집계 결과를 표에 표시
+        total = sum(count for _, count in rows)
+        self.stats_table.setHorizontalHeaderLabels([self.stats_group_combo.currentText(), '건수', '비율'])
+        self.stats_table.setRowCount(len(rows))
+        for row, (key, count) in enumerate(rows):
+            values = [key or '(없음)', f'{count:,}', f'{count / total:.1%}']
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.stats_table.setItem(row, column, item)
+        self.stats_status.setText(f"{self.stats_year_combo.currentText()} 상담 {total:,}건")
+
+    @tracing.user_action()
     def change_password(self):
         # 암호 변경 함수
 
-        dialog = ChangePasswordDialog(self)
+        dialog = ChangePasswordDialog(self, verify=check_password)
         if dialog.exec():
-            old_password, new_password = dialog.get_passwords()
-
-            if not check_password(old_password):
-                QMessageBox.warning(self, '오류', '기존 암호가 올바르지 않습니다.')
-                return
-
-            if set_password(new_password):
-                QMessageBox.information(self, '성공', '암호가 성공적으로 변경되었습니다.')
-            else:
-                QMessageBox.critical(self, '오류', '암호 변경에 실패했습니다.')
+            # 기존 암호는 다이얼로그에서 확인함
+            # 암호화된 데이터베이스의 데이터 키도 새 암호로 다시 감싸야 하므로 워커에서 함께 처리
+            self.db_client.request('change_password', *dialog.get_passwords())
+
+    def handle_encryption_status(self, encrypted, unlocked):
+        # 데이터베이스 암호화 상태 표시
+        self.db_encrypted = encrypted
+        self.db_unlocked = unlocked
+        self.show_encryption_status()
+        if encrypted and not unlocked:
+            QMessageBox.warning(
+                self, '암호화 오류',
+                '암호화된 상담 내용을 열 수 없습니다.\n'
+                '상담 내용을 암호화할 때 사용한 암호로 로그인했는지 확인하세요.\n'
+                '이 상태에서는 상담 내용과 메모를 저장할 수 없습니다.'
+            )
+
+    def show_encryption_status(self):
+        if self.encryption_status_label is None:
+            return
+        if self.db_encrypted:
+            status = "상담 내용과 학생 메모가 암호화되어 있습니다." if self.db_unlocked else "암호화된 내용을 열 수 없습니다."
+        elif encryption_available():
+            status = "상담 내용이 암호화되어 있지 않습니다."
+        else:
+            status = "암호화에 필요한 cryptography 패키지가 설치되어 있지 않습니다."
+        self.encryption_status_label.setText(status)
+        self.encrypt_btn.setEnabled(not self.db_encrypted and encryption_available())
+
+    @tracing.user_action()
+    def encrypt_database(self):
+        # 상담 내용과 학생 메모를 로그인 암호로 암호화
+        reply = QMessageBox.question(
+            self, '상담 내용 암호화',
+            '상담 내용과 학생 메모를 로그인 암호로 암호화합니다.\n\n'
+            '- 암호를 잊으면 암호화된 내용을 복구할 수 없습니다.\n'
+            '- 암호화하기 전에 만든 백업과 내보낸 파일은 암호화되지 않습니다.\n'
+            '- 상담 기록 목록에 내용 미리보기가 표시되지 않고, 검색이 느려질 수 있습니다.\n'
+            '- 암호화한 뒤에는 되돌릴 수 없습니다.\n\n'
+            '계속하시겠습니까?',
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        dialog = PasswordDialog(self, verify=check_password)
+        if dialog.exec():
+            self.start_progress_request("상담 내용 암호화 중...", 'enable_encryption', dialog.get_password())
 
     def init_credit_tab(self):
         # 프로그램 정보 탭 초기화
@@ -577,6 +999,7 @@ class MainApp(QMainWindow):
         license_label.setProperty("class", "subtitle")
         license_text = QPlainTextEdit()
         license_text.setReadOnly(True)
+        from utils.license import LICENSE
         license_text.setPlainText(LICENSE)
         left_layout.addWidget(license_label)
         left_layout.addWidget(license_text)
@@ -636,6 +1059,9 @@ class MainApp(QMainWindow):
 
         import_btn_row1.addWidget(export_form_students_btn)
         import_btn_row1.addWidget(import_students_btn)
+        import_counseling_btn = QPushButton("상담 기록 가져오기")
+        import_counseling_btn.clicked.connect(self.import_counseling_data)
+        import_btn_row1.addWidget(import_counseling_btn)
 
         # 글꼴 크기 설정
         
@@ -658,7 +1084,7 @@ class MainApp(QMainWindow):
         change_password_title.setProperty("class", "subtitle")
         change_password_btn = QPushButton("암호 변경")
         change_password_btn.clicked.connect(self.change_password)
-        change_password_caption = QLabel("자료 보존을 위해 counseling.db 파일은 주기적으로 백업하세요.")
+        change_password_caption = QLabel("counseling.db 파일은 backups 폴더에 자동으로 백업됩니다.")
         change_password_caption.setProperty("class", "caption")
         change_password_caution = QLabel("암호를 잊었을 경우에는 settings.ini 파일을 삭제하세요.")
         change_password_caution.setProperty("class", "caution")
@@ -668,15 +1094,27 @@ class MainApp(QMainWindow):
         change_password_hint.setSpacing(0)
         change_password_hint.setContentsMargins(0, 0, 0, 0)
 
+        # 상담 내용 암호화
+        self.encrypt_btn = QPushButton("상담 내용 암호화")
+        self.encrypt_btn.clicked.connect(self.encrypt_database)
+        self.encryption_status_label = QLabel()
+        self.encryption_status_label.setProperty("class", "caption")
+        self.show_encryption_status()
+
         # 다크모드 토글
         toggle_dark_mode = QPushButton("다크 모드 전환")
         toggle_dark_mode.pressed.connect(self.theme_manager.toggle_theme)
 
+        # 느린 SQL 문장과 캐시 통계 (문제를 알려 올 때 확인)
+        diagnostics_btn = QPushButton("진단 정보")
+        diagnostics_btn.clicked.connect(self.show_diagnostics)
+
         settings_groupbox = QGroupBox("설정")
         settings_layout = QVBoxLayout()
         settings_layout.addLayout(font_layout)
         settings_layout.addWidget(font_size_caption)
         settings_layout.addWidget(toggle_dark_mode)
+        settings_layout.addWidget(diagnostics_btn)
         settings_layout.addStretch()
         settings_groupbox.setLayout(settings_layout)
 
@@ -684,6 +1122,8 @@ class MainApp(QMainWindow):
         password_layout = QVBoxLayout()
         password_layout.addWidget(change_password_btn)
         password_layout.addLayout(change_password_hint)
+        password_layout.addWidget(self.encrypt_btn)
+        password_layout.addWidget(self.encryption_status_label)
         password_layout.addStretch()
         password_groupbox.setLayout(password_layout)
     
@@ -706,9 +1146,82 @@ class MainApp(QMainWindow):
         right_layout.addWidget(password_groupbox)
         right_layout.addWidget(export_groupbox)
         right_layout.addWidget(import_groupbox) 
+        right_layout.addWidget(self.init_backup_groupbox())
         right_layout.addStretch()
         layout.addLayout(right_layout, 1)
 
+    def show_diagnostics(self):
+        # 진단 정보 모듈(utils.query_trace 포함)은 처음 열 때 가져옴
+        from ui.diagnostics import DiagnosticsDialog
+        DiagnosticsDialog(self.db_client, self).exec()
+
+    def init_backup_groupbox(self):
+        # 자동 백업 설정
+        interval_hours, keep = get_backup_settings()
+        self.backup_interval_spin = QSpinBox()
+        self.backup_interval_spin.setRange(0, 168)
+        self.backup_interval_spin.setSuffix(" 시간")
+        self.backup_interval_spin.setSpecialValueText("끔")
+        self.backup_interval_spin.setValue(interval_hours)
+        self.backup_keep_spin = QSpinBox()
+        self.backup_keep_spin.setRange(1, 100)
+        self.backup_keep_spin.setSuffix(" 개")
+        self.backup_keep_spin.setValue(keep)
+        self.backup_interval_spin.valueChanged.connect(self.change_backup_settings)
+        self.backup_keep_spin.valueChanged.connect(self.change_backup_settings)
+        backup_now_btn = QPushButton("지금 백업")
+        backup_now_btn.clicked.connect(self.backup_now)
+
+        backup_row = QHBoxLayout()
+        backup_row.addWidget(QLabel("주기"))
+        backup_row.addWidget(self.backup_interval_spin)
+        backup_row.addWidget(QLabel("보관"))
+        backup_row.addWidget(self.backup_keep_spin)
+        backup_row.addWidget(backup_now_btn)
+        self.backup_status_label = QLabel()
+        self.backup_status_label.setProperty("class", "caption")
+        backups = list_backups(self.backup_service.worker.backup_dir)
+        if backups:
+            self.show_backup_status(backups[-1])
+
+        backup_groupbox = QGroupBox("자동 백업")
+        backup_layout = QVBoxLayout()
+        backup_layout.addLayout(backup_row)
+        backup_layout.addWidget(self.backup_status_label)
+        backup_groupbox.setLayout(backup_layout)
+        return backup_groupbox
+
+    def change_backup_settings(self):
+        interval_hours = self.backup_interval_spin.value()
+        keep = self.backup_keep_spin.value()
+        set_backup_settings(interval_hours, keep)
+        self.backup_service.configure(interval_hours, keep)
+
+    def backup_now(self):
+        self.manual_backup_pending = True
+        self.backup_status_label.setText("백업 중...")
+        self.backup_service.request_backup(force=True)
+
+    def show_backup_status(self, path):
+        if self.backup_status_label is None:
+            return
+        modified = QDateTime.fromSecsSinceEpoch(int(os.path.getmtime(path))).toString("yyyy-MM-dd HH:mm")
+        self.backup_status_label.setText(f"마지막 백업: {modified} ({os.path.basename(path)})")
+
+    def handle_backup_finished(self, path):
+        if path:
+            self.show_backup_status(path)
+        if self.manual_backup_pending:
+            self.manual_backup_pending = False
+            QMessageBox.information(self, "백업 완료", f"데이터베이스를 백업했습니다.\n저장 위치: {path}")
+
+    def handle_backup_failed(self, error_message):
+        if self.backup_status_label is not None:
+            self.backup_status_label.setText(error_message)
+        if self.manual_backup_pending:
+            self.manual_backup_pending = False
+            QMessageBox.critical(self, "오류", error_message)
+
     def change_font_size(self, size_str):
         size = int(size_str)
         set_font_size(size)
@@ -724,8 +1237,34 @@ class MainApp(QMainWindow):
         )
         
         if file_path:
-            self.db_worker.import_students_data_ready.emit(file_path)
-            self.db_thread.start()
+            self.start_progress_request("학생 정보 가져오는 중...", 'import_students_data', file_path)
+
+    def import_counseling_data(self):
+        # 상담 기록 CSV 가져오기 (먼저 검사만 한 뒤 확인을 받아 가져옴)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "상담 기록 가져오기",
+            "",
+            "CSV 파일 (*.csv)"
+        )
+
+        if file_path:
+            self.start_progress_request("상담 기록 검사 중...", 'import_counseling_data', file_path, True)
+
+    def confirm_counseling_import(self, result):
+        # 검사 결과를 보여주고 가져오기 여부 확인
+        if not result['valid']:
+            self.show_message_with_details(
+                QMessageBox.Warning, "가져오기 오류", "가져올 수 있는 상담 기록이 없습니다.", result['errors'])
+            return
+        message = f"상담 기록 {result['valid']}건을 가져옵니다."
+        if result['invalid']:
+            message += f"\n잘못된 행 {result['invalid']}건은 건너뜁니다."
+        message += "\n이미 있는 기록(같은 학생, 일시, 내용)은 다시 추가하지 않습니다.\n계속하시겠습니까?"
+        reply = self.show_message_with_details(
+            QMessageBox.Question, "상담 기록 가져오기", message, result['errors'], QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.start_progress_request("상담 기록 가져오는 중...", 'import_counseling_data', result['file_path'], False)
 
     def export_form_students_csv(self):
         file_path, _ = QFileDialog.getSaveFileName(
@@ -736,8 +1275,7 @@ class MainApp(QMainWindow):
         )
 
         if file_path:
-            self.db_worker.export_form_students_csv(file_path)
-            self.db_thread.start()
+            self.db_client.request('export_form_students_csv', file_path)
 
     def export_all_data(self):
         # 전체 데이터 CSV 내보내기
@@ -749,8 +1287,7 @@ class MainApp(QMainWindow):
         )
         
         if file_path:
-            self.db_worker.export_all_data(file_path)
-            self.db_thread.start()
+            self.start_progress_request("전체 데이터 내보내기", 'export_all_data', file_path)
 
     def export_students_data(self):
         # 학생 정보 CSV 내보내기
@@ -762,8 +1299,7 @@ class MainApp(QMainWindow):
         )
         
         if file_path:
-            self.db_worker.export_students_data(file_path)
-            self.db_thread.start()
+            self.start_progress_request("학생 정보 내보내기", 'export_students_data', file_path)
 
     def export_counseling_data(self):
         # 상담 기록 CSV 내보내기
@@ -775,8 +1311,7 @@ class MainApp(QMainWindow):
         )
         
         if file_path:
-            self.db_worker.export_counseling_data(file_path)
-            self.db_thread.start()
+            self.start_progress_request("상담 기록 내보내기", 'export_counseling_data', file_path)
 
     def export_counseling_data_for_neis(self):
         # 나이스 등록용 상담 기록 CSV 내보내기
@@ -790,5 +1325,4 @@ class MainApp(QMainWindow):
         end_date = self.end_date_edit.dateTime().toString("yyyy-MM-dd")
 
         if file_path:
-            self.db_worker.export_counseling_data_for_neis(file_path, start_date, end_date)
-            self.db_thread.start()
\ No newline at end of file
+            self.start_progress_request("나이스 등록용 상담 기록 내보내기", 'export_counseling_data_for_neis', file_path, start_date, end_date)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+목록 모델 모듈
+여러 위젯이 함께 사용하는 Qt 모델 클래스를 포함합니다.
+"""
+
+from bisect import bisect_left
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from utils import tracing
+
+
+class StudentListModel(QAbstractListModel):
+    """학생 (이름, id)를 이름순으로 정렬해 보관하는 목록 모델
+
+    학생 목록 뷰와 상담 기록 탭의 이름 콤보박스가 같은 모델을 사용하며,
+    추가/삭제/이름 변경은 전체를 다시 그리지 않고 해당 행만 갱신합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._students = [] # (이름, id) 정렬된 목록
+        self._names = {}    # id -> 이름
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._students)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._students):
+            return None
+        name, student_id = self._students[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return name
+        if role == Qt.UserRole:
+            return student_id
+        return None
+
+    def set_students(self, students):
+        """(id, 이름) 목록으로 전체를 교체합니다."""
+        self.beginResetModel()
+        self._students = sorted((name, student_id) for student_id, name in students)
+        self._names = {student_id: name for name, student_id in self._students}
+        self.endResetModel()
+
+    def row_of(self, student_id):
+        """학생 id의 행 번호를 반환합니다. 없으면 -1"""
+        name = self._names.get(student_id)
+        if name is None:
+            return -1
+        return bisect_left(self._students, (name, student_id))
+
+    def student_at(self, row):
+        """행 번호의 (id, 이름)을 반환합니다."""
+        name, student_id = self._students[row]
+        return student_id, name
+
+    def id_of_name(self, name):
+        """이름으로 학생 id를 찾습니다. 없으면 None"""
+        row = bisect_left(self._students, (name,))
+        if row < len(self._students) and self._students[row][0] == name:
+            return self._students[row][1]
+        return None
+
+    def contains_name(self, name):
+        """같은 이름의 학생이 있는지 확인합니다."""
+        return self.id_of_name(name) is not None
+
+    def insert_student(self, student_id, name):
+        """학생 한 명을 정렬 위치에 추가합니다."""
+        if student_id in self._names:
+            self.rename_student(student_id, name)
+            return
+        row = bisect_left(self._students, (name, student_id))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._students.insert(row, (name, student_id))
+        self._names[student_id] = name
+        self.endInsertRows()
+
+    def remove_student(self, student_id):
+        """학생 한 명을 목록에서 제거합니다."""
+        row = self.row_of(student_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._students[row]
+        del self._names[student_id]
+        self.endRemoveRows()
+
+    def rename_student(self, student_id, name):
+        """학생 이름을 바꾸고 정렬 위치로 옮깁니다. 선택 상태는 유지됩니다."""
+        old_row = self.row_of(student_id)
+        if old_row < 0:
+            self.insert_student(student_id, name)
+            return
+        # 원래 행을 뺀 목록에서의 위치
+        new_row = bisect_left(self._students, (name, student_id))
+        if new_row > old_row:
+            new_row -= 1
+        if new_row != old_row:
+            # beginMoveRows의 목적지는 옮기기 전 목록 기준의 위치
+            destination = new_row + 1 if new_row > old_row else new_row
+            self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), destination)
+            del self._students[old_row]
+            self._students.insert(new_row, (name, student_id))
+            self._names[student_id] = name
+            self.endMoveRows()
+        else:
+            self._students[old_row] = (name, student_id)
+            self._names[student_id] = name
+            index = self.index(old_row)
+            self.dataChanged.emit(index, index)
+
+
+class CounselRecordModel(QAbstractListModel):
+    """학생 한 명의 상담 기록 요약을 페이지 단위로 불러오는 목록 모델
+
+    처음에는 첫 페이지만 받고, 뷰가 끝까지 스크롤되면 fetchMore()로 다음 페이지를 요청합니다.
+    목록에는 내용의 미리보기만 보관하며 전체 내용은 선택한 기록에 대해서만 따로 조회합니다.
+    """
+
+    HEADER_ROLE = Qt.UserRole + 1
+    PREVIEW_ROLE = Qt.UserRole + 2
+
+    def __init__(self, db_client, parent=None):
+        super().__init__(parent)
+        self.db_client = db_client
+        self._records = []
+        self._student_id = None
+        self._has_more = False
+        self._pending_request_id = 0 # 응답을 기다리는 페이지 요청 ID
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._records):
+            return None
+        rec = self._records[index.row()]
+        if role == Qt.UserRole:
+            return rec['id']
+        if role == self.HEADER_ROLE:
+            return f"[{rec['일시']}] ({rec['대상']}, {rec['방법']}, {rec['분류']})"
+        if role == self.PREVIEW_ROLE:
+            return rec['미리보기']
+        if role == Qt.DisplayRole:
+            return f"[{rec['일시']}] ({rec['대상']}, {rec['방법']}, {rec['분류']})\n{rec['미리보기']}"
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._pending_request_id
+
+    @tracing.user_action('fetch_more_records')
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        last = self._records[-1]
+        self._pending_request_id = self.db_client.request(
+            'get_counsel_record_page', self._student_id, (last['일시'], last['id'])
+        )
+
+    def clear(self):
+        """목록을 비우고 기다리던 응답을 무시합니다."""
+        self.beginResetModel()
+        self._records = []
+        self._student_id = None
+        self._has_more = False
+        self._pending_request_id = 0
+        self.endResetModel()
+
+    def load_student(self, student_id, request_id):
+        """목록을 비우고 request_id 요청으로 올 첫 페이지를 기다립니다."""
+        self.clear()
+        self._student_id = student_id
+        self._pending_request_id = request_id
+
+    def add_page(self, request_id, records, has_more):
+        """기다리던 요청의 페이지를 목록 끝에 붙입니다. 다른 요청의 응답이면 False를 반환합니다."""
+        if not self._pending_request_id or request_id != self._pending_request_id:
+            return False
+        self._pending_request_id = 0
+        self._has_more = has_more
+        if records:
+            first = len(self._records)
+            self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+            self._records.extend(records)
+            self.endInsertRows()
+        return True
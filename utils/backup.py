@@ -0,0 +1,201 @@
+"""데이터베이스 백업 모듈
+
+sqlite3의 온라인 백업(Connection.backup)으로 사용 중인 데이터베이스를 페이지 단위로 복사합니다.
+복사본은 PRAGMA integrity_check로 검사한 뒤에만 백업 파일이 되며, 오래된 백업은 보관 개수만큼만 남깁니다.
+백업은 전용 스레드에서 실행되므로 화면이 멈추거나 다른 연결의 쓰기가 막히지 않습니다.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot, Qt, QMetaObject
+
+logger = logging.getLogger(__name__)
+
+# 한 단계에서 복사하는 페이지 수와 단계 사이의 대기 시간(초)
+BACKUP_PAGES = 1024
+BACKUP_STEP_SLEEP = 0.001
+
+BACKUP_PREFIX = 'counseling-'
+BACKUP_SUFFIX = '.db'
+
+# 프로그램 시작 후 첫 예약 백업까지의 최소 대기 시간(ms)
+STARTUP_BACKUP_DELAY_MS = 60 * 1000
+
+
+class _BackupCancelled(Exception):
+    """진행 콜백이 백업 중단을 요청했을 때 사용"""
+
+
+def list_backups(backup_dir):
+    """백업 파일 경로를 오래된 순서로 반환합니다."""
+    if not os.path.isdir(backup_dir):
+        return []
+    names = sorted(
+        name for name in os.listdir(backup_dir)
+        if name.startswith(BACKUP_PREFIX) and name.endswith(BACKUP_SUFFIX)
+    )
+    return [os.path.join(backup_dir, name) for name in names]
+
+
+def last_modified(db_file):
+    """데이터베이스의 마지막 수정 시각 (WAL 파일 포함)"""
+    times = [os.path.getmtime(path) for path in (db_file, db_file + '-wal') if os.path.exists(path)]
+    return max(times, default=0)
+
+
+def needs_backup(db_file, backup_dir):
+    """마지막 백업 이후 데이터베이스가 바뀌었는지 확인합니다."""
+    backups = list_backups(backup_dir)
+    return not backups or last_modified(db_file) > os.path.getmtime(backups[-1])
+
+
+def rotate_backups(backup_dir, keep):
+    """가장 최근 keep개만 남기고 오래된 백업을 삭제합니다."""
+    for path in list_backups(backup_dir)[:-keep]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.exception("오래된 백업 삭제 오류: %s", e)
+
+
+def backup_database(db_file, backup_dir, keep=7, pages=BACKUP_PAGES, progress_callback=None):
+    """데이터베이스를 backup_dir에 백업하고 백업 파일 경로를 반환합니다.
+
+    복사는 pages 페이지씩 나눠 진행하며, WAL 모드에서는 복사 중에도 다른 연결이 읽고 쓸 수 있습니다.
+    복사본의 무결성 검사를 통과해야 백업 파일 이름으로 바뀌며, 실패하면 None을 반환합니다.
+    progress_callback(복사한 페이지 수, 전체 페이지 수)가 False를 반환하면 백업을 중단합니다.
+    """
+    os.makedirs(backup_dir, exist_ok=True)
+    name = f"{BACKUP_PREFIX}{datetime.now():%Y%m%d-%H%M%S}{BACKUP_SUFFIX}"
+    path = os.path.join(backup_dir, name)
+    partial_path = path + '.partial'
+
+    def progress(status, remaining, total):
+        if progress_callback and progress_callback(total - remaining, total) is False:
+            raise _BackupCancelled()
+
+    source = target = None
+    try:
+        source = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+        target = sqlite3.connect(partial_path)
+        # 읽기 트랜잭션을 열어 둔 채 복사하면 한 시점(스냅숏)을 복사하게 됨.
+        # 열어 두지 않으면 단계 사이에 다른 연결이 쓸 때마다 백업이 처음부터 다시 시작됨
+        source.execute("BEGIN")
+        source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+        source.backup(target, pages=pages, progress=progress, sleep=BACKUP_STEP_SLEEP)
+        source.rollback()
+        result = target.execute("PRAGMA integrity_check").fetchone()[0]
+        if result != 'ok':
+            logger.warning("백업 무결성 검사 실패: %s", result)
+            return None
+        target.close()
+        target = None
+        os.replace(partial_path, path)
+        rotate_backups(backup_dir, keep)
+        return path
+    except _BackupCancelled:
+        return None
+    except (sqlite3.Error, OSError) as e:
+        logger.exception("데이터베이스 백업 오류: %s", e)
+        return None
+    finally:
+        if source is not None:
+            source.close()
+        if target is not None:
+            target.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
+class BackupWorker(QObject):
+    """백업 스레드에서 백업을 실행하는 워커"""
+
+    finished = Signal(str)  # 백업 파일 경로 (바뀐 내용이 없어 건너뛰었으면 빈 문자열)
+    failed = Signal(str)
+
+    def __init__(self, db_file, backup_dir):
+        super().__init__()
+        self.db_file = db_file
+        self.backup_dir = backup_dir
+        self.keep = 7
+
+    @Slot(bool)
+    def run_backup(self, force=False):
+        """백업을 실행합니다. force가 아니면 마지막 백업 이후 바뀐 내용이 있을 때만 실행합니다."""
+        if not os.path.exists(self.db_file):
+            return
+        if not force and not needs_backup(self.db_file, self.backup_dir):
+            self.finished.emit('')
+            return
+        path = backup_database(self.db_file, self.backup_dir, keep=self.keep)
+        if path:
+            self.finished.emit(path)
+        else:
+            self.failed.emit("데이터베이스 백업에 실패했습니다.")
+
+    @Slot()
+    def backup_if_changed(self):
+        """바뀐 내용이 있을 때만 백업합니다. (종료 시 사용)"""
+        self.run_backup(False)
+
+
+class BackupService(QObject):
+    """백업 스레드와 백업 예약을 관리하는 클래스 (GUI 스레드에서 사용)
+
+    interval_hours마다 백업을 요청하고, 프로그램을 닫을 때 마지막으로 한 번 더 백업합니다.
+    예약 백업과 종료 시 백업은 바뀐 내용이 없으면 건너뜁니다.
+    """
+
+    backup_requested = Signal(bool)  # 바뀐 내용이 없어도 백업할지 여부
+
+    def __init__(self, db_file, backup_dir, parent=None):
+        super().__init__(parent)
+        self.thread = QThread()
+        self.worker = BackupWorker(db_file, backup_dir)
+        self.worker.moveToThread(self.thread)
+        self.backup_requested.connect(self.worker.run_backup, Qt.QueuedConnection)
+        self.interval_hours = 0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.request_backup)
+        self.first_timer = QTimer(self)
+        self.first_timer.setSingleShot(True)
+        self.first_timer.timeout.connect(self.request_backup)
+
+    def start(self, interval_hours, keep):
+        """백업 스레드를 시작하고 백업을 예약합니다."""
+        self.thread.start()
+        self.configure(interval_hours, keep)
+
+    def configure(self, interval_hours, keep):
+        """백업 주기(시간, 0이면 예약 안 함)와 보관 개수를 바꿉니다."""
+        self.worker.keep = keep
+        self.interval_hours = interval_hours
+        self.timer.stop()
+        self.first_timer.stop()
+        if interval_hours <= 0:
+            return
+        interval_ms = interval_hours * 3600 * 1000
+        self.timer.start(interval_ms)
+        # 마지막 백업이 주기보다 오래되었으면 시작 직후에 한 번 백업
+        backups = list_backups(self.worker.backup_dir)
+        elapsed_ms = (time.time() - os.path.getmtime(backups[-1])) * 1000 if backups else interval_ms
+        if elapsed_ms >= interval_ms:
+            self.first_timer.start(STARTUP_BACKUP_DELAY_MS)
+
+    def request_backup(self, force=False):
+        """백업 스레드에 백업을 요청합니다."""
+        self.backup_requested.emit(force)
+
+    def stop(self, backup=True):
+        """(바뀐 내용이 있으면 백업을 마친 뒤) 백업 스레드를 종료합니다."""
+        self.timer.stop()
+        self.first_timer.stop()
+        if self.thread.isRunning():
+            if backup:
+                QMetaObject.invokeMethod(self.worker, "backup_if_changed", Qt.BlockingQueuedConnection)
+            self.thread.quit()
+            self.thread.wait()
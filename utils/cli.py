@@ -0,0 +1,211 @@
+"""명령줄 모드
+
+GUI(QApplication) 없이 내보내기, 가져오기, 백업, 정리, 통계 작업을 실행합니다.
+여러 선생님의 데이터베이스를 스크립트로 한꺼번에 처리할 때 사용합니다.
+
+    python main.py --cli [--db 경로] [--json] <명령> ...
+    python -m utils.cli [--db 경로] [--json] <명령> ...
+
+--json을 지정하면 결과와 소요 시간을 한 줄의 JSON으로 출력하고, 오류 메시지는 표준 오류로 보냅니다.
+암호화된 데이터베이스는 HEARTWINGS_PASSWORD 환경 변수(--password-env로 변경)나
+입력 프롬프트로 받은 로그인 암호로 엽니다.
+성공하면 0, 실패하면 1을 반환합니다.
+"""
+
+import argparse
+import contextlib
+import getpass
+import json
+import os
+import re
+import sys
+import time
+
+from .database import Database, default_db_file
+from .config_manager import DEFAULT_BACKUP_KEEP
+
+PASSWORD_ENV = 'HEARTWINGS_PASSWORD'
+
+# 내보내기 종류 -> Database 메서드 이름
+EXPORT_METHODS = {
+    'all': 'export_to_csv',
+    'students': 'export_students_to_csv',
+    'counseling': 'export_counseling_to_csv',
+    'neis': 'export_counseling_to_csv_for_neis',
+}
+
+
+class CommandError(Exception):
+    """명령을 실행할 수 없을 때 사용 (메시지를 출력하고 1을 반환)"""
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='main.py --cli', description='마음나래 Lite 명령줄 모드')
+    parser.add_argument('--db', default=None, help='데이터베이스 파일 (기본값: 프로그램 폴더의 counseling.db)')
+    parser.add_argument('--json', action='store_true', help='결과와 소요 시간을 JSON으로 출력')
+    parser.add_argument('--password-env', default=PASSWORD_ENV, help=f'로그인 암호를 읽을 환경 변수 (기본값: {PASSWORD_ENV})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help='CSV 내보내기')
+    export.add_argument('kind', choices=[*EXPORT_METHODS, 'form'])
+    export.add_argument('output', help='저장할 CSV 파일')
+    export.add_argument('--start', help='나이스 내보내기 시작일 (yyyy-MM-dd)')
+    export.add_argument('--end', help='나이스 내보내기 종료일 (yyyy-MM-dd, 당일 포함)')
+
+    import_ = commands.add_parser('import', help='CSV 가져오기')
+    import_.add_argument('kind', choices=['students', 'counseling'])
+    import_.add_argument('input', help='가져올 CSV 파일')
+    import_.add_argument('--dry-run', action='store_true', help='상담 기록을 추가하지 않고 검사만 함')
+
+    backup = commands.add_parser('backup', help='데이터베이스 백업')
+    backup.add_argument('--dir', help='백업 폴더 (기본값: 데이터베이스 옆의 backups)')
+    backup.add_argument('--keep', type=int, default=DEFAULT_BACKUP_KEEP, help='보관할 백업 개수')
+
+    commands.add_parser('vacuum', help='빈 공간 정리와 검색 색인 병합')
+    commands.add_parser('stats', help='학생 수, 상담 기록 수, 파일 크기')
+    return parser
+
+
+def _date(value, option):
+    if value is None:
+        raise CommandError(f"나이스 내보내기에는 {option} 옵션이 필요합니다.")
+    try:
+        if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', value):
+            raise ValueError(value)
+        time.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise CommandError(f"{option} 날짜는 yyyy-MM-dd 형식이어야 합니다: {value}") from None
+    return value
+
+
+def _unlock(db, args):
+    """암호화된 데이터베이스이면 로그인 암호로 데이터 키를 엽니다."""
+    if not db.encrypted:
+        return
+    password = os.environ.get(args.password_env)
+    if password is None:
+        if not sys.stdin.isatty():
+            raise CommandError(f"암호화된 데이터베이스입니다. {args.password_env} 환경 변수에 암호를 지정하세요.")
+        password = getpass.getpass('암호: ')
+    if not db.unlock(password):
+        raise CommandError("암호가 올바르지 않아 암호화된 내용을 열 수 없습니다.")
+
+
+def _run_export(db, args, result):
+    if args.kind == 'form':
+        ok = db.export_form_students_csv(args.output)
+    else:
+        if args.kind != 'neis':
+            _unlock(db, args)
+        progress = {}
+
+        def record_progress(done, total):
+            progress['rows'] = done
+
+        method = getattr(db, EXPORT_METHODS[args.kind])
+        if args.kind == 'neis':
+            ok = method(args.output, _date(args.start, '--start'), _date(args.end, '--end'),
+                        progress_callback=record_progress)
+        else:
+            ok = method(args.output, progress_callback=record_progress)
+        result['rows'] = progress.get('rows', 0)
+    result['output'] = os.path.abspath(args.output)
+    return ok
+
+
+def _run_import(db, args, result):
+    _unlock(db, args)
+    errors = []
+    if args.kind == 'students':
+        if args.dry_run:
+            raise CommandError("학생 정보 가져오기는 --dry-run을 지원하지 않습니다.")
+        ok = db.import_csv_to_students(args.input, errors=errors)
+    else:
+        summary = db.import_counseling_records(args.input, dry_run=args.dry_run, errors=errors)
+        ok = summary is not None
+        if ok:
+            result.update(summary)
+    result['errors'] = errors
+    return ok
+
+
+def _run_backup(db, args, result):
+    # 백업 모듈은 Qt 워커를 함께 정의하므로 필요할 때만 가져옴 (QApplication은 만들지 않음)
+    from .backup import backup_database
+    backup_dir = os.path.abspath(args.dir or os.path.join(os.path.dirname(db.db_file), 'backups'))
+    path = backup_database(db.db_file, backup_dir, keep=args.keep)
+    result['output'] = path
+    return path is not None
+
+
+def _run_vacuum(db, args, result):
+    before = os.path.getsize(db.db_file)
+    ok = db.vacuum()
+    result['size_before'] = before
+    result['size_after'] = os.path.getsize(db.db_file)
+    return ok
+
+
+def _run_stats(db, args, result):
+    summary = db.get_summary()
+    if summary is None:
+        return False
+    result.update(summary)
+    wal_file = db.db_file + '-wal'
+    result['size'] = os.path.getsize(db.db_file)
+    result['wal_size'] = os.path.getsize(wal_file) if os.path.exists(wal_file) else 0
+    return True
+
+
+COMMANDS = {
+    'export': _run_export,
+    'import': _run_import,
+    'backup': _run_backup,
+    'vacuum': _run_vacuum,
+    'stats': _run_stats,
+}
+
+
+def _print_result(result, as_json):
+    if as_json:
+        print(json.dumps(result, ensure_ascii=False))
+        return
+    status = '완료' if result['ok'] else '실패'
+    print(f"{status}: {result['command']} ({result['elapsed']:.3f}s)")
+    for key, value in result.items():
+        if key in ('command', 'ok', 'elapsed') or value in (None, []):
+            continue
+        if key == 'errors':
+            value = '\n  '.join([''] + value)
+        print(f"  {key}: {value}")
+
+
+def run(argv=None):
+    """명령을 실행하고 종료 코드를 반환합니다."""
+    args = build_parser().parse_args(argv)
+    db_file = os.path.abspath(args.db or default_db_file())
+    result = {'command': args.command, 'db': db_file}
+    if getattr(args, 'kind', None):
+        result['command'] = f"{args.command} {args.kind}"
+    start = time.perf_counter()
+    # JSON 출력이 섞이지 않도록 Database가 출력하는 오류 메시지는 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        try:
+            if not os.path.exists(db_file):
+                raise CommandError(f"데이터베이스 파일이 없습니다: {db_file}")
+            db = Database(db_file)
+            try:
+                result['ok'] = bool(COMMANDS[args.command](db, args, result))
+            finally:
+                db.close_connection()
+        except CommandError as e:
+            print(f"오류: {e}", file=sys.stderr)
+            result['ok'] = False
+            result['error'] = str(e)
+    result['elapsed'] = round(time.perf_counter() - start, 6)
+    _print_result(result, args.json)
+    return 0 if result['ok'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run())
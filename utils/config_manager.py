@@ -1,7 +1,14 @@
+import atexit
 import configparser
-import hashlib
+import json
+import logging
 import os
+import tempfile
+import threading
 from .helpers import get_base_dir
+from .credentials import hash_password, verify_password, needs_rehash
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = get_base_dir()
 CONFIG_FILE = os.path.join(BASE_DIR, 'settings.ini')
@@ -11,69 +18,191 @@ DISPLAY_SECTION = 'display'
 FONT_SIZE_OPTION = 'fontsize'
 SETTINGS_SECTION = 'settings'
 SCHOOL_YEAR_OPTION= 'school_year'
+BACKUP_SECTION = 'backup'
+BACKUP_INTERVAL_OPTION = 'interval_hours'
+BACKUP_KEEP_OPTION = 'keep'
+DEFAULT_BACKUP_INTERVAL = 24 # 시간
+DEFAULT_BACKUP_KEEP = 7
+UPDATE_SECTION = 'update'
+UPDATE_INTERVAL_OPTION = 'interval_hours'
+DEFAULT_UPDATE_INTERVAL = 24 # 시간
+
+# 연속된 설정 변경(글꼴 크기 콤보박스 스크롤 등)을 모아 한 번에 저장하기까지의 대기 시간(초)
+SAVE_DELAY = 0.5
 
 CATEGORY = ['학업', '진로', '성격', '성', '대인관계', '가정 및 가족관계', '일탈 및 비행', '학교폭력 가해', '학교폭력 피해', '자해 및 자살', '정신건강', '컴퓨터 및 스마트폰 과사용', '정보제공', '기타']
 TARGET = ['학생', '학부모', '교사', '기타']
 METHOD = ['면담', '전화상담', '사이버상담']
 GENDER = ['남자', '여자', '기타']
 
-def _hash_password(password):
-    # 암호를 비문화
-    return hashlib.sha256(password.encode('utf-8')).hexdigest()
+class Settings:
+    """settings.ini를 한 번만 읽어 메모리에 보관하는 설정 저장소
+
+    읽기는 메모리에서 처리하고, 파일의 수정 시각이 바뀐 경우(외부에서 편집)에만 다시 읽습니다.
+    변경 사항은 SAVE_DELAY초 동안 모았다가 임시 파일에 쓴 뒤 os.replace로 한 번에 교체하며,
+    프로그램 종료 시 저장되지 않은 변경 사항을 저장합니다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._config = configparser.ConfigParser(interpolation=None)
+        self._mtime = None
+        self._loaded = False
+        self._dirty = False
+        self._timer = None
+
+    @classmethod
+    def instance(cls):
+        """CONFIG_FILE에 대한 공용 Settings 객체를 반환합니다."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(CONFIG_FILE)
+                atexit.register(cls._instance.flush)
+            return cls._instance
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _refresh(self):
+        # 처음이거나 파일이 바뀌었으면 다시 읽음 (저장하지 않은 변경 사항이 있으면 그대로 둠)
+        mtime = self._file_mtime()
+        if self._loaded and (mtime == self._mtime or self._dirty):
+            return
+        config = configparser.ConfigParser(interpolation=None)
+        if mtime is not None:
+            config.read(self.path, encoding='utf-8')
+        self._config = config
+        self._mtime = mtime
+        self._loaded = True
+
+    def get(self, section, option, fallback=None):
+        with self._lock:
+            self._refresh()
+            return self._config.get(section, option, fallback=fallback)
+
+    def getint(self, section, option, fallback=None):
+        with self._lock:
+            self._refresh()
+            return self._config.getint(section, option, fallback=fallback)
+
+    def has_option(self, section, option):
+        with self._lock:
+            self._refresh()
+            return self._config.has_option(section, option)
+
+    def set(self, section, option, value):
+        """값을 바꾸고 잠시 뒤 저장하도록 예약합니다."""
+        with self._lock:
+            self._refresh()
+            if not self._config.has_section(section):
+                self._config.add_section(section)
+            self._config.set(section, option, str(value))
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """저장하지 않은 변경 사항을 바로 저장합니다."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(prefix='.settings-', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as configfile:
+                    self._config.write(configfile)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                logger.exception("설정 저장 오류: %s", e)
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return
+            self._dirty = False
+            self._mtime = self._file_mtime()
+
 
 def is_password_set():
     # settings.ini에 암호가 있는지 확인
-    if not os.path.exists(CONFIG_FILE):
-        return False
-    config = configparser.ConfigParser()
-    config.read(CONFIG_FILE, encoding='utf-8')
-    return config.has_option(PASSWORD_SECTION, PASSWORD_OPTION)
+    return Settings.instance().has_option(PASSWORD_SECTION, PASSWORD_OPTION)
 
 def check_password(password):
-    # 입력된 암호와 해시가 일치하는지 확인
-    if not is_password_set():
+    # 입력된 암호와 해시가 일치하는지 확인 (해시 계산에 시간이 걸리므로 GUI 스레드 밖에서 호출)
+    stored_hash = Settings.instance().get(PASSWORD_SECTION, PASSWORD_OPTION)
+    if stored_hash is None or not verify_password(password, stored_hash):
         return False
-    config = configparser.ConfigParser()
-    config.read(CONFIG_FILE, encoding='utf-8')
-    stored_hash = config.get(PASSWORD_SECTION, PASSWORD_OPTION)
-    return stored_hash == _hash_password(password)
+    # 이전 형식(SHA-256)이나 낮은 비용으로 저장된 해시는 확인된 암호로 다시 저장
+    if needs_rehash(stored_hash):
+        set_password(password)
+    return True
 
 def set_password(password):
-    # 새 암호를 비문화하여 저장
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE, encoding='utf-8')
-
-    if not config.has_section(PASSWORD_SECTION):
-        config.add_section(PASSWORD_SECTION)
-        
-    pwd_hash = _hash_password(password)
-    config.set(PASSWORD_SECTION, PASSWORD_OPTION, pwd_hash)
-    
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as configfile:
-        config.write(configfile)
+    # 새 암호를 솔트와 함께 해시하여 저장 (바로 저장)
+    settings = Settings.instance()
+    settings.set(PASSWORD_SECTION, PASSWORD_OPTION, hash_password(password))
+    settings.flush()
     return True
 
 def get_font_size():
     # 설정 파일에서 글꼴 크기를 가져옴
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE, encoding='utf-8')
-        if config.has_option(DISPLAY_SECTION, FONT_SIZE_OPTION):
-            size_str = config.get(DISPLAY_SECTION, FONT_SIZE_OPTION)
-            return size_str.replace('px', '').strip()
+    size_str = Settings.instance().get(DISPLAY_SECTION, FONT_SIZE_OPTION)
+    if size_str is not None:
+        return size_str.replace('px', '').strip()
     return '13' # 기본값
 
 def set_font_size(size):
     # 글꼴 크기를 설정 파일에 저장
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE, encoding='utf-8')
-
-    if not config.has_section(DISPLAY_SECTION):
-        config.add_section(DISPLAY_SECTION)
-        
-    config.set(DISPLAY_SECTION, FONT_SIZE_OPTION, str(size))
-    
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as configfile:
-        config.write(configfile) 
\ No newline at end of file
+    Settings.instance().set(DISPLAY_SECTION, FONT_SIZE_OPTION, size)
+
+def get_backup_settings():
+    # 설정 파일에서 (백업 주기(시간), 보관 개수)를 가져옴
+    settings = Settings.instance()
+    interval = settings.getint(BACKUP_SECTION, BACKUP_INTERVAL_OPTION, fallback=DEFAULT_BACKUP_INTERVAL)
+    keep = settings.getint(BACKUP_SECTION, BACKUP_KEEP_OPTION, fallback=DEFAULT_BACKUP_KEEP)
+    return interval, keep
+
+def set_backup_settings(interval_hours, keep):
+    # 백업 주기와 보관 개수를 설정 파일에 저장
+    settings = Settings.instance()
+    settings.set(BACKUP_SECTION, BACKUP_INTERVAL_OPTION, interval_hours)
+    settings.set(BACKUP_SECTION, BACKUP_KEEP_OPTION, keep)
+
+def get_update_cache():
+    # 업데이트 확인 주기(시간)와 마지막 확인 결과를 가져옴
+    # (값이 잘못 저장되어 있으면 기본값을 사용하여 다시 확인하도록 함)
+    settings = Settings.instance()
+    try:
+        return {
+            'interval_hours': settings.getint(UPDATE_SECTION, UPDATE_INTERVAL_OPTION, fallback=DEFAULT_UPDATE_INTERVAL),
+            'last_checked': settings.getint(UPDATE_SECTION, 'last_checked', fallback=0),
+            'etag': settings.get(UPDATE_SECTION, 'etag', fallback=''),
+            'latest_version': settings.get(UPDATE_SECTION, 'latest_version', fallback=''),
+            'notes': json.loads(settings.get(UPDATE_SECTION, 'notes', fallback='""')),
+        }
+    except ValueError as e:
+        logger.exception("업데이트 확인 기록 오류: %s", e)
+        return {'interval_hours': DEFAULT_UPDATE_INTERVAL, 'last_checked': 0, 'etag': '', 'latest_version': '', 'notes': ''}
+
+def set_update_cache(last_checked, etag=None, latest_version=None, notes=None):
+    # 마지막 업데이트 확인 시각과 (새로 받았다면) 결과를 저장
+    settings = Settings.instance()
+    settings.set(UPDATE_SECTION, 'last_checked', int(last_checked))
+    if etag is not None:
+        settings.set(UPDATE_SECTION, 'etag', etag)
+    if latest_version is not None:
+        settings.set(UPDATE_SECTION, 'latest_version', latest_version)
+    if notes is not None:
+        # 여러 줄인 릴리스 노트를 한 줄로 저장
+        settings.set(UPDATE_SECTION, 'notes', json.dumps(notes, ensure_ascii=False))
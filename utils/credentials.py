@@ -0,0 +1,93 @@
+"""암호 해시 모듈
+
+암호는 임의의 솔트와 함께 hashlib.scrypt로 유도한 값을 'scrypt$n$r$p$솔트$해시' 형식으로 저장합니다.
+비용(n, r, p)은 저장된 값에 함께 기록되므로, 기본 비용을 바꿔도 기존 암호를 그대로 확인할 수 있습니다.
+(알맞은 비용은 python -m benchmarks.bench_kdf 로 고를 수 있습니다.)
+이전 버전이 저장한 솔트 없는 SHA-256 해시도 확인할 수 있으며, needs_rehash로 다시 저장할지 판단합니다.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+SCHEME = 'scrypt'
+
+# 기본 비용: n=2**15, r=8이면 약 32MB의 메모리를 쓰며 보통 PC에서 0.1초 안팎이 걸립니다.
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_SIZE = 16
+KEY_SIZE = 32
+
+PasswordRecord = namedtuple('PasswordRecord', ['scheme', 'n', 'r', 'p', 'salt', 'key'])
+
+
+def derive_key(password, salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """암호와 솔트로 scrypt 키(KEY_SIZE 바이트)를 유도합니다."""
+    # 필요한 메모리(128 * r * (n + p + 2) 바이트)보다 maxmem이 작으면 ValueError가 발생함
+    maxmem = 128 * r * (n + p + 2) + 1024 * 1024
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=KEY_SIZE)
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode('ascii')
+
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """암호를 솔트와 함께 scrypt로 해시하여 저장할 문자열로 반환합니다."""
+    salt = os.urandom(SALT_SIZE)
+    key = derive_key(password, salt, n, r, p)
+    return f"{SCHEME}${n}${r}${p}${_b64encode(salt)}${_b64encode(key)}"
+
+
+@lru_cache(maxsize=4)
+def parse_record(stored):
+    """저장된 문자열을 PasswordRecord로 바꿉니다. 형식이 잘못되었으면 None을 반환합니다.
+
+    로그인을 여러 번 시도해도 같은 문자열을 다시 해석하지 않도록 결과를 기억해 둡니다.
+    """
+    stored = stored.strip()
+    try:
+        if '$' not in stored:
+            # 이전 버전의 솔트 없는 SHA-256 (16진수 64자)
+            key = bytes.fromhex(stored)
+            if len(key) != hashlib.sha256().digest_size:
+                return None
+            return PasswordRecord('sha256', 0, 0, 0, b'', key)
+        scheme, n, r, p, salt, key = stored.split('$')
+        if scheme != SCHEME:
+            return None
+        return PasswordRecord(scheme, int(n), int(r), int(p), base64.b64decode(salt), base64.b64decode(key))
+    except (ValueError, binascii.Error):
+        return None
+
+
+def verify_password(password, stored):
+    """암호가 저장된 해시와 일치하는지 확인합니다."""
+    record = parse_record(stored)
+    if record is None:
+        return False
+    if record.scheme == 'sha256':
+        key = hashlib.sha256(password.encode('utf-8')).digest()
+    else:
+        try:
+            key = derive_key(password, record.salt, record.n, record.r, record.p)
+        except ValueError as e:
+            logger.exception("암호 확인 오류: %s", e)
+            return False
+    return hmac.compare_digest(key, record.key)
+
+
+def needs_rehash(stored, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """이전 형식이거나 기본 비용보다 낮은 비용으로 저장된 해시인지 확인합니다."""
+    record = parse_record(stored)
+    if record is None or record.scheme != SCHEME:
+        return True
+    return record.n < n or record.r < r or record.p < p
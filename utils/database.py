@@ -1,30 +1,221 @@
 import sqlite3
 import os
 import csv
-from datetime import datetime
+import io
+import logging
+import re
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 from utils.helpers import get_base_dir
-from utils.encoding_detector import detect_encoding
+from utils.encoding_detector import sniff_encoding
+from utils.migrations import migrate
+from utils.query_trace import QueryStats, TracedConnection, default_log_file, enable_error_log
+from utils.tracing import traced
+from utils.encryption import FieldCipher, KeyRecord, ENCRYPTED_PLACEHOLDER, create_data_key, unwrap_key, wrap_key, is_available
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = get_base_dir()
 
+# 연결을 열 때 한 번만 설정하는 PRAGMA 값
+CACHE_SIZE_KIB = 16 * 1024        # 페이지 캐시 16MB (음수로 지정하면 KiB 단위)
+MMAP_SIZE = 128 * 1024 * 1024     # 메모리 맵 I/O 128MB
+
+# 상담 기록 목록의 한 페이지 크기와 미리보기 글자 수
+COUNSEL_PAGE_SIZE = 50
+COUNSEL_PREVIEW_LENGTH = 80
+
+# 상담 기록 검색 결과의 기본 개수
+SEARCH_LIMIT = 100
+
+# CSV 내보내기 시 한 번에 읽어 쓰는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+# CSV 가져오기 시 한 번에 추가하는 행 수와 보고하는 행별 오류의 최대 개수
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ERRORS = 100
+
+STUDENT_CSV_COLUMNS = ["이름", "연락처", "성별", "생년월일", "보호자 연락처1", "보호자 연락처2", "메모"]
+COUNSELING_CSV_COLUMNS = ['학생이름', '상담일시', '상담대상', '상담방법', '상담분류', '상담내용', '생성일시']
+
+# 상담 일시 형식 (yyyy-MM-dd HH:mm)
+COUNSEL_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}')
+
+# 같은 학생, 일시, 내용의 기록이 이미 있으면 추가하지 않음 (같은 파일을 다시 가져와도 중복되지 않도록)
+COUNSELING_IMPORT_QUERY = '''
+    INSERT INTO counseling_records (student_id, counsel_date, target, method, category, content, created_at)
+    SELECT ?, ?, ?, ?, ?, ?, COALESCE(NULLIF(?, ''), CURRENT_TIMESTAMP)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM counseling_records
+        WHERE student_id = ? AND counsel_date = ? AND content = ?
+    )
+'''
+
+# 암호화된 데이터베이스에서는 내용을 비교할 수 없으므로 중복 확인을 파이썬에서 하고 바로 추가함
+COUNSELING_INSERT_QUERY = '''
+    INSERT INTO counseling_records (student_id, counsel_date, target, method, category, content, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, COALESCE(NULLIF(?, ''), CURRENT_TIMESTAMP))
+'''
+
+STUDENTS_EXPORT_QUERY = '''
+    SELECT name, phone, gender, birth_date, 
+           guardian_phone1, guardian_phone2, memo,
+           created_at, updated_at
+    FROM students ORDER BY name
+'''
+
+COUNSELING_EXPORT_QUERY = '''
+    SELECT s.name, cr.counsel_date, cr.target, cr.method, cr.category, cr.content,
+           cr.created_at
+    FROM counseling_records cr
+    JOIN students s ON cr.student_id = s.id
+    ORDER BY s.name, cr.counsel_date
+'''
+
+# 나이스 등록용 내보내기. 날짜 부분(yyyy-MM-dd)만 SQL에서 잘라 옵니다. (종료일 당일의 기록 포함)
+NEIS_EXPORT_QUERY = '''
+    SELECT cr.category, substr(cr.counsel_date, 1, 10), cr.method
+    FROM counseling_records cr
+    JOIN students s ON cr.student_id = s.id
+    WHERE cr.counsel_date >= ? AND cr.counsel_date < date(?, '+1 day')
+    ORDER BY cr.counsel_date
+'''
+NEIS_CONTENT = '일반 상담은 상담 내용을 입력하지 않습니다.'
+
+# get_statistics로 집계할 수 있는 항목 (counseling_stats의 열 이름)
+STATISTICS_GROUPS = ('school_year', 'month', 'target', 'method', 'category')
+
+
+class _OperationCancelled(Exception):
+    """진행 콜백이 내보내기/가져오기 중단을 요청했을 때 사용"""
+
+
+class DatabaseLocked(sqlite3.DatabaseError):
+    """암호화된 데이터베이스의 데이터 키가 열리지 않은 상태에서 암호화할 값을 저장하려 할 때 사용"""
+
+
+@lru_cache(maxsize=4096)
+def _neis_date_fields(date_only):
+    """'yyyy-MM-dd'를 (학년도, 'yyyyMMdd')로 바꿉니다. 학년도는 3월에 시작합니다.
+
+    같은 날짜의 기록이 많으므로 날짜별로 결과를 기억해 둡니다.
+    """
+    year, month = int(date_only[:4]), int(date_only[5:7])
+    school_year = year if month >= 3 else year - 1
+    return str(school_year), date_only[:4] + date_only[5:7] + date_only[8:10]
+
+
+def _neis_rows(records):
+    """(분류, 날짜, 방법) 행을 나이스 등록용 16열 행으로 바꿉니다.
+
+    행마다 16열 튜플을 새로 만들지만 고정 값은 상수 문자열을 그대로 가리키므로 복사되지 않습니다.
+    (고정 앞/뒷부분 튜플을 미리 만들어 이어 붙이는 방식은 중간 튜플이 생겨 약 3배 느림)
+    """
+    rows = []
+    for category, date_only, method in records:
+        school_year, formatted_date = _neis_date_fields(date_only)
+        rows.append(('일반상담', '일반', '상담', '개인상담', category, '1', school_year, formatted_date,
+                     '', '', category, NEIS_CONTENT, '0', '10', '교사', method))
+    return rows
+
+
+def _fts_phrase(term, prefix=False):
+    """검색어를 FTS5 구문으로 해석되지 않도록 큰따옴표 구절로 감쌉니다."""
+    phrase = '"' + term.replace('"', '""') + '"'
+    return phrase + '*' if prefix else phrase
+
+
+def _like_pattern(term):
+    """검색어를 LIKE 부분 일치 패턴으로 바꿉니다."""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def _filter_clauses(filters):
+    """검색 조건('분류', '대상', '방법', '시작일', '종료일')을 (WHERE 조건 목록, 매개변수 목록)으로 바꿉니다."""
+    where, params = [], []
+    for key, column in (('분류', 'category'), ('대상', 'target'), ('방법', 'method')):
+        if filters.get(key):
+            where.append(f'cr.{column} = ?')
+            params.append(filters[key])
+    if filters.get('시작일'):
+        where.append('cr.counsel_date >= ?')
+        params.append(filters['시작일'])
+    if filters.get('종료일'):
+        where.append("cr.counsel_date < date(?, '+1 day')")
+        params.append(filters['종료일'])
+    return where, params
+
+
+def _iter_batches(cursor, batch_size=EXPORT_BATCH_SIZE):
+    """커서의 결과를 batch_size 행씩 나눠 반환하는 제너레이터"""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _load_key_record(conn):
+    """암호화 키 레코드(KeyRecord)를 읽습니다. 암호화하지 않는 데이터베이스이면 None"""
+    row = conn.execute("SELECT salt, n, r, p, nonce, wrapped_key FROM encryption_keys").fetchone()
+    return KeyRecord(*row) if row else None
+
+
+def _draft_key(record_id):
+    """임시 저장 키 (상담 기록 탭의 새 기록은 'new', 기존 기록 수정은 'record:<id>')"""
+    return 'new' if record_id is None else f'record:{record_id}'
+
+
+def default_db_file():
+    """기본 데이터베이스 파일 경로"""
+    return os.path.join(BASE_DIR, 'counseling.db')
+
+
 class Database:
     def __init__(self, db_file=None):
         if db_file is None:
-            db_file = os.path.join(BASE_DIR, 'counseling.db')
+            db_file = default_db_file()
         self.db_file = db_file
+        self._local = threading.local() # 스레드마다 하나의 연결을 유지
+        self._fts_trigram = None # 검색 색인이 trigram 토크나이저를 쓰는지 (처음 검색할 때 확인)
+        self.encrypted = False # 상담 내용과 메모를 암호화하는 데이터베이스인지 (init_database에서 확인)
+        self.cipher = None     # 열린 데이터 키 (unlock 후 프로그램을 닫을 때까지 유지)
+        self.query_stats = QueryStats(default_log_file(db_file)) # 모든 연결의 문장별 실행 시간
+        enable_error_log(self.query_stats.log_file)  # 아래 메서드의 오류도 같은 로그 파일에 기록
         self.init_database()
 
+    def _connect(self):
+        """새 연결을 열고 PRAGMA를 설정합니다."""
+        conn = sqlite3.connect(self.db_file, factory=TracedConnection)
+        conn.stats = self.query_stats
+        # 외래 키 제약 조건 활성화
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL 모드에서는 읽기와 쓰기가 서로를 막지 않음
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 관리자를 제공합니다."""
-        conn = sqlite3.connect(self.db_file)
+        """현재 스레드의 데이터베이스 연결을 제공하는 컨텍스트 관리자입니다.
+
+        연결은 스레드마다 한 번만 열리고 close_connection()을 호출할 때까지 재사용됩니다.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
         try:
-            # 외래 키 제약 조건 활성화
-            conn.execute("PRAGMA foreign_keys = ON")
             yield conn
-        finally:
-            conn.close()
+        except BaseException:
+            # 커밋되지 않은 작업이 다음 호출로 넘어가지 않도록 되돌림
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
     def check_connection(self):
         """데이터베이스 연결을 테스트합니다."""
@@ -36,203 +227,313 @@ class Database:
             return False
 
     def close_connection(self):
-        """데이터베이스 연결을 닫습니다."""
-        pass  # SQLite는 연결을 자동으로 닫으므로 별도의 작업이 필요하지 않습니다.
+        """현재 스레드의 데이터베이스 연결을 닫습니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
 
-    def _write_csv(self, file_path, headers, data):
-        """주어진 데이터를 CSV 파일에 씁니다."""
+    @traced(cat='db')
+    def vacuum(self):
+        """검색 색인을 병합하고 데이터베이스 파일을 다시 써서 빈 공간을 정리합니다."""
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-                writer.writerows(data)
+            with self.get_connection() as conn:
+                conn.execute("INSERT INTO counseling_records_fts(counseling_records_fts) VALUES ('optimize')")
+                conn.commit()
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA optimize")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             return True
-        except IOError as e:
-            print(f"CSV 파일 쓰기 오류: {e}")
+        except sqlite3.Error as e:
+            logger.exception("데이터베이스 정리 오류: %s", e)
             return False
-        
-    def export_counseling_to_csv_for_neis(self, file_path, start_date, end_date):
-        """나이스 등록용 CSV 파일을 내보냅니다."""
+
+    @traced(cat='db')
+    def get_summary(self):
+        """학생 수, 상담 기록 수, 상담 기간, 스키마 버전, 암호화 여부를 반환합니다."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT cr.category, cr.counsel_date, cr.method
-                    FROM counseling_records cr
-                    JOIN students s ON cr.student_id = s.id
-                    WHERE cr.counsel_date BETWEEN ? AND ?
-                    ORDER BY cr.counsel_date
-                ''', (start_date, end_date))
-                records = cursor.fetchall()
-                
-                result_rows = []
-                for record in records:
-                    category, counsel_date, method = record
-
-                    #학년도 계산
-                    date_only = counsel_date.split()[0]
-                    date_obj = datetime.strptime(date_only, "%Y-%m-%d")
-                    school_year = date_obj.year if date_obj.month >= 3 else date_obj.year - 1
-                    formatted_date = date_obj.strftime("%Y%m%d")
-
-                    # 필요한 필드 구성
-                    row = ('일반상담', '일반', '상담', '개인상담', category, '1', str(school_year), formatted_date, '', '', category, '일반 상담은 상담 내용을 입력하지 않습니다.', '0', '10', '교사', method,)
-                    result_rows.append(row)
-
-            headers = ['*상담분류', '*Wee클래스', '*대분류', '*중분류', '*상담구분', '*상담인원','*학년도','*상담일자','학년','성별','*상담제목','*상담내용','*상담시간(시)','*상담시간(분)','*상담사소속','*상담매체구분']
-            return self._write_csv(file_path, headers, result_rows)
+                students = conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+                records, first_date, last_date = conn.execute(
+                    "SELECT COUNT(*), MIN(counsel_date), MAX(counsel_date) FROM counseling_records"
+                ).fetchone()
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+            return {
+                'students': students, 'records': records, 'first_date': first_date, 'last_date': last_date,
+                'schema_version': version, 'encrypted': self.encrypted,
+            }
         except sqlite3.Error as e:
-            print(f"나이스 등록용 CSV 내보내기 오류: {e}")
+            logger.exception("데이터베이스 요약 조회 오류: %s", e)
+            return None
+
+    def get_query_stats(self, top=20):
+        """실행 시간 합계가 큰 순서로 top개 문장의 통계와 오류 수, 느린 문장 기준, 로그 파일 경로를 반환합니다."""
+        return {
+            'statements': self.query_stats.snapshot(top),
+            'errors': self.query_stats.errors,
+            'slow_ms': self.query_stats.slow_ms,
+            'log_file': self.query_stats.log_file,
+        }
+
+    def reset_query_stats(self):
+        """문장별 실행 시간 기록을 지웁니다. (로그 파일은 그대로 둠)"""
+        self.query_stats.reset()
+
+    def _stream_csv(self, file_path, sections, progress_callback=None):
+        """쿼리 결과를 EXPORT_BATCH_SIZE 행씩 읽어 바로 CSV 파일에 씁니다.
+
+        sections는 (쿼리 결과 앞에 쓸 행 목록, 쿼리, 매개변수, transform) 튜플의 목록입니다.
+        transform이 None이 아니면 읽어 온 행 묶음을 transform(행 목록)의 결과로 바꿔 씁니다.
+        progress_callback(처리한 행 수, 전체 행 수)가 False를 반환하면 내보내기를 중단하고
+        작성 중이던 파일을 삭제한 뒤 False를 반환합니다.
+        쓰는 도중 오류(디스크 부족 등)가 나도 잘린 파일이 남지 않도록 삭제한 뒤 예외를 전달합니다.
+        """
+        with self.get_connection() as conn:
+            total = 0
+            if progress_callback:
+                for _, query, params, _ in sections:
+                    total += conn.execute(f"SELECT COUNT(*) FROM ({query})", params).fetchone()[0]
+            done = 0
+            created = False # 파일을 열지 못했으면 (원래 있던 파일을) 삭제하지 않음
+            try:
+                with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+                    created = True
+                    writer = csv.writer(csvfile)
+                    for lead_rows, query, params, transform in sections:
+                        writer.writerows(lead_rows)
+                        for rows in _iter_batches(conn.execute(query, params)):
+                            writer.writerows(transform(rows) if transform else rows)
+                            done += len(rows)
+                            if progress_callback and progress_callback(done, total) is False:
+                                raise _OperationCancelled()
+            except _OperationCancelled:
+                os.remove(file_path)
+                return False
+            except BaseException:
+                if created:
+                    os.remove(file_path)
+                raise
+        return True
+        
+    @traced(cat='db')
+    def export_counseling_to_csv_for_neis(self, file_path, start_date, end_date, progress_callback=None):
+        """start_date부터 end_date(yyyy-MM-dd, 당일 포함)까지의 상담 기록을 나이스 등록용 CSV 파일로 내보냅니다."""
+        headers = ['*상담분류', '*Wee클래스', '*대분류', '*중분류', '*상담구분', '*상담인원','*학년도','*상담일자','학년','성별','*상담제목','*상담내용','*상담시간(시)','*상담시간(분)','*상담사소속','*상담매체구분']
+        try:
+            return self._stream_csv(
+                file_path, [([headers], NEIS_EXPORT_QUERY, (start_date, end_date), _neis_rows)], progress_callback,
+            )
+        except (sqlite3.Error, IOError) as e:
+            logger.exception("나이스 등록용 CSV 내보내기 오류: %s", e)
             return False
 
-    def export_to_csv(self, file_path):
+    @traced(cat='db')
+    def export_to_csv(self, file_path, progress_callback=None):
         """데이터베이스의 모든 데이터를 CSV 파일로 내보냅니다."""
+        sections = [
+            (
+                [['=== 학생 정보 ==='],
+                 ['이름', '연락처', '성별', '생년월일', '보호자연락처1', '보호자연락처2', '메모', '생성일시', '수정일시']],
+                STUDENTS_EXPORT_QUERY, (), self._unseal_rows(6, 'memo'),
+            ),
+            (
+                [[],
+                 ['=== 상담 기록 ==='],
+                 COUNSELING_CSV_COLUMNS],
+                COUNSELING_EXPORT_QUERY, (), self._unseal_rows(5, 'content'),
+            ),
+        ]
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT name, phone, gender, birth_date, 
-                           guardian_phone1, guardian_phone2, memo,
-                           created_at, updated_at
-                    FROM students ORDER BY name
-                ''')
-                students = cursor.fetchall()
-                
-                cursor.execute('''
-                    SELECT s.name, cr.counsel_date, cr.target, cr.method, cr.category, cr.content,
-                           cr.created_at
-                    FROM counseling_records cr
-                    JOIN students s ON cr.student_id = s.id
-                    ORDER BY s.name, cr.counsel_date
-                ''')
-                records = cursor.fetchall()
-
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                writer.writerow(['=== 학생 정보 ==='])
-                writer.writerow(['이름', '연락처', '성별', '생년월일', '보호자연락처1', '보호자연락처2', '메모', '생성일시', '수정일시'])
-                writer.writerows(students)
-                
-                writer.writerow([])
-                
-                writer.writerow(['=== 상담 기록 ==='])
-                writer.writerow(['학생이름', '상담일시', '상담대상', '상담방법', '상담분류', '상담내용', '생성일시'])
-                writer.writerows(records)
-            
-            return True
-        except (sqlite3.Error, IOError) as e:
-            print(f"CSV 내보내기 오류: {e}")
+            return self._stream_csv(file_path, sections, progress_callback)
+        except (sqlite3.Error, IOError, ValueError) as e:
+            logger.exception("CSV 내보내기 오류: %s", e)
             return False
 
-    def export_students_to_csv(self, file_path):
+    @traced(cat='db')
+    def export_students_to_csv(self, file_path, progress_callback=None):
         """학생 정보만 CSV 파일로 내보냅니다."""
+        headers = ['이름', '연락처', '성별', '생년월일', '보호자연락처1', '보호자연락처2', '메모', '생성일시', '수정일시']
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT name, phone, gender, birth_date, 
-                           guardian_phone1, guardian_phone2, memo,
-                           created_at, updated_at
-                    FROM students ORDER BY name
-                ''')
-                students = cursor.fetchall()
-            
-            headers = ['이름', '연락처', '성별', '생년월일', '보호자연락처1', '보호자연락처2', '메모', '생성일시', '수정일시']
-            return self._write_csv(file_path, headers, students)
-        except sqlite3.Error as e:
-            print(f"학생 정보 CSV 내보내기 오류: {e}")
+            return self._stream_csv(
+                file_path, [([headers], STUDENTS_EXPORT_QUERY, (), self._unseal_rows(6, 'memo'))], progress_callback,
+            )
+        except (sqlite3.Error, IOError, ValueError) as e:
+            logger.exception("학생 정보 CSV 내보내기 오류: %s", e)
             return False
 
-    def export_counseling_to_csv(self, file_path):
+    @traced(cat='db')
+    def export_counseling_to_csv(self, file_path, progress_callback=None):
         """상담 기록만 CSV 파일로 내보냅니다."""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT s.name, cr.counsel_date, cr.target, cr.method, cr.category, cr.content, cr.created_at
-                    FROM counseling_records cr
-                    JOIN students s ON cr.student_id = s.id
-                    ORDER BY s.name, cr.counsel_date
-                ''')
-                records = cursor.fetchall()
-
-            headers = ['학생이름', '상담일시', '상담대상', '상담방법', '상담분류', '상담내용', '생성일시']
-            return self._write_csv(file_path, headers, records)
-        except sqlite3.Error as e:
-            print(f"상담 기록 CSV 내보내기 오류: {e}")
+            return self._stream_csv(
+                file_path, [([COUNSELING_CSV_COLUMNS], COUNSELING_EXPORT_QUERY, (), self._unseal_rows(5, 'content'))],
+                progress_callback,
+            )
+        except (sqlite3.Error, IOError, ValueError) as e:
+            logger.exception("상담 기록 CSV 내보내기 오류: %s", e)
             return False
         
+    @traced(cat='db')
     def export_form_students_csv(self, file_path):
         try:
-            headers = ['이름', '연락처', '성별', '생년월일', '보호자 연락처1', '보호자 연락처2', '메모']
             with open(file_path, 'w', encoding='utf-8-sig', newline='') as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow(headers)
+                writer.writerow(STUDENT_CSV_COLUMNS)
             return True
         except IOError as e:
-            print(f"학생 정보 일괄 등록 양식 저장 오류: {e}")
+            logger.exception("학생 정보 일괄 등록 양식 저장 오류: %s", e)
             return False
 
+    @traced(cat='db')
     def init_database(self):
+        """스키마를 최신 버전으로 마이그레이션합니다."""
         try:
-            self.create_tables()
-            self.update_schema()
+            with self.get_connection() as conn:
+                migrate(conn)
+                self.encrypted = _load_key_record(conn) is not None
         except sqlite3.Error as e:
-            print(f"데이터베이스 초기화 오류: {e}")
-    
-    def create_tables(self):
-        """데이터베이스 및 테이블 초기화"""
+            logger.exception("데이터베이스 초기화 오류: %s", e)
+
+    # --- 상담 내용 암호화 ---
+    def _seal(self, value, column):
+        """암호화하는 데이터베이스이면 값을 암호화합니다. (빈 문자열은 그대로 저장)"""
+        if not self.encrypted or not value:
+            return value
+        if self.cipher is None:
+            raise DatabaseLocked("암호화 키가 열리지 않아 저장할 수 없습니다.")
+        return self.cipher.encrypt(value, column)
+
+    def _unseal(self, value, column):
+        """암호화된 값(BLOB)을 복호화합니다. 데이터 키가 열리지 않았으면 ENCRYPTED_PLACEHOLDER"""
+        if not isinstance(value, bytes):
+            return value
+        if self.cipher is None:
+            return ENCRYPTED_PLACEHOLDER
+        return self.cipher.decrypt(value, column)
+
+    def _unseal_rows(self, index, column):
+        """내보내기에서 행의 index번째 값을 복호화하는 transform (암호화하지 않는 데이터베이스는 None)"""
+        if not self.encrypted:
+            return None
+
+        def transform(rows):
+            rows = [list(row) for row in rows]
+            for row in rows:
+                row[index] = self._unseal(row[index], column)
+            return rows
+        return transform
+
+    @traced(cat='db')
+    def unlock(self, password):
+        """암호화된 데이터베이스의 데이터 키를 엽니다.
+
+        암호화하지 않는 데이터베이스이거나 키를 열었으면 True, 암호가 맞지 않으면 False를 반환합니다.
+        """
+        if not self.encrypted or self.cipher is not None:
+            return True
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS students (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    phone TEXT,
-                    gender TEXT,
-                    birth_date TEXT,
-                    guardian_phone1 TEXT,
-                    guardian_phone2 TEXT,
-                    memo TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                ''')
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS counseling_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id INTEGER,
-                    counsel_date TIMESTAMP NOT NULL,
-                    target TEXT NOT NULL,
-                    method TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
-                )
-                ''')
-                conn.commit()
-        except sqlite3.Error as e:
-            print(f"데이터베이스 생성 오류: {e}")
+                record = _load_key_record(conn)
+            data_key = unwrap_key(record, password)
+        except (sqlite3.Error, ImportError) as e:
+            logger.exception("암호화 키 열기 오류: %s", e)
+            return False
+        if data_key is None:
+            return False
+        self.cipher = FieldCipher(data_key)
+        return True
+
+    @traced(cat='db')
+    def enable_encryption(self, password, progress_callback=None):
+        """상담 내용과 학생 메모를 암호화합니다.
 
-    def update_schema(self):
-        """데이터 베이스 스키마 업데이트"""
+        새 데이터 키를 password로 감싸 저장하고, 기존 값을 EXPORT_BATCH_SIZE 행씩 암호화하여
+        하나의 트랜잭션 안에서 바꿉니다. 지운 평문이 파일에 남지 않도록 secure_delete를 켜고,
+        검색 색인을 비운 뒤 WAL 파일의 내용도 데이터베이스에 반영하여 비웁니다.
+        progress_callback(처리한 행 수, 전체 행 수)가 False를 반환하면 모두 되돌리고 False를 반환합니다.
+        """
+        if self.encrypted:
+            logger.warning("이미 암호화된 데이터베이스입니다.")
+            return False
+        if not is_available():
+            logger.warning("암호화에 필요한 cryptography 패키지가 설치되어 있지 않습니다.")
+            return False
+        targets = (('students', 'memo'), ('counseling_records', 'content'), ('counsel_drafts', 'content'))
+        data_key, record = create_data_key(password)
+        cipher = FieldCipher(data_key)
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("PRAGMA table_info(counseling_records)")
-                columns = [info[1] for info in cursor.fetchall()]
-                if 'category' not in columns:
-                    cursor.execute("ALTER TABLE counseling_records ADD COLUMN category TEXT")
+                conn.execute("PRAGMA secure_delete = ON")
+                try:
+                    total = sum(
+                        conn.execute(f"SELECT COUNT(*) FROM {table} WHERE typeof({column}) = 'text'").fetchone()[0]
+                        for table, column in targets
+                    )
+                    conn.execute(
+                        "INSERT INTO encryption_keys (id, salt, n, r, p, nonce, wrapped_key) VALUES (1, ?, ?, ?, ?, ?, ?)",
+                        record,
+                    )
+                    done = 0
+                    for table, column in targets:
+                        last_id = 0
+                        while True:
+                            rows = conn.execute(f'''
+                                SELECT id, {column} FROM {table}
+                                WHERE id > ? AND typeof({column}) = 'text'
+                                ORDER BY id LIMIT ?
+                            ''', (last_id, EXPORT_BATCH_SIZE)).fetchall()
+                            if not rows:
+                                break
+                            conn.executemany(
+                                f"UPDATE {table} SET {column} = ? WHERE id = ?",
+                                [(cipher.encrypt(value, column) if value else value, row_id) for row_id, value in rows],
+                            )
+                            last_id = rows[-1][0]
+                            done += len(rows)
+                            if progress_callback and progress_callback(done, total) is False:
+                                raise _OperationCancelled()
+                    # 암호화된 내용은 색인하지 않으므로 남은 색인(평문 토큰)을 모두 지움
+                    conn.execute("INSERT INTO counseling_records_fts(counseling_records_fts) VALUES ('delete-all')")
                     conn.commit()
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    conn.execute("PRAGMA secure_delete = OFF")
+        except _OperationCancelled:
+            return False
         except sqlite3.Error as e:
-            print(f"데이터베이스 스키마 업데이트 오류: {e}")
+            logger.exception("데이터베이스 암호화 오류: %s", e)
+            return False
+        self.encrypted = True
+        self.cipher = cipher
+        return True
+
+    @traced(cat='db')
+    def change_key_password(self, old_password, new_password):
+        """데이터 키를 새 암호로 다시 감쌉니다. (암호화된 값은 그대로 둠)
+
+        암호화하지 않는 데이터베이스이면 아무것도 하지 않고 True를 반환합니다.
+        """
+        if not self.encrypted:
+            return True
+        try:
+            with self.get_connection() as conn:
+                data_key = unwrap_key(_load_key_record(conn), old_password)
+                if data_key is None:
+                    logger.warning("기존 암호로 암호화 키를 열 수 없습니다.")
+                    return False
+                conn.execute(
+                    "UPDATE encryption_keys SET salt = ?, n = ?, r = ?, p = ?, nonce = ?, wrapped_key = ?",
+                    wrap_key(data_key, new_password),
+                )
+                conn.commit()
+            return True
+        except (sqlite3.Error, ImportError) as e:
+            logger.exception("암호화 키 변경 오류: %s", e)
+            return False
 
+    @traced(cat='db')
     def add_student(self, name, info=None):
-        """학생 추가"""
+        """학생 추가. 추가된 학생의 id를 반환합니다."""
         if info is None:
             info = {}
         
@@ -249,7 +550,7 @@ class Database:
             info.get('생년월일', ''),
             info.get('보호자 연락처1', ''),
             info.get('보호자 연락처2', ''),
-            info.get('메모', '')
+            self._seal(info.get('메모', ''), 'memo')
         )
         
         try:
@@ -257,18 +558,19 @@ class Database:
                 cursor = conn.cursor()
                 cursor.execute(sql, params)
                 conn.commit()
-            return True
+            return cursor.lastrowid
         except sqlite3.IntegrityError: # 중복된 이름
             return False
         except sqlite3.Error as e:
-            print(f"학생 추가 오류: {e}")
+            logger.exception("학생 추가 오류: %s", e)
             return False
 
+    @traced(cat='db')
     def update_student(self, student_id, info):
         """학생 정보 업데이트"""
         updated_name = info.get('이름')
         if not updated_name:
-            print("학생 이름은 비워둘 수 없습니다.")
+            logger.warning("학생 이름은 비워둘 수 없습니다.")
             return False
 
         sql = '''
@@ -290,7 +592,7 @@ class Database:
             info.get('생년월일', ''),
             info.get('보호자 연락처1', ''),
             info.get('보호자 연락처2', ''),
-            info.get('메모', ''),
+            self._seal(info.get('메모', ''), 'memo'),
             student_id
         )
         
@@ -301,53 +603,27 @@ class Database:
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.IntegrityError:
-            print(f"학생 정보 업데이트 오류: 이름 '{updated_name}'이(가) 이미 존재합니다.")
+            logger.warning("학생 정보 업데이트 오류: 같은 이름의 학생이 이미 있습니다.")
             return False
         except sqlite3.Error as e:
-            print(f"학생 정보 업데이트 오류: {e}")
+            logger.exception("학생 정보 업데이트 오류: %s", e)
             return False
 
-    def delete_student(self, name):
+    @traced(cat='db')
+    def delete_student(self, student_id):
         """학생 삭제. ON DELETE CASCADE로 상담기록도 자동 삭제됨."""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM students WHERE name = ?', (name,))
+                cursor.execute('DELETE FROM students WHERE id = ?', (student_id,))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"학생 삭제 오류: {e}")
+            logger.exception("학생 삭제 오류: %s", e)
             return False
 
-    def get_student(self, name):
-        """학생 정보 조회 (id 포함)"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, name, phone, gender, birth_date, 
-                           guardian_phone1, guardian_phone2, memo
-                    FROM students WHERE name = ?
-                ''', (name,))
-                row = cursor.fetchone()
-
-            if row:
-                return {
-                    'id': row[0],
-                    '이름': row[1],
-                    '연락처': row[2],
-                    '성별': row[3],
-                    '생년월일': row[4],
-                    '보호자 연락처1': row[5],
-                    '보호자 연락처2': row[6],
-                    '메모': row[7]
-                }
-            return None
-        except sqlite3.Error as e:
-            print(f"학생 정보 조회 오류: {e}")
-            return None
-
-    def get_student_by_id(self, student_id):
+    @traced(cat='db')
+    def get_student(self, student_id):
         """ID로 학생 정보 조회"""
         try:
             with self.get_connection() as conn:
@@ -368,104 +644,109 @@ class Database:
                     '생년월일': row[4],
                     '보호자 연락처1': row[5],
                     '보호자 연락처2': row[6],
-                    '메모': row[7]
-                }
-            return None
-        except sqlite3.Error as e:
-            print(f"학생 정보 조회 오류: {e}")
-            return None
-
-    def get_student_by_name(self, name):
-        """이름으로 학생 정보 조회 (id 포함)"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, name, phone, gender, birth_date, 
-                           guardian_phone1, guardian_phone2, memo
-                    FROM students WHERE name = ?
-                ''', (name,))
-                row = cursor.fetchone()
-
-            if row:
-                return {
-                    'id': row[0],
-                    '이름': row[1],
-                    '연락처': row[2],
-                    '성별': row[3],
-                    '생년월일': row[4],
-                    '보호자 연락처1': row[5],
-                    '보호자 연락처2': row[6],
-                    '메모': row[7]
+                    '메모': self._unseal(row[7], 'memo')
                 }
             return None
         except sqlite3.Error as e:
-            print(f"학생 정보 조회 오류: {e}")
+            logger.exception("학생 정보 조회 오류: %s", e)
             return None
 
+    @traced(cat='db')
     def get_all_students(self):
-        """모든 학생 목록 조회 (이름만)"""
+        """모든 학생 목록 조회 ((id, 이름) 목록)"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT name FROM students ORDER BY name')
-                return [row[0] for row in cursor.fetchall()]
+                cursor.execute('SELECT id, name FROM students ORDER BY name')
+                return cursor.fetchall()
         except sqlite3.Error as e:
-            print(f"모든 학생 목록 조회 오류: {e}")
+            logger.exception("모든 학생 목록 조회 오류: %s", e)
             return []
 
-    def add_counsel_record(self, student_name, record):
-        """상담 기록 추가"""
+    @traced(cat='db')
+    def add_counsel_record(self, student_id, record):
+        """상담 기록 추가. 학생이 없으면 아무것도 추가하지 않고 False를 반환합니다."""
+        sql = '''
+            INSERT INTO counseling_records (
+                student_id, counsel_date, target, method, category, content
+            ) SELECT id, ?, ?, ?, ?, ? FROM students WHERE id = ?
+        '''
+        params = (
+            record['일시'],
+            record['대상'],
+            record['방법'],
+            record['분류'],
+            self._seal(record['내용'], 'content'),
+            student_id
+        )
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT id FROM students WHERE name = ?', (student_name,))
-                student_id_row = cursor.fetchone()
-                
-                if student_id_row:
-                    student_id = student_id_row[0]
-                    sql = '''
-                        INSERT INTO counseling_records (
-                            student_id, counsel_date, target, method, category, content
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                    '''
-                    params = (
-                        student_id,
-                        record['일시'],
-                        record['대상'],
-                        record['방법'],
-                        record['분류'],
-                        record['내용']
-                    )
-                    cursor.execute(sql, params)
-                    conn.commit()
-                    return True
-                return False
+                cursor.execute(sql, params)
+                conn.commit()
+                return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"상담 기록 추가 오류: {e}")
+            logger.exception("상담 기록 추가 오류: %s", e)
             return False
 
-    def get_counsel_records(self, student_name):
+    @traced(cat='db')
+    def get_counsel_records(self, student_id):
         """학생의 상담 기록 조회 (ID 포함)"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
-                    SELECT cr.id, counsel_date, target, method, category, content
-                    FROM counseling_records cr
-                    JOIN students s ON cr.student_id = s.id
-                    WHERE s.name = ?
+                    SELECT id, counsel_date, target, method, category, content
+                    FROM counseling_records
+                    WHERE student_id = ?
                     ORDER BY counsel_date DESC
-                ''', (student_name,))
+                ''', (student_id,))
                 
                 return [{
                     'id': row[0], '일시': row[1], '대상': row[2],
-                    '방법': row[3], '분류': row[4], '내용': row[5]
+                    '방법': row[3], '분류': row[4], '내용': self._unseal(row[5], 'content')
                 } for row in cursor.fetchall()]
         except sqlite3.Error as e:
-            print(f"상담 기록 조회 오류: {e}")
+            logger.exception("상담 기록 조회 오류: %s", e)
             return []
 
+    @traced(cat='db')
+    def get_counsel_record_page(self, student_id, after=None, limit=COUNSEL_PAGE_SIZE):
+        """학생의 상담 기록 요약을 최신순으로 한 페이지 조회
+
+        after는 이전 페이지 마지막 기록의 (일시, id)이며 None이면 첫 페이지를 조회합니다.
+        내용은 앞부분(COUNSEL_PREVIEW_LENGTH자)만 '미리보기'로 반환합니다.
+        암호화된 내용은 목록에서 복호화하지 않고 ENCRYPTED_PLACEHOLDER를 미리보기로 반환합니다.
+        (기록 목록, 다음 페이지 존재 여부)를 반환합니다.
+        """
+        sql = '''
+            SELECT id, counsel_date, target, method, category,
+                   CASE WHEN typeof(content) = 'text' THEN substr(content, 1, ?) END
+            FROM counseling_records
+            WHERE student_id = ?
+        '''
+        params = [COUNSEL_PREVIEW_LENGTH, student_id]
+        if after is not None:
+            # (일시 내림차순, id 오름차순)은 (student_id, counsel_date DESC) 인덱스 순서와 같음
+            # 앞의 counsel_date <= ? 조건은 인덱스 범위 검색을 위한 것
+            sql += ' AND counsel_date <= ? AND (counsel_date < ? OR (counsel_date = ? AND id > ?))'
+            params += [after[0], after[0], after[0], after[1]]
+        sql += ' ORDER BY counsel_date DESC, id LIMIT ?'
+        params.append(limit + 1)
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            records = [{
+                'id': row[0], '일시': row[1], '대상': row[2],
+                '방법': row[3], '분류': row[4],
+                '미리보기': ' '.join(row[5].split()) if row[5] is not None else ENCRYPTED_PLACEHOLDER
+            } for row in rows[:limit]]
+            return records, len(rows) > limit
+        except sqlite3.Error as e:
+            logger.exception("상담 기록 조회 오류: %s", e)
+            return [], False
+
+    @traced(cat='db')
     def get_counsel_record(self, record_id):
         """ID로 특정 상담 기록 조회"""
         try:
@@ -484,13 +765,138 @@ class Database:
                     '대상': row[2],
                     '방법': row[3],
                     '분류': row[4],
-                    '내용': row[5]
+                    '내용': self._unseal(row[5], 'content')
                 }
             return None
         except sqlite3.Error as e:
-            print(f"특정 상담 기록 조회 오류: {e}")
+            logger.exception("특정 상담 기록 조회 오류: %s", e)
+            return None
+
+    @traced(cat='db')
+    def search_records(self, query, filters=None, limit=SEARCH_LIMIT, offset=0):
+        """상담 내용 전문 검색
+
+        공백으로 나눈 검색어를 모두 포함하는 기록을 관련도순으로 반환합니다.
+        filters는 '분류', '대상', '방법', '시작일', '종료일'(yyyy-MM-dd) 키로 결과를 좁힙니다.
+        trigram 색인은 세 글자 이상만 찾을 수 있으므로 더 짧은 검색어는 LIKE로 거릅니다.
+        암호화된 데이터베이스는 색인이 없으므로 _search_encrypted로 찾습니다.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        filters = filters or {}
+        try:
+            with self.get_connection() as conn:
+                if self.encrypted:
+                    return self._search_encrypted(conn, terms, filters, limit, offset)
+                if self._fts_trigram is None:
+                    row = conn.execute(
+                        "SELECT sql FROM sqlite_master WHERE name = 'counseling_records_fts'"
+                    ).fetchone()
+                    self._fts_trigram = bool(row) and 'trigram' in row[0]
+                min_length = 3 if self._fts_trigram else 1
+                indexed = [t for t in terms if len(t) >= min_length]
+                scanned = [t for t in terms if len(t) < min_length]
+
+                where, params = [], []
+                if indexed:
+                    source = 'counseling_records_fts JOIN counseling_records cr ON cr.id = counseling_records_fts.rowid'
+                    snippet = "snippet(counseling_records_fts, 0, '[', ']', '…', 48)"
+                    select_params = []
+                    where.append('counseling_records_fts MATCH ?')
+                    params.append(' '.join(_fts_phrase(t, prefix=not self._fts_trigram) for t in indexed))
+                    order = 'rank'
+                else:
+                    source = 'counseling_records cr'
+                    snippet = 'substr(cr.content, max(1, instr(cr.content, ?) - 20), 60)'
+                    select_params = [scanned[0]]
+                    order = 'cr.counsel_date DESC'
+                for term in scanned:
+                    where.append("cr.content LIKE ? ESCAPE '\\'")
+                    params.append(_like_pattern(term))
+                filter_where, filter_params = _filter_clauses(filters)
+                where += filter_where
+                params += filter_params
+
+                rows = conn.execute(f'''
+                    SELECT cr.id, s.id, s.name, cr.counsel_date, cr.category, {snippet}
+                    FROM {source}
+                    JOIN students s ON cr.student_id = s.id
+                    WHERE {' AND '.join(where) if where else '1'}
+                    ORDER BY {order}
+                    LIMIT ? OFFSET ?
+                ''', select_params + params + [limit, offset]).fetchall()
+            return [{
+                'id': row[0], 'student_id': row[1], '이름': row[2],
+                '일시': row[3], '분류': row[4], '스니펫': ' '.join(row[5].split())
+            } for row in rows]
+        except (sqlite3.Error, ValueError) as e:
+            logger.exception("상담 기록 검색 오류: %s", e)
+            return []
+
+    def _search_encrypted(self, conn, terms, filters, limit, offset):
+        """암호화된 상담 내용을 최신순으로 복호화하며 검색어를 모두 포함하는 기록을 찾습니다.
+
+        분류와 날짜 등의 조건은 SQL에서 먼저 거르고, 결과가 limit개 모이면 더 읽지 않습니다.
+        (대소문자는 구분하지 않으며, 관련도 대신 최신순으로 정렬됩니다.)
+        """
+        where, params = _filter_clauses(filters)
+        cursor = conn.execute(f'''
+            SELECT cr.id, s.id, s.name, cr.counsel_date, cr.category, cr.content
+            FROM counseling_records cr
+            JOIN students s ON cr.student_id = s.id
+            WHERE {' AND '.join(where) if where else '1'}
+            ORDER BY cr.counsel_date DESC
+        ''', params)
+        terms = [term.lower() for term in terms]
+        results = []
+        skipped = 0
+        for rows in _iter_batches(cursor):
+            for record_id, student_id, name, counsel_date, category, content in rows:
+                content = self._unseal(content, 'content')
+                lowered = content.lower()
+                if not all(term in lowered or term in category.lower() for term in terms):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                start = max(0, lowered.find(terms[0]) - 20)
+                results.append({
+                    'id': record_id, 'student_id': student_id, '이름': name,
+                    '일시': counsel_date, '분류': category, '스니펫': ' '.join(content[start:start + 60].split())
+                })
+                if len(results) >= limit:
+                    return results
+        return results
+
+    @traced(cat='db')
+    def get_statistics(self, school_year=None, group_by='category'):
+        """학년도의 상담 건수를 group_by 항목별로 집계합니다.
+
+        group_by는 STATISTICS_GROUPS의 항목 하나나 여러 항목의 튜플이며, (항목 값..., 건수) 튜플 목록을
+        반환합니다. 첫 항목이 월이나 학년도이면 시간순, 아니면 건수가 많은 순으로 정렬됩니다.
+        school_year가 None이면 모든 학년도를 합칩니다. 상담 기록 대신 트리거가 유지하는
+        counseling_stats 요약 테이블만 읽습니다. 오류가 나면 None을 반환합니다.
+        """
+        columns = (group_by,) if isinstance(group_by, str) else tuple(group_by)
+        if not columns or any(column not in STATISTICS_GROUPS for column in columns):
+            raise ValueError(f"알 수 없는 통계 항목입니다: {group_by}")
+        keys = ', '.join(columns)
+        order = keys if columns[0] in ('school_year', 'month') else f'{len(columns) + 1} DESC, {keys}'
+        where, params = ('WHERE school_year = ?', (school_year,)) if school_year is not None else ('', ())
+        try:
+            with self.get_connection() as conn:
+                return conn.execute(f'''
+                    SELECT {keys}, SUM(count) FROM counseling_stats
+                    {where}
+                    GROUP BY {keys}
+                    ORDER BY {order}
+                ''', params).fetchall()
+        except sqlite3.Error as e:
+            logger.exception("상담 통계 조회 오류: %s", e)
             return None
 
+    @traced(cat='db')
     def update_counsel_record(self, record_id, record_data):
         """상담 기록 업데이트"""
         sql = '''
@@ -503,19 +909,22 @@ class Database:
             record_data['대상'],
             record_data['방법'],
             record_data['분류'],
-            record_data['내용'],
+            self._seal(record_data['내용'], 'content'),
             record_id
         )
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, params)
+                # 수정 내용이 저장되었으므로 이 기록의 임시 저장은 함께 지움
+                cursor.execute("DELETE FROM counsel_drafts WHERE record_id = ?", (record_id,))
                 conn.commit()
                 return True
         except sqlite3.Error as e:
-            print(f"상담 기록 업데이트 오류: {e}")
+            logger.exception("상담 기록 업데이트 오류: %s", e)
             return False
 
+    @traced(cat='db')
     def delete_counsel_record_by_id(self, record_id):
         """ID로 상담 기록 삭제"""
         try:
@@ -525,46 +934,270 @@ class Database:
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"ID로 상담 기록 삭제 오류: {e}")
+            logger.exception("ID로 상담 기록 삭제 오류: %s", e)
             return False
-    
-    def import_csv_to_students(self, csv_path):
-        required_columns = ["이름", "연락처", "성별", "생년월일", "보호자 연락처1", "보호자 연락처2", "메모"]
-        names_seen = set()
-        rows_to_insert = []
+
+    # --- 상담 내용 임시 저장 ---
+    @traced(cat='db')
+    def save_draft(self, draft, record_id=None):
+        """작성 중인 상담 내용을 임시 저장합니다. (같은 기록의 이전 임시 저장을 덮어씀)
+
+        record_id가 None이면 상담 기록 탭의 새 기록, 아니면 그 기록의 수정 내용입니다.
+        draft는 '학생', '일시', '대상', '방법', '분류', '내용' 키를 가진 딕셔너리입니다.
+        """
         try:
+            params = (
+                _draft_key(record_id), record_id, draft.get('학생', ''), draft['일시'], draft['대상'],
+                draft['방법'], draft['분류'], self._seal(draft['내용'], 'content'),
+            )
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                with open(csv_path, 'r', encoding=detect_encoding(csv_path)) as csvfile:
-                    reader = csv.reader(csvfile)
-                    try:
-                        header = next(reader)
-                    except StopIteration:
-                        print(f"빈 파일 입니다.")
-                        return False
-                    if header and header[0].startswith('\ufeff'):
-                        header[0] = header[0].replace('\ufeff', '')
-                    if header != required_columns:
-                        print(f"CSV 파일의 헤더가 올바르지 않습니다. 필요한 열: {', '.join(required_columns)}")
-                        return False
-                    for i, row in enumerate(reader, start=2):
-                        if len(row) != len(required_columns):
-                            print(f"CSV 파일의 {i}번째 행에 열의 수가 올바르지 않습니다.")
-                            return False
-                        name = row[0].strip()
-                        if not name:
-                            print(f"CSV 파일의 {i}번째 행에 이름이 비어 있습니다.")
-                            return False
-                        if name in names_seen:
-                            print(f"CSV 파일의 {i}번째 행에 중복된 이름이 있습니다: {name}")
-                            return False
-                        names_seen.add(name)
-                        rows_to_insert.append(row)
-                    cursor.executemany('''
-                        INSERT INTO students (name, phone, gender, birth_date, guardian_phone1, guardian_phone2, memo) VALUES (?, ?, ?, ?, ?, ?, ?);
-                    ''', rows_to_insert)
-                    conn.commit()
-                    return True
+                conn.execute('''
+                    INSERT INTO counsel_drafts
+                        (draft_key, record_id, student_name, counsel_date, target, method, category, content)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (draft_key) DO UPDATE SET
+                        student_name = excluded.student_name, counsel_date = excluded.counsel_date,
+                        target = excluded.target, method = excluded.method, category = excluded.category,
+                        content = excluded.content, updated_at = datetime('now', 'localtime')
+                ''', params)
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.exception("상담 내용 임시 저장 오류: %s", e)
+            return False
+
+    @traced(cat='db')
+    def delete_draft(self, record_id=None):
+        """임시 저장을 지웁니다. (record_id의 의미는 save_draft와 같음)"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute("DELETE FROM counsel_drafts WHERE draft_key = ?", (_draft_key(record_id),))
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.exception("임시 저장 삭제 오류: %s", e)
+            return False
+
+    @traced(cat='db')
+    def get_drafts(self):
+        """남아 있는 임시 저장 목록을 반환합니다. (record_id가 None인 항목이 상담 기록 탭의 새 기록)
+
+        데이터 키가 열리지 않아 복호화할 수 없는 항목은 지우지 않고 목록에서만 뺍니다.
+        """
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute('''
+                    SELECT record_id, student_name, counsel_date, target, method, category, content, updated_at
+                    FROM counsel_drafts ORDER BY updated_at
+                ''').fetchall()
+            return [{
+                'record_id': row[0], '학생': row[1] or '', '일시': row[2], '대상': row[3], '방법': row[4],
+                '분류': row[5], '내용': self._unseal(row[6], 'content'), '저장일시': (row[7] or '')[:16],
+            } for row in rows if not (isinstance(row[6], bytes) and self.cipher is None)]
+        except (sqlite3.Error, ValueError) as e:
+            logger.exception("임시 저장 조회 오류: %s", e)
+            return None
+    
+    @traced(cat='db')
+    def import_csv_to_students(self, csv_path, progress_callback=None, errors=None):
+        """학생 정보 CSV 파일을 가져옵니다.
+
+        파일은 한 번만 열어 앞부분으로 인코딩을 판별한 뒤, 행을 IMPORT_BATCH_SIZE개씩 검사해
+        하나의 트랜잭션 안에서 추가합니다. 잘못된 행이 하나라도 있으면 전체를 되돌리고 False를 반환하며,
+        행별 오류 메시지는 errors 목록에 (최대 IMPORT_MAX_ERRORS개) 추가됩니다.
+        progress_callback(읽은 바이트 수, 파일 크기)가 False를 반환하면 가져오기를 중단합니다.
+        """
+        if errors is None:
+            errors = []
+        error_count = 0
+
+        def add_error(message):
+            nonlocal error_count
+            error_count += 1
+            if error_count <= IMPORT_MAX_ERRORS:
+                errors.append(message)
+
+        insert_sql = '''
+            INSERT INTO students (name, phone, gender, birth_date, guardian_phone1, guardian_phone2, memo)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        '''
+        try:
+            with self.get_connection() as conn, open(csv_path, 'rb') as raw:
+                total = os.fstat(raw.fileno()).st_size
+                reader = csv.reader(io.TextIOWrapper(raw, encoding=sniff_encoding(raw), newline=''))
+                header = next(reader, None)
+                if header is None:
+                    errors.append("빈 파일입니다.")
+                    return False
+                if header and header[0].startswith('\ufeff'):
+                    header[0] = header[0].replace('\ufeff', '')
+                if header != STUDENT_CSV_COLUMNS:
+                    errors.append(f"CSV 파일의 헤더가 올바르지 않습니다. 필요한 열: {', '.join(STUDENT_CSV_COLUMNS)}")
+                    return False
+
+                registered = {name for (name,) in conn.execute('SELECT name FROM students')}
+                names_seen = {} # 이름 -> 파일의 행 번호
+                batch = []
+                for line_no, row in enumerate(reader, start=2):
+                    if len(row) != len(STUDENT_CSV_COLUMNS):
+                        add_error(f"{line_no}번째 행: 열의 수가 올바르지 않습니다.")
+                        continue
+                    name = row[0].strip()
+                    if not name:
+                        add_error(f"{line_no}번째 행: 이름이 비어 있습니다.")
+                        continue
+                    if name in registered:
+                        add_error(f"{line_no}번째 행: 이미 등록된 학생입니다: {name}")
+                        continue
+                    if name in names_seen:
+                        add_error(f"{line_no}번째 행: {names_seen[name]}번째 행과 이름이 같습니다: {name}")
+                        continue
+                    names_seen[name] = line_no
+                    row[0] = name
+                    row[6] = self._seal(row[6], 'memo')
+                    batch.append(row)
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        # 오류가 나온 뒤에는 어차피 되돌리므로 검사만 계속함
+                        if not error_count:
+                            conn.executemany(insert_sql, batch)
+                        batch = []
+                        if progress_callback and progress_callback(raw.tell(), total) is False:
+                            raise _OperationCancelled()
+
+                if error_count:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    if error_count > IMPORT_MAX_ERRORS:
+                        errors.append(f"그 밖에 {error_count - IMPORT_MAX_ERRORS}개 행에 오류가 더 있습니다.")
+                    return False
+                if batch:
+                    conn.executemany(insert_sql, batch)
+                conn.commit()
+                if progress_callback:
+                    progress_callback(total, total)
+                return True
+        except _OperationCancelled:
+            return False
+        except (UnicodeDecodeError, ValueError) as e:
+            logger.exception("학생 정보 CSV 가져오기 오류: %s", e)
+            errors.append(f"파일 인코딩을 읽을 수 없습니다: {e}")
+            return False
+        except (OSError, csv.Error) as e:
+            logger.exception("학생 정보 CSV 가져오기 오류: %s", e)
+            errors.append(f"CSV 파일 읽기 오류: {e}")
+            return False
         except sqlite3.Error as e:
-            print(f"CSV 파일 읽기 오류: {e}")
-            return False
\ No newline at end of file
+            logger.exception("CSV 파일 읽기 오류: %s", e)
+            errors.append(f"데이터베이스 오류: {e}")
+            return False
+
+    @traced(cat='db')
+    def import_counseling_records(self, csv_path, dry_run=False, progress_callback=None, errors=None):
+        """상담 기록 CSV 파일(export_counseling_to_csv 형식)을 가져옵니다.
+
+        학생 이름은 미리 읽어 둔 이름 -> id 사전으로 찾고, 행은 IMPORT_BATCH_SIZE개씩
+        묶음마다 하나의 트랜잭션으로 추가합니다. 잘못된 행은 건너뛰고 errors 목록에
+        (최대 IMPORT_MAX_ERRORS개) 추가하며, 이미 있는 기록(같은 학생, 일시, 내용)은 추가하지 않습니다.
+        암호화된 데이터베이스에서는 기존 기록의 내용을 복호화해 두고 파이썬에서 중복을 확인합니다.
+        dry_run이 True이면 검사만 하고 아무것도 추가하지 않습니다.
+        progress_callback(읽은 바이트 수, 파일 크기)가 False를 반환하면 가져오기를 중단합니다.
+        (이미 커밋된 묶음은 남으며, 다시 가져오면 이어서 추가됩니다.)
+
+        {'valid': 올바른 행 수, 'added': 추가한 행 수, 'invalid': 잘못된 행 수}를 반환하며,
+        파일을 읽을 수 없거나 중단되면 None을 반환합니다.
+        """
+        if errors is None:
+            errors = []
+        summary = {'valid': 0, 'added': 0, 'invalid': 0}
+
+        def add_error(message):
+            summary['invalid'] += 1
+            if summary['invalid'] <= IMPORT_MAX_ERRORS:
+                errors.append(message)
+
+        try:
+            with self.get_connection() as conn, open(csv_path, 'rb') as raw:
+                total = os.fstat(raw.fileno()).st_size
+                reader = csv.reader(io.TextIOWrapper(raw, encoding=sniff_encoding(raw), newline=''))
+                header = next(reader, None)
+                if header is None:
+                    errors.append("빈 파일입니다.")
+                    return None
+                if header and header[0].startswith('\ufeff'):
+                    header[0] = header[0].replace('\ufeff', '')
+                # 생성일시 열은 없어도 됨
+                if header not in (COUNSELING_CSV_COLUMNS, COUNSELING_CSV_COLUMNS[:-1]):
+                    errors.append(f"CSV 파일의 헤더가 올바르지 않습니다. 필요한 열: {', '.join(COUNSELING_CSV_COLUMNS)}")
+                    return None
+
+                student_ids = dict(conn.execute('SELECT name, id FROM students'))
+                existing = None # 암호화된 데이터베이스의 (학생 id, 일시, 내용) 집합
+                if self.encrypted and not dry_run:
+                    existing = {
+                        (student_id, counsel_date, self._unseal(content, 'content'))
+                        for student_id, counsel_date, content in conn.execute(
+                            'SELECT student_id, counsel_date, content FROM counseling_records'
+                        )
+                    }
+                batch = []
+
+                def flush():
+                    if not dry_run:
+                        query = COUNSELING_IMPORT_QUERY if existing is None else COUNSELING_INSERT_QUERY
+                        cursor = conn.executemany(query, batch)
+                        conn.commit()
+                        summary['added'] += cursor.rowcount
+                    batch.clear()
+
+                for line_no, row in enumerate(reader, start=2):
+                    if len(row) == len(COUNSELING_CSV_COLUMNS) - 1:
+                        row.append('')
+                    if len(row) != len(COUNSELING_CSV_COLUMNS):
+                        add_error(f"{line_no}번째 행: 열의 수가 올바르지 않습니다.")
+                        continue
+                    name, counsel_date, target, method, category, content, created_at = row
+                    student_id = student_ids.get(name.strip())
+                    if student_id is None:
+                        add_error(f"{line_no}번째 행: 등록되지 않은 학생입니다: {name}")
+                        continue
+                    counsel_date = counsel_date.strip()
+                    if not COUNSEL_DATE_PATTERN.fullmatch(counsel_date):
+                        add_error(f"{line_no}번째 행: 상담일시는 yyyy-MM-dd HH:mm 형식이어야 합니다: {counsel_date}")
+                        continue
+                    if not content.strip():
+                        add_error(f"{line_no}번째 행: 상담내용이 비어 있습니다.")
+                        continue
+                    summary['valid'] += 1
+                    if existing is None:
+                        batch.append((student_id, counsel_date, target, method, category, content, created_at.strip(),
+                                      student_id, counsel_date, content))
+                    elif (student_id, counsel_date, content) not in existing:
+                        existing.add((student_id, counsel_date, content))
+                        batch.append((student_id, counsel_date, target, method, category,
+                                      self._seal(content, 'content'), created_at.strip()))
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        flush()
+                        if progress_callback and progress_callback(raw.tell(), total) is False:
+                            raise _OperationCancelled()
+                if batch:
+                    flush()
+                if progress_callback:
+                    progress_callback(total, total)
+
+            if summary['invalid'] > IMPORT_MAX_ERRORS:
+                errors.append(f"그 밖에 {summary['invalid'] - IMPORT_MAX_ERRORS}개 행에 오류가 더 있습니다.")
+            return summary
+        except _OperationCancelled:
+            return None
+        except (UnicodeDecodeError, ValueError) as e:
+            logger.exception("상담 기록 가져오기 오류: %s", e)
+            errors.append(f"파일 인코딩을 읽을 수 없습니다: {e}")
+            return None
+        except (OSError, csv.Error) as e:
+            logger.exception("상담 기록 가져오기 오류: %s", e)
+            errors.append(f"CSV 파일 읽기 오류: {e}")
+            return None
+        except sqlite3.Error as e:
+            logger.exception("상담 기록 가져오기 오류: %s", e)
+            errors.append(f"데이터베이스 오류: {e}")
+            return None
@@ -1,193 +1,544 @@
 
 """데이터베이스 작업을 위한 워커 클래스"""
 
-from PySide6.QtCore import QObject, Signal, Slot
+import logging
+import threading
+from collections import OrderedDict
+from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt, QMetaObject
 from .database import Database
+from .config_manager import set_password
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+# 워커가 기억해 두는 최근 조회 학생 수
+STUDENT_CACHE_SIZE = 32
+
+
+class StudentCache:
+    """최근 조회한 학생의 정보와 상담 기록 첫 페이지를 보관하는 LRU 캐시
+
+    워커 스레드에서만 사용합니다. 상담 기록 id -> 학생 id 색인을 함께 유지해
+    기록을 수정/삭제할 때 해당 학생 항목만 무효화합니다.
+    """
+
+    def __init__(self, max_size=STUDENT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict() # 학생 id -> (정보, 기록 첫 페이지, 다음 페이지 존재 여부)
+        self._record_owner = {}       # 상담 기록 id -> 학생 id
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, student_id):
+        """캐시된 항목을 반환합니다. 없으면 None"""
+        entry = self._entries.get(student_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(student_id)
+        return entry
+
+    def put(self, student_id, info, records, has_more):
+        """항목을 저장하고 오래된 항목을 내보냅니다."""
+        self.evict(student_id)
+        self._entries[student_id] = (info, records, has_more)
+        for rec in records:
+            self._record_owner[rec['id']] = student_id
+        while len(self._entries) > self.max_size:
+            self.evict(next(iter(self._entries)))
+
+    def update_info(self, student_id, info):
+        """캐시된 학생 정보를 저장한 정보로 바꿉니다. (기록은 그대로 유지)
+
+        Database.update_student와 같이 빠진 항목은 빈 문자열로 저장된 것으로 봅니다.
+        """
+        entry = self._entries.get(student_id)
+        if entry is not None:
+            updated = {key: info.get(key, '') for key in entry[0]}
+            updated['id'] = student_id
+            self._entries[student_id] = (updated, entry[1], entry[2])
+
+    def evict(self, student_id):
+        """학생 항목을 제거합니다."""
+        entry = self._entries.pop(student_id, None)
+        if entry is not None:
+            for rec in entry[1]:
+                self._record_owner.pop(rec['id'], None)
+
+    def evict_record(self, record_id):
+        """상담 기록이 속한 학생 항목을 제거합니다.
+
+        첫 페이지에 없는 기록은 수정 후 첫 페이지로 옮겨질 수 있으므로 전체를 비웁니다.
+        """
+        student_id = self._record_owner.get(record_id)
+        if student_id is not None:
+            self.evict(student_id)
+        else:
+            self.clear()
+
+    def clear(self):
+        """모든 항목을 제거합니다."""
+        self._entries.clear()
+        self._record_owner.clear()
+
+    def stats(self):
+        """적중/실패 횟수와 현재 항목 수를 반환합니다."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def reset_stats(self):
+        """적중/실패 횟수를 0으로 되돌립니다."""
+        self.hits = 0
+        self.misses = 0
+
 
 class DatabaseWorker(QObject):
     """데이터베이스 작업을 백그라운드에서 처리하는 워커"""
+
+    # 요청으로 호출할 수 있는 작업 목록
+    OPERATIONS = frozenset({
+        'get_all_students', 'get_student_info_and_counsel', 'get_counsel_record_page', 'add_student', 'delete_student',
+        'update_student', 'add_counsel_record', 'get_counsel_record',
+        'update_counsel_record', 'delete_counsel_record_by_id', 'export_all_data', 'export_students_data',
+        'export_counseling_data', 'export_form_students_csv', 'export_counseling_data_for_neis',
+        'import_students_data', 'import_counseling_data', 'search_records', 'get_statistics',
+        'unlock', 'enable_encryption', 'change_password', 'get_diagnostics',
+        'save_draft', 'delete_draft', 'get_drafts',
+    })
     
-    # 작업 완료 후 결과를 메인 스레드로 보내는 시그널
-    students_ready = Signal(list)
-    student_info_ready = Signal(dict)
-    student_data_for_update_ready = Signal(dict)
-    counsel_records_ready = Signal(list)
-    counsel_record_ready = Signal(dict)
-    operation_success = Signal(str, object)  # 작업 종류와 결과 데이터를 전달
-    operation_error = Signal(str)
-    import_students_data_ready = Signal(str)
+    # 작업 완료 후 결과를 메인 스레드로 보내는 시그널 (첫 번째 인자는 요청 ID)
+    students_ready = Signal(int, list)
+    student_info_ready = Signal(int, dict)
+    counsel_records_ready = Signal(int, list, bool)  # 요청 ID, 상담 기록 요약 한 페이지, 다음 페이지 존재 여부
+    counsel_record_ready = Signal(int, dict)
+    search_results_ready = Signal(int, list)
+    statistics_ready = Signal(int, list)  # 요청 ID, (항목 값..., 건수) 튜플 목록
+    diagnostics_ready = Signal(int, dict)  # 요청 ID, SQL 실행 시간 통계와 캐시 통계
+    drafts_ready = Signal(int, list)       # 요청 ID, 남아 있는 임시 저장 목록
+    operation_success = Signal(int, str, object)  # 요청 ID, 작업 종류와 결과 데이터를 전달
+    operation_error = Signal(int, str)
+    operation_cancelled = Signal(int)
+    import_failed = Signal(int, str, list)  # 요청 ID, 오류 메시지, 행별 오류 목록
+    # 학생 목록 변경분 (목록 모델에 그대로 반영)
+    student_inserted = Signal(int, str)  # id, 이름
+    student_removed = Signal(int)        # id
+    student_renamed = Signal(int, str)   # id, 새 이름
+    progress_changed = Signal(int, int, int)  # 요청 ID, 처리한 행 수, 전체 행 수
+    encryption_status = Signal(bool, bool)    # 암호화된 데이터베이스인지, 데이터 키가 열렸는지
 
     def __init__(self):
         super().__init__()
-        self.db = Database()
+        self.db = None
+        self.request_id = 0
+        self.cache = StudentCache()
+        self._cancelled_ids = set()
+        self._last_finished_id = 0 # 처리를 마친 마지막 요청 ID (요청은 ID 순서대로 처리됨)
+        self._cancel_lock = threading.Lock()
+
+    def cancel_request(self, request_id):
+        """요청 취소를 표시합니다. 작업 중에도 확인할 수 있도록 다른 스레드에서 직접 호출합니다.
+
+        이미 처리를 마친 요청이면 표시하지 않습니다. (남은 ID가 쌓이지 않도록)
+        """
+        with self._cancel_lock:
+            if request_id > self._last_finished_id:
+                self._cancelled_ids.add(request_id)
+
+    def is_cancelled(self):
+        """현재 처리 중인 요청이 취소되었는지 확인"""
+        with self._cancel_lock:
+            return self.request_id in self._cancelled_ids
+
+    def report_progress(self, done, total):
+        """진행 상황을 알리고, 요청이 취소되었으면 False를 반환 (Database 진행 콜백)"""
+        self.progress_changed.emit(self.request_id, done, total)
+        return not self.is_cancelled()
+
+    def _finish_export(self, export, message, error_message):
+        """내보내기(export())를 실행하고 결과에 맞는 시그널을 보냅니다.
+
+        Database가 처리하지 않은 예외가 나도 진행률 대화상자가 닫히도록 operation_error를 보냅니다.
+        """
+        try:
+            succeeded = export()
+        except Exception as e:
+            logger.exception("%s %s", error_message, e)
+            self.operation_error.emit(self.request_id, f"{error_message}\n{e}")
+            return
+        if succeeded:
+            self.operation_success.emit(self.request_id, "export", message)
+        elif self.is_cancelled():
+            self.operation_cancelled.emit(self.request_id)
+        else:
+            self.operation_error.emit(self.request_id, error_message)
+
+    @Slot()
+    def open_database(self):
+        """워커 스레드에서 데이터베이스를 엽니다."""
+        if self.db is None:
+            # 느린 문장 로그와 동작 추적에 표시할 스레드 이름
+            threading.current_thread().name = 'DatabaseWorker'
+            self.db = Database()
+
+    @Slot(int, str, object)
+    def handle_request(self, request_id, operation, args):
+        """요청 ID와 함께 전달된 작업을 워커 스레드에서 실행"""
+        if operation not in self.OPERATIONS:
+            self.operation_error.emit(request_id, f"알 수 없는 작업입니다: {operation}")
+            return
+        self.open_database()
+        self.request_id = request_id
+        try:
+            with tracing.request_span(request_id, operation):
+                getattr(self, operation)(*args)
+        finally:
+            with self._cancel_lock:
+                self._cancelled_ids.discard(request_id)
+                self._last_finished_id = max(self._last_finished_id, request_id)
 
     @Slot()
     def get_all_students(self):
         """모든 학생 목록을 조회"""
         try:
             students = self.db.get_all_students()
-            self.students_ready.emit(students)
+            self.students_ready.emit(self.request_id, students)
         except Exception as e:
-            self.operation_error.emit(f"학생 목록 조회 실패: {e}")
+            self.operation_error.emit(self.request_id, f"학생 목록 조회 실패: {e}")
 
-    @Slot(str)
-    def get_student_info_and_counsel(self, student_name):
-        """특정 학생의 정보와 상담 기록을 조회"""
+    @Slot(int)
+    def get_student_info_and_counsel(self, student_id):
+        """특정 학생의 정보와 상담 기록 첫 페이지를 조회 (최근 조회한 학생은 캐시에서)"""
+        try:
+            entry = self.cache.get(student_id)
+            if entry is None:
+                info = self.db.get_student(student_id)
+                records, has_more = self.db.get_counsel_record_page(student_id)
+                if info:
+                    self.cache.put(student_id, info, records, has_more)
+            else:
+                info, records, has_more = entry
+            self.student_info_ready.emit(self.request_id, info or {})
+            self.counsel_records_ready.emit(self.request_id, records, has_more)
+        except Exception as e:
+            self.operation_error.emit(self.request_id, f"학생 정보 조회 실패: {e}")
+
+    @Slot(int, object)
+    def get_counsel_record_page(self, student_id, after):
+        """상담 기록 요약의 다음 페이지를 조회"""
         try:
-            info = self.db.get_student(student_name)
-            records = self.db.get_counsel_records(student_name)
-            self.student_info_ready.emit(info or {})
-            self.counsel_records_ready.emit(records or [])
+            records, has_more = self.db.get_counsel_record_page(student_id, after)
+            self.counsel_records_ready.emit(self.request_id, records, has_more)
         except Exception as e:
-            self.operation_error.emit(f"학생 정보 조회 실패: {e}")
+            self.operation_error.emit(self.request_id, f"상담 기록 조회 실패: {e}")
+
+    @Slot(str, dict)
+    def search_records(self, query, filters):
+        """상담 기록 전문 검색"""
+        try:
+            self.search_results_ready.emit(self.request_id, self.db.search_records(query, filters))
+        except Exception as e:
+            self.operation_error.emit(self.request_id, f"상담 기록 검색 실패: {e}")
+
+    @Slot(object, object)
+    def get_statistics(self, school_year, group_by):
+        """상담 통계 조회 (요약 테이블에서 집계)"""
+        try:
+            rows = self.db.get_statistics(school_year, group_by)
+            if rows is None:
+                self.operation_error.emit(self.request_id, "상담 통계 조회에 실패했습니다.")
+            else:
+                self.statistics_ready.emit(self.request_id, rows)
+        except Exception as e:
+            self.operation_error.emit(self.request_id, f"상담 통계 조회 실패: {e}")
+
+    @Slot(bool)
+    def get_diagnostics(self, reset=False):
+        """진단 정보 조회 (reset이면 SQL 실행 시간 기록과 캐시 통계를 지운 뒤 조회)"""
+        try:
+            if reset:
+                self.db.reset_query_stats()
+                self.cache.reset_stats()
+            self.diagnostics_ready.emit(self.request_id, {
+                'queries': self.db.get_query_stats(),
+                'cache': self.cache.stats(),
+            })
+        except Exception as e:
+            self.operation_error.emit(self.request_id, f"진단 정보 조회 실패: {e}")
 
     @Slot(str)
     def add_student(self, name):
-        """학생 추가"""
+        """학생 추가 (중복 이름은 UNIQUE 제약으로 거부됨)"""
         try:
-            if self.db.get_student_by_name(name): # Check if student already exists
-                self.operation_error.emit("이미 존재하는 학생입니다.")
-                return
-            if self.db.add_student(name):
-                self.operation_success.emit("add_student", name)
+            student_id = self.db.add_student(name)
+            if student_id:
+                self.student_inserted.emit(student_id, name)
+                self.operation_success.emit(self.request_id, "add_student", name)
             else:
-                self.operation_error.emit("학생 추가에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "학생 추가에 실패했습니다.\n같은 이름의 학생이 이미 있는지 확인하세요.")
         except Exception as e:
-            self.operation_error.emit(f"학생 추가 실패: {e}")
+            self.operation_error.emit(self.request_id, f"학생 추가 실패: {e}")
 
-    @Slot(str)
-    def delete_student(self, name):
+    @Slot(int)
+    def delete_student(self, student_id):
         """학생 삭제"""
         try:
-            if self.db.delete_student(name):
-                self.operation_success.emit("delete_student", name)
+            if self.db.delete_student(student_id):
+                self.cache.evict(student_id)
+                self.student_removed.emit(student_id)
+                self.operation_success.emit(self.request_id, "delete_student", student_id)
             else:
-                self.operation_error.emit("학생 삭제에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "학생 삭제에 실패했습니다.")
         except Exception as e:
-            self.operation_error.emit(f"학생 삭제 실패: {e}")
+            self.operation_error.emit(self.request_id, f"학생 삭제 실패: {e}")
 
     @Slot(int, dict)
     def update_student(self, student_id, info):
-        """학생 정보 업데이트"""
-        try:
-            # Check if student exists
-            existing_student = self.db.get_student_by_id(student_id)
-            if not existing_student:
-                self.operation_error.emit("학생 정보를 데이터베이스에서 찾을 수 없습니다.")
-                return
-
-            # Check if updated name already exists for another student
-            updated_name = info.get('이름')
-            if updated_name and updated_name != existing_student.get('이름'):
-                existing_same_name = self.db.get_student_by_name(updated_name)
-                if existing_same_name and existing_same_name['id'] != student_id:
-                    self.operation_error.emit(f"'{updated_name}' 학생은 이미 존재합니다.")
-                    return
-
-            update_result = self.db.update_student(student_id, info)
-            if update_result:
-                self.operation_success.emit("update_student", info)
+        """학생 정보 업데이트 (중복 이름은 UNIQUE 제약으로 거부됨)"""
+        try:
+            if self.db.update_student(student_id, info):
+                self.cache.update_info(student_id, info)
+                self.student_renamed.emit(student_id, info['이름'])
+                self.operation_success.emit(self.request_id, "update_student", info)
             else:
-                self.operation_error.emit("학생 정보 저장에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "학생 정보 저장에 실패했습니다.\n같은 이름의 학생이 이미 있는지 확인하세요.")
         except Exception as e:
-            self.operation_error.emit(f"학생 정보 저장 실패: {e}")
+            self.operation_error.emit(self.request_id, f"학생 정보 저장 실패: {e}")
 
-    @Slot(str, dict)
-    def add_counsel_record(self, name, record):
+    @Slot(int, dict)
+    def add_counsel_record(self, student_id, record):
         """상담 기록 추가"""
         try:
-            if not self.db.get_student_by_name(name):
-                self.operation_error.emit("학생 이름이 존재하지 않습니다. 정확한 이름을 입력하세요.")
-                return
-            if self.db.add_counsel_record(name, record):
-                self.operation_success.emit("add_counsel_record", record)
+            if self.db.add_counsel_record(student_id, record):
+                self.cache.evict(student_id)
+                self.operation_success.emit(self.request_id, "add_counsel_record", student_id)
             else:
-                self.operation_error.emit("상담 기록 추가에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "상담 기록 추가에 실패했습니다.\n학생 목록에 있는 이름인지 확인하세요.")
         except Exception as e:
-            self.operation_error.emit(f"상담 기록 추가 실패: {e}")
+            self.operation_error.emit(self.request_id, f"상담 기록 추가 실패: {e}")
 
     @Slot(int)
     def get_counsel_record(self, record_id):
         """특정 상담 기록 조회"""
         try:
             record = self.db.get_counsel_record(record_id)
-            self.counsel_record_ready.emit(record or {})
+            self.counsel_record_ready.emit(self.request_id, record or {})
         except Exception as e:
-            self.operation_error.emit(f"상담 기록 조회 실패: {e}")
-            
-    @Slot(str)
-    def get_student_by_name_for_update(self, student_name):
-        """학생 이름으로 학생 정보 조회 (업데이트용)"""
-        try:
-            student_data = self.db.get_student(student_name)
-            self.student_data_for_update_ready.emit(student_data or {})
-        except Exception as e:
-            self.operation_error.emit(f"학생 정보 조회 실패: {e}")
+            self.operation_error.emit(self.request_id, f"상담 기록 조회 실패: {e}")
             
     @Slot(int, dict)
     def update_counsel_record(self, record_id, data):
         """상담 기록 수정"""
         try:
             if self.db.update_counsel_record(record_id, data):
-                self.operation_success.emit("update_counsel_record", data)
+                self.cache.evict_record(record_id)
+                self.operation_success.emit(self.request_id, "update_counsel_record", data)
             else:
-                self.operation_error.emit("상담기록 수정에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "상담기록 수정에 실패했습니다.")
+        except Exception as e:
+            self.operation_error.emit(self.request_id, f"상담기록 수정 실패: {e}")
+
+    # 임시 저장은 입력 중에 자동으로 요청되므로 실패해도 오류 대화상자를 띄우지 않고 로그에만 기록
+    @Slot(object, dict)
+    def save_draft(self, record_id, draft):
+        """작성 중인 상담 내용 임시 저장"""
+        try:
+            self.db.save_draft(draft, record_id)
         except Exception as e:
-            self.operation_error.emit(f"상담기록 수정 실패: {e}")
+            logger.exception("임시 저장 실패: %s", e)
+
+    @Slot(object)
+    def delete_draft(self, record_id):
+        """임시 저장 삭제"""
+        try:
+            self.db.delete_draft(record_id)
+        except Exception as e:
+            logger.exception("임시 저장 삭제 실패: %s", e)
+
+    @Slot()
+    def get_drafts(self):
+        """남아 있는 임시 저장 조회 (프로그램 시작 시 복원)"""
+        try:
+            drafts = self.db.get_drafts()
+        except Exception as e:
+            logger.exception("임시 저장 조회 실패: %s", e)
+            drafts = None
+        if drafts is None:
+            self.operation_error.emit(self.request_id, "저장하지 않고 종료된 상담 내용을 불러오지 못했습니다.")
+        elif drafts:
+            self.drafts_ready.emit(self.request_id, drafts)
 
     @Slot(int)
     def delete_counsel_record_by_id(self, record_id):
         """상담 기록 ID로 삭제"""
         try:
             if self.db.delete_counsel_record_by_id(record_id):
-                self.operation_success.emit("delete_counsel_record", record_id)
+                self.cache.evict_record(record_id)
+                self.operation_success.emit(self.request_id, "delete_counsel_record", record_id)
             else:
-                self.operation_error.emit("상담기록 삭제에 실패했습니다.")
+                self.operation_error.emit(self.request_id, "상담기록 삭제에 실패했습니다.")
         except Exception as e:
-            self.operation_error.emit(f"상담기록 삭제 실패: {e}")
+            self.operation_error.emit(self.request_id, f"상담기록 삭제 실패: {e}")
 
     @Slot(str)
     def export_all_data(self, file_path):
-        if self.db.export_to_csv(file_path):
-            self.operation_success.emit("export", f"전체 데이터가 성공적으로 내보내졌습니다.\n저장 위치: {file_path}")
-        else:
-            self.operation_error.emit("데이터 내보내기에 실패했습니다.")
+        self._finish_export(
+            lambda: self.db.export_to_csv(file_path, progress_callback=self.report_progress),
+            f"전체 데이터가 성공적으로 내보내졌습니다.\n저장 위치: {file_path}",
+            "데이터 내보내기에 실패했습니다.",
+        )
 
     @Slot(str)
     def export_students_data(self, file_path):
-        if self.db.export_students_to_csv(file_path):
-            self.operation_success.emit("export", f"학생 정보가 성공적으로 내보내졌습니다.\n저장 위치: {file_path}")
-        else:
-            self.operation_error.emit("학생 정보 내보내기에 실패했습니다.")
+        self._finish_export(
+            lambda: self.db.export_students_to_csv(file_path, progress_callback=self.report_progress),
+            f"학생 정보가 성공적으로 내보내졌습니다.\n저장 위치: {file_path}",
+            "학생 정보 내보내기에 실패했습니다.",
+        )
 
     @Slot(str)
     def export_counseling_data(self, file_path):
-        if self.db.export_counseling_to_csv(file_path):
-            self.operation_success.emit("export", f"상담 기록이 성공적으로 내보내졌습니다.\n저장 위치: {file_path}")
-        else:
-            self.operation_error.emit("상담 기록 내보내기에 실패했습니다.")
+        self._finish_export(
+            lambda: self.db.export_counseling_to_csv(file_path, progress_callback=self.report_progress),
+            f"상담 기록이 성공적으로 내보내졌습니다.\n저장 위치: {file_path}",
+            "상담 기록 내보내기에 실패했습니다.",
+        )
 
     @Slot(str)
     def export_form_students_csv(self, file_path):
-        if self.db.export_form_students_csv(file_path):
-            self.operation_success.emit("export", f"학생 정보 일괄 등록 양식을 저장했습니다.\n저장 위치: {file_path}")
-        else:
-            self.operation_error.emit("학생 정보 일괄 등록 양식 저장에 실패했습니다.")
+        self._finish_export(
+            lambda: self.db.export_form_students_csv(file_path),
+            f"학생 정보 일괄 등록 양식을 저장했습니다.\n저장 위치: {file_path}",
+            "학생 정보 일괄 등록 양식 저장에 실패했습니다.",
+        )
 
-    @Slot(str)
+    @Slot(str, str, str)
     def export_counseling_data_for_neis(self, file_path, start_date, end_date):
-        if self.db.export_counseling_to_csv_for_neis(file_path, start_date, end_date):
-            self.operation_success.emit("export", f"나이스 등록용 상담 파일이 성공적으로 내보내졌습니다.\n저장 위치: {file_path}")
-        else:
-            self.operation_error.emit("나이스 등록용 상담 파일 내보내기에 실패했습니다.")
+        self._finish_export(
+            lambda: self.db.export_counseling_to_csv_for_neis(file_path, start_date, end_date, progress_callback=self.report_progress),
+            f"나이스 등록용 상담 파일이 성공적으로 내보내졌습니다.\n저장 위치: {file_path}",
+            "나이스 등록용 상담 파일 내보내기에 실패했습니다.",
+        )
 
     @Slot(str)
     def import_students_data(self, file_path):
-        if self.db.import_csv_to_students(file_path):
-            self.operation_success.emit("import", f"학생 정보를 성공적으로 가져왔습니다.")
+        errors = []
+        if self.db.import_csv_to_students(file_path, progress_callback=self.report_progress, errors=errors):
+            self.operation_success.emit(self.request_id, "import", f"학생 정보를 성공적으로 가져왔습니다.")
+        elif self.is_cancelled():
+            self.operation_cancelled.emit(self.request_id)
         else:
-            self.operation_error.emit("학생 정보 가져오기에 실패했습니다.\n아래 사항을 확인하세요\n - 동명이인\n - 이름 누락\n - CSV 파일 형식 오류")
+            self.import_failed.emit(
+                self.request_id,
+                "학생 정보 가져오기에 실패했습니다. 파일의 내용은 하나도 추가되지 않았습니다.\n"
+                "아래 사항을 확인하세요\n - 동명이인\n - 이름 누락\n - CSV 파일 형식 오류",
+                errors,
+            )
 
+    @Slot(str, bool)
+    def import_counseling_data(self, file_path, dry_run):
+        """상담 기록 CSV 가져오기 (dry_run이면 검사만)"""
+        errors = []
+        summary = self.db.import_counseling_records(
+            file_path, dry_run=dry_run, progress_callback=self.report_progress, errors=errors
+        )
+        if not dry_run:
+            # 중단되었더라도 일부 묶음은 추가되었을 수 있음
+            self.cache.clear()
+        if summary is not None:
+            operation = "check_counseling_import" if dry_run else "import_counseling"
+            self.operation_success.emit(self.request_id, operation, {**summary, 'errors': errors, 'file_path': file_path})
+        elif self.is_cancelled():
+            self.operation_cancelled.emit(self.request_id)
+        else:
+            self.import_failed.emit(self.request_id, "상담 기록 가져오기에 실패했습니다.", errors)
+
+    @Slot(str)
+    def unlock(self, password):
+        """로그인 암호로 암호화된 데이터베이스의 데이터 키를 엽니다. (다른 요청보다 먼저 요청)"""
+        try:
+            unlocked = self.db.unlock(password)
+        except Exception as e:
+            logger.exception("암호화 키 열기 실패: %s", e)
+            unlocked = False
+        if unlocked:
+            # 키를 열기 전에 캐시된 학생 정보에는 ENCRYPTED_PLACEHOLDER가 들어 있을 수 있음
+            self.cache.clear()
+        self.encryption_status.emit(self.db.encrypted, unlocked)
+
+    @Slot(str)
+    def enable_encryption(self, password):
+        """상담 내용과 학생 메모를 암호화"""
+        try:
+            if self.db.enable_encryption(password, progress_callback=self.report_progress):
+                self.cache.clear()
+                self.encryption_status.emit(True, True)
+                self.operation_success.emit(self.request_id, "enable_encryption", None)
+            elif self.is_cancelled():
+                self.operation_cancelled.emit(self.request_id)
+            else:
+                self.operation_error.emit(self.request_id, "상담 내용 암호화에 실패했습니다.")
+        except Exception as e:
+            logger.exception("상담 내용 암호화 실패: %s", e)
+            self.cache.clear()
+            self.operation_error.emit(self.request_id, f"상담 내용 암호화 실패: {e}")
+
+    @Slot(str, str)
+    def change_password(self, old_password, new_password):
+        """로그인 암호를 바꾸고, 암호화된 데이터베이스이면 데이터 키를 새 암호로 다시 감쌈"""
+        try:
+            if self.db.change_key_password(old_password, new_password) and set_password(new_password):
+                self.operation_success.emit(self.request_id, "change_password", None)
+            else:
+                self.operation_error.emit(self.request_id, "암호 변경에 실패했습니다.")
+        except Exception as e:
+            logger.exception("암호 변경 실패: %s", e)
+            self.operation_error.emit(self.request_id, f"암호 변경 실패: {e}")
+
+    @Slot()
     def close_connection(self):
         """워커의 데이터베이스 연결을 닫습니다."""
-        self.db.close_connection()
+        if self.db is not None:
+            self.db.close_connection()
+
+
+class DatabaseClient(QObject):
+    """GUI 스레드에서 워커 스레드로 데이터베이스 요청을 보내는 클래스
+
+    워커는 전용 스레드에서 계속 실행되며, 요청은 큐 연결(QueuedConnection)을 통해
+    전달되므로 모든 Database 메서드는 워커 스레드에서만 실행됩니다.
+    """
+
+    request_posted = Signal(int, str, object)  # 요청 ID, 작업 이름, 인자 튜플
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread = QThread()
+        self.worker = DatabaseWorker()
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.open_database)
+        self.request_posted.connect(self.worker.handle_request, Qt.QueuedConnection)
+        self._last_request_id = 0
+
+    def start(self):
+        """워커 스레드를 시작합니다."""
+        self.thread.start()
+
+    def stop(self):
+        """데이터베이스 연결을 닫고 워커 스레드를 종료합니다."""
+        if self.thread.isRunning():
+            QMetaObject.invokeMethod(self.worker, "close_connection", Qt.BlockingQueuedConnection)
+            self.thread.quit()
+            self.thread.wait()
+
+    def request(self, operation, *args):
+        """작업 요청을 워커 스레드로 보내고 요청 ID를 반환합니다."""
+        if operation not in DatabaseWorker.OPERATIONS:
+            raise ValueError(f"알 수 없는 작업입니다: {operation}")
+        self._last_request_id += 1
+        tracing.bind_request(self._last_request_id)
+        self.request_posted.emit(self._last_request_id, operation, args)
+        return self._last_request_id
+
+    def cancel(self, request_id):
+        """진행 중이거나 대기 중인 요청을 취소합니다."""
+        self.worker.cancel_request(request_id)
@@ -1,8 +1,48 @@
-import charset_normalizer
+import codecs
+
+# 인코딩 판별에 사용하는 파일 앞부분의 크기
+SAMPLE_SIZE = 64 * 1024
+
+# BOM으로 바로 알 수 있는 인코딩
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# BOM이 없을 때 차례로 시도하는 인코딩 (학교에서 쓰는 CSV는 대부분 UTF-8 또는 엑셀의 CP949)
+_TRIAL_ENCODINGS = ('utf-8', 'cp949')
+
+
+def detect_encoding_from_sample(sample, complete=False):
+    """파일 앞부분(sample)으로 인코딩을 판별합니다.
+
+    complete가 False이면 sample 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    for encoding in _TRIAL_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=complete)
+            return encoding
+        except UnicodeDecodeError:
+            pass
+    # 흔한 인코딩이 아닐 때만 charset_normalizer를 불러와 판별
+    import charset_normalizer
+    result = charset_normalizer.from_bytes(sample).best()
+    if result is None:
+        raise ValueError("파일 인코딩을 감지할 수 없습니다.")
+    return result.encoding
+
+
+def sniff_encoding(binary_file, sample_size=SAMPLE_SIZE):
+    """열린 바이너리 파일의 앞부분으로 인코딩을 판별하고 파일 위치를 처음으로 되돌립니다."""
+    sample = binary_file.read(sample_size)
+    binary_file.seek(0)
+    return detect_encoding_from_sample(sample, complete=len(sample) < sample_size)
+
 
 def detect_encoding(csv_file):
     with open(csv_file, 'rb') as file:
-        result = charset_normalizer.from_bytes(file.read()).best()
-        if result is None:
-            raise ValueError("파일 인코딩을 감지할 수 없습니다.")
-        return result.encoding
\ No newline at end of file
+        return sniff_encoding(file)
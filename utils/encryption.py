@@ -0,0 +1,89 @@
+"""상담 내용 암호화 모듈
+
+상담 내용(counseling_records.content)과 학생 메모(students.memo)를 필드 단위로 AES-GCM 암호화합니다.
+값은 임의로 만든 데이터 키로 암호화하고, 데이터 키는 로그인 암호에서 scrypt로 유도한 키로 감싸서(wrap)
+데이터베이스의 encryption_keys 테이블에 저장합니다. 암호를 바꿀 때는 데이터 키만 다시 감싸면 됩니다.
+
+암호화된 값은 BLOB(형식 버전 1바이트 + nonce 12바이트 + 암호문과 인증 태그)으로 저장되며,
+TEXT로 저장된 값은 암호화되지 않은 값으로 그대로 읽습니다.
+cryptography 패키지가 필요하며, 설치되어 있지 않으면 암호화를 켤 수 없습니다.
+"""
+
+import os
+from collections import namedtuple
+
+from .credentials import derive_key, SCRYPT_N, SCRYPT_R, SCRYPT_P, SALT_SIZE
+
+FORMAT_VERSION = b'\x01'
+NONCE_SIZE = 12
+DATA_KEY_SIZE = 32
+
+# 데이터 키가 열리지 않았을 때 암호화된 값 대신 표시하는 문자열 (목록의 미리보기에도 사용)
+ENCRYPTED_PLACEHOLDER = '(암호화된 내용)'
+
+# encryption_keys 테이블의 한 행
+KeyRecord = namedtuple('KeyRecord', ['salt', 'n', 'r', 'p', 'nonce', 'wrapped_key'])
+
+
+def is_available():
+    """cryptography 패키지를 사용할 수 있는지 확인합니다."""
+    try:
+        import cryptography.hazmat.primitives.ciphers.aead
+    except ImportError:
+        return False
+    return True
+
+
+def _aesgcm(key):
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(key)
+
+
+class FieldCipher:
+    """데이터 키로 필드 값을 암호화/복호화하는 클래스
+
+    열 이름을 추가 인증 데이터(AAD)로 사용하므로 다른 열로 옮긴 값은 복호화되지 않습니다.
+    """
+
+    def __init__(self, data_key):
+        self._aead = _aesgcm(data_key)
+
+    def encrypt(self, text, column):
+        """문자열을 암호화하여 BLOB으로 저장할 bytes를 반환합니다."""
+        nonce = os.urandom(NONCE_SIZE)
+        return FORMAT_VERSION + nonce + self._aead.encrypt(nonce, text.encode('utf-8'), column.encode('ascii'))
+
+    def decrypt(self, value, column):
+        """암호화된 값을 복호화합니다. 값이 손상되었으면 ValueError가 발생합니다."""
+        from cryptography.exceptions import InvalidTag
+        if value[:1] != FORMAT_VERSION:
+            raise ValueError("지원하지 않는 암호화 형식입니다.")
+        nonce = value[1:1 + NONCE_SIZE]
+        try:
+            return self._aead.decrypt(nonce, value[1 + NONCE_SIZE:], column.encode('ascii')).decode('utf-8')
+        except InvalidTag:
+            raise ValueError(f"암호화된 {column} 값을 복호화할 수 없습니다.") from None
+
+
+def wrap_key(data_key, password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """데이터 키를 암호에서 유도한 키로 감싼 KeyRecord를 반환합니다."""
+    salt = os.urandom(SALT_SIZE)
+    nonce = os.urandom(NONCE_SIZE)
+    wrapped_key = _aesgcm(derive_key(password, salt, n, r, p)).encrypt(nonce, data_key, b'data-key')
+    return KeyRecord(salt, n, r, p, nonce, wrapped_key)
+
+
+def unwrap_key(record, password):
+    """KeyRecord에서 데이터 키를 꺼냅니다. 암호가 틀리면 None을 반환합니다."""
+    from cryptography.exceptions import InvalidTag
+    key = derive_key(password, record.salt, record.n, record.r, record.p)
+    try:
+        return _aesgcm(key).decrypt(record.nonce, record.wrapped_key, b'data-key')
+    except InvalidTag:
+        return None
+
+
+def create_data_key(password):
+    """새 데이터 키를 만들어 (데이터 키, 암호로 감싼 KeyRecord)를 반환합니다."""
+    data_key = os.urandom(DATA_KEY_SIZE)
+    return data_key, wrap_key(data_key, password)
@@ -0,0 +1,272 @@
+"""데이터베이스 스키마 마이그레이션
+
+적용된 마지막 마이그레이션 번호는 PRAGMA user_version에 저장됩니다.
+새 마이그레이션은 MIGRATIONS 끝에 다음 번호로 추가하고, 이미 배포된 항목은 수정하지 않습니다.
+"""
+
+import sqlite3
+
+
+def _create_base_tables(conn):
+    """학생, 상담 기록 테이블 생성 (이전 버전의 create_tables, update_schema)"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        phone TEXT,
+        gender TEXT,
+        birth_date TEXT,
+        guardian_phone1 TEXT,
+        guardian_phone2 TEXT,
+        memo TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS counseling_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER,
+        counsel_date TIMESTAMP NOT NULL,
+        target TEXT NOT NULL,
+        method TEXT NOT NULL,
+        category TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
+    )
+    ''')
+    # category 열이 없던 초기 버전의 데이터베이스
+    columns = [info[1] for info in conn.execute("PRAGMA table_info(counseling_records)")]
+    if 'category' not in columns:
+        conn.execute("ALTER TABLE counseling_records ADD COLUMN category TEXT")
+
+
+def _add_counsel_indexes(conn):
+    """학생별 최신순 조회와 기간 조회(나이스 내보내기)용 인덱스"""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_counseling_records_student_date
+        ON counseling_records (student_id, counsel_date DESC)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_counseling_records_counsel_date
+        ON counseling_records (counsel_date)
+    ''')
+
+
+def _add_counsel_search_index(conn):
+    """상담 내용과 분류의 전문 검색(FTS5) 색인과 동기화 트리거
+
+    한국어는 조사가 붙어 단어 단위 토큰화가 맞지 않으므로 trigram 토크나이저를 사용하고,
+    SQLite가 trigram을 지원하지 않으면 unicode61로 대신합니다.
+    """
+    for tokenizer in ('trigram', 'unicode61'):
+        try:
+            conn.execute(f'''
+                CREATE VIRTUAL TABLE counseling_records_fts USING fts5(
+                    content, category,
+                    content='counseling_records', content_rowid='id',
+                    tokenize='{tokenizer}'
+                )
+            ''')
+            break
+        except sqlite3.OperationalError:
+            if tokenizer == 'unicode61':
+                raise
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_insert AFTER INSERT ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(rowid, content, category)
+            VALUES (new.id, new.content, new.category);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_delete AFTER DELETE ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(counseling_records_fts, rowid, content, category)
+            VALUES ('delete', old.id, old.content, old.category);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_update AFTER UPDATE OF content, category ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(counseling_records_fts, rowid, content, category)
+            VALUES ('delete', old.id, old.content, old.category);
+            INSERT INTO counseling_records_fts(rowid, content, category)
+            VALUES (new.id, new.content, new.category);
+        END
+    ''')
+    # 기존 기록 색인
+    conn.execute("INSERT INTO counseling_records_fts(counseling_records_fts) VALUES ('rebuild')")
+
+
+def _add_encryption(conn):
+    """상담 내용 암호화 키 테이블 추가와 검색 색인 트리거 변경
+
+    암호화된 상담 내용(BLOB)은 검색 색인에 넣지 않도록, 내용이 TEXT인 행만 색인합니다.
+    encryption_keys에 행이 없으면 암호화하지 않은 데이터베이스입니다.
+    """
+    conn.execute('''
+    CREATE TABLE encryption_keys (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        salt BLOB NOT NULL,
+        n INTEGER NOT NULL,
+        r INTEGER NOT NULL,
+        p INTEGER NOT NULL,
+        nonce BLOB NOT NULL,
+        wrapped_key BLOB NOT NULL
+    )
+    ''')
+    for name in ('insert', 'delete', 'update'):
+        conn.execute(f"DROP TRIGGER counseling_records_fts_{name}")
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_insert AFTER INSERT ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(rowid, content, category)
+            SELECT new.id, new.content, new.category WHERE typeof(new.content) = 'text';
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_delete AFTER DELETE ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(counseling_records_fts, rowid, content, category)
+            SELECT 'delete', old.id, old.content, old.category WHERE typeof(old.content) = 'text';
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER counseling_records_fts_update AFTER UPDATE OF content, category ON counseling_records BEGIN
+            INSERT INTO counseling_records_fts(counseling_records_fts, rowid, content, category)
+            SELECT 'delete', old.id, old.content, old.category WHERE typeof(old.content) = 'text';
+            INSERT INTO counseling_records_fts(rowid, content, category)
+            SELECT new.id, new.content, new.category WHERE typeof(new.content) = 'text';
+        END
+    ''')
+
+
+def _school_year_sql(date):
+    """상담 일시('yyyy-MM-dd HH:mm')에서 학년도를 구하는 SQL 식 (학년도는 3월에 시작)"""
+    return f"(CAST(substr({date}, 1, 4) AS INTEGER) - (substr({date}, 6, 2) < '03'))"
+
+
+def _stats_change_sql(row, delta):
+    """row(new/old) 기록의 통계 행에 delta를 더하는 SQL (행이 없으면 추가)"""
+    return f'''
+        INSERT INTO counseling_stats (school_year, month, target, method, category, count)
+        VALUES ({_school_year_sql(f'{row}.counsel_date')}, substr({row}.counsel_date, 1, 7),
+                COALESCE({row}.target, ''), COALESCE({row}.method, ''), COALESCE({row}.category, ''), {delta})
+        ON CONFLICT (school_year, month, target, method, category)
+        DO UPDATE SET count = count + excluded.count;
+    '''
+
+
+_STATS_CLEANUP_SQL = "DELETE FROM counseling_stats WHERE count <= 0;"
+
+
+def _add_counseling_stats(conn):
+    """학년도, 월, 대상, 방법, 분류별 상담 건수 요약 테이블과 동기화 트리거
+
+    통계 화면은 상담 기록 전체 대신 이 테이블의 수백 행만 읽습니다.
+    건수가 0이 된 행은 삭제하여 있는 조합만 남기고, 분류가 없던 초기 버전의 기록은 빈 문자열로 집계합니다.
+    """
+    conn.execute('''
+    CREATE TABLE counseling_stats (
+        school_year INTEGER NOT NULL,
+        month TEXT NOT NULL,
+        target TEXT NOT NULL,
+        method TEXT NOT NULL,
+        category TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (school_year, month, target, method, category)
+    ) WITHOUT ROWID
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER counseling_stats_insert AFTER INSERT ON counseling_records BEGIN
+            {_stats_change_sql('new', 1)}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER counseling_stats_delete AFTER DELETE ON counseling_records BEGIN
+            {_stats_change_sql('old', -1)}
+            {_STATS_CLEANUP_SQL}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER counseling_stats_update
+        AFTER UPDATE OF counsel_date, target, method, category ON counseling_records BEGIN
+            {_stats_change_sql('old', -1)}
+            {_stats_change_sql('new', 1)}
+            {_STATS_CLEANUP_SQL}
+        END
+    ''')
+    # 기존 기록 집계
+    conn.execute(f'''
+        INSERT INTO counseling_stats (school_year, month, target, method, category, count)
+        SELECT {_school_year_sql('counsel_date')}, substr(counsel_date, 1, 7),
+               COALESCE(target, ''), COALESCE(method, ''), COALESCE(category, ''), COUNT(*)
+        FROM counseling_records
+        GROUP BY 1, 2, 3, 4, 5
+    ''')
+
+
+def _add_counsel_drafts(conn):
+    """저장하기 전의 상담 내용을 임시 저장하는 테이블
+
+    draft_key는 상담 기록 탭에서 작성 중인 새 기록이면 'new', 기존 기록 수정이면 'record:<id>'입니다.
+    수정 중이던 기록이 삭제되면 임시 저장도 함께 삭제됩니다. updated_at은 화면에 보여 주므로 지역 시간입니다.
+    암호화된 데이터베이스에서는 content를 상담 내용과 같은 방식으로 암호화합니다.
+    """
+    conn.execute('''
+    CREATE TABLE counsel_drafts (
+        id INTEGER PRIMARY KEY,
+        draft_key TEXT UNIQUE NOT NULL,
+        record_id INTEGER,
+        student_name TEXT,
+        counsel_date TEXT,
+        target TEXT,
+        method TEXT,
+        category TEXT,
+        content TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+        FOREIGN KEY (record_id) REFERENCES counseling_records (id) ON DELETE CASCADE
+    )
+    ''')
+
+
+# (버전, 설명, 적용 함수)
+MIGRATIONS = [
+    (1, '기본 테이블 생성', _create_base_tables),
+    (2, '상담 기록 인덱스 추가', _add_counsel_indexes),
+    (3, '상담 기록 전문 검색 색인 추가', _add_counsel_search_index),
+    (4, '상담 내용 암호화 키 테이블 추가', _add_encryption),
+    (5, '상담 통계 요약 테이블 추가', _add_counseling_stats),
+    (6, '상담 내용 임시 저장 테이블 추가', _add_counsel_drafts),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """데이터베이스에 기록된 스키마 버전을 반환합니다."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """적용되지 않은 마이그레이션을 순서대로 각각 하나의 트랜잭션 안에서 적용합니다.
+
+    적용 후의 스키마 버전을 반환합니다. 실패한 마이그레이션은 되돌려지고 예외가 전달됩니다.
+    이미 최신 버전이면 쓰기 잠금을 잡지 않고 바로 반환합니다. (연결을 열 때마다 호출되므로)
+    """
+    current = get_schema_version(conn)
+    if current >= LATEST_VERSION:
+        return current
+    for version, description, apply in MIGRATIONS:
+        if current >= version:
+            continue
+        # 다른 프로세스가 동시에 마이그레이션하지 않도록 쓰기 잠금을 먼저 잡고 버전을 확인
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise sqlite3.DatabaseError(f"마이그레이션 {version}({description}) 실패: {e}") from e
+    return get_schema_version(conn)
@@ -0,0 +1,250 @@
+"""SQL 실행 시간 기록
+
+Database의 연결은 TracedConnection으로 열리며, 커서의 execute/executemany와 commit에 걸린 시간을
+문장별로 QueryStats에 모읍니다. (SELECT는 첫 행을 얻을 때까지의 시간이며 나머지 행을 읽는 시간은 포함되지 않습니다.)
+SLOW_QUERY_MS 이상 걸린 문장과 SQL 오류는 데이터베이스 파일 옆의 slow_queries.log에 기록합니다.
+로그에는 문장만 남기고 매개변수(상담 내용 등)는 남기지 않습니다.
+enable_error_log를 호출하면 utils 모듈 로거(logging.getLogger(__name__))의 경고와 예외도 같은 파일에 기록합니다.
+배포용 실행 파일에서는 print 출력이 보이지 않으므로, 문제를 알려 올 때 이 로그와 설정 탭의 진단 정보를 함께 받습니다.
+"""
+
+import bisect
+import logging
+import logging.handlers
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from functools import lru_cache
+
+from utils import tracing
+
+# 이 시간(ms) 이상 걸린 문장을 로그 파일에 기록
+SLOW_QUERY_MS = 100
+
+SLOW_LOG_NAME = 'slow_queries.log'
+SLOW_LOG_MAX_BYTES = 1024 * 1024
+SLOW_LOG_BACKUP_COUNT = 3
+
+# 실행 시간 히스토그램의 칸 경계(ms). 마지막 칸은 마지막 경계 이상
+HISTOGRAM_BOUNDS_MS = (1, 5, 20, 100, 500, 2000)
+
+# 처리 중 예외를 기록하는 모듈 로거들의 상위 로거 (utils.database, utils.backup 등)
+ERROR_LOGGER_NAME = 'utils'
+
+_WHITESPACE = re.compile(r'\s+')
+_handlers = {}  # 로그 파일 -> RotatingFileHandler
+_loggers = {}
+_loggers_lock = threading.Lock()
+_error_log_handler = None
+
+
+@lru_cache(maxsize=1024)
+def normalize(sql):
+    """공백을 정리하여 같은 문장을 같은 키로 모읍니다. (문장 종류가 많지 않으므로 결과를 기억해 둠)"""
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def _log_handler(log_file):
+    """로그 파일마다 하나의 핸들러 (같은 파일에 여러 핸들러가 겹쳐 쓰지 않도록, _loggers_lock 안에서 호출)"""
+    handler = _handlers.get(log_file)
+    if handler is None:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=SLOW_LOG_MAX_BYTES, backupCount=SLOW_LOG_BACKUP_COUNT,
+            encoding='utf-8', delay=True,
+        )
+        handler.setFormatter(logging.Formatter('%(asctime)s [%(threadName)s] %(message)s'))
+        _handlers[log_file] = handler
+    return handler
+
+
+def _slow_query_logger(log_file):
+    """로그 파일마다 하나의 로거"""
+    with _loggers_lock:
+        logger = _loggers.get(log_file)
+        if logger is None:
+            logger = logging.Logger(f'heartwings.slow_query[{log_file}]')
+            logger.addHandler(_log_handler(log_file))
+            _loggers[log_file] = logger
+        return logger
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """출력할 때의 sys.stderr에 메시지만 출력하는 핸들러 (콘솔이 없는 배포용 실행 파일에서는 출력하지 않음)"""
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def format(self, record):
+        # 예외의 추적 정보는 로그 파일에만 남김
+        return record.getMessage()
+
+    def emit(self, record):
+        if sys.stderr is not None:
+            super().emit(record)
+
+
+def enable_error_log(log_file):
+    """utils 모듈 로거의 경고와 예외(logger.exception)를 log_file에 기록합니다.
+
+    느린 문장 로그와 같은 파일과 핸들러를 사용하며, 다른 파일로 다시 호출하면 그 파일로 바꿉니다.
+    콘솔이 있으면 메시지를 stderr에도 출력합니다.
+    """
+    global _error_log_handler
+    logger = logging.getLogger(ERROR_LOGGER_NAME)
+    with _loggers_lock:
+        handler = _log_handler(log_file)
+        if handler is _error_log_handler:
+            return
+        if _error_log_handler is None:
+            logger.addHandler(_ConsoleHandler())
+        else:
+            logger.removeHandler(_error_log_handler)
+        logger.addHandler(handler)
+        _error_log_handler = handler
+
+
+class QueryStats:
+    """문장별 실행 횟수, 시간 합계/최대, 시간 히스토그램
+
+    여러 스레드의 연결이 함께 사용하므로 잠금으로 보호합니다.
+    log_file이 None이면 느린 문장과 오류를 파일에 기록하지 않습니다.
+    """
+
+    def __init__(self, log_file=None, slow_ms=SLOW_QUERY_MS):
+        self.log_file = log_file
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._by_statement = {}  # 정리한 문장 -> [횟수, 합계(초), 최대(초), 히스토그램 칸별 횟수]
+        self._statements = {}    # 실행한 SQL 문자열 -> _by_statement의 항목
+        self.errors = 0
+
+    def _log(self, message, *args):
+        if self.log_file is not None:
+            _slow_query_logger(self.log_file).warning(message, *args)
+
+    def record_span(self, sql, start, end):
+        """time.perf_counter로 잰 실행 구간을 기록하고, 동작 추적 중이면 추적에도 남깁니다."""
+        self.record(sql, end - start)
+        if tracing.enabled:
+            tracing.record_span(normalize(sql), 'sql', start, end)
+
+    def record(self, sql, seconds):
+        """실행 시간을 기록합니다. (모든 문장마다 호출되므로 가볍게 유지)"""
+        ms = seconds * 1000
+        bucket = bisect.bisect_right(HISTOGRAM_BOUNDS_MS, ms)
+        with self._lock:
+            entry = self._statements.get(sql)
+            if entry is None:
+                # 같은 문장의 공백만 다른 경우도 하나로 모음
+                statement = normalize(sql)
+                entry = self._by_statement.get(statement)
+                if entry is None:
+                    entry = self._by_statement[statement] = [0, 0.0, 0.0, [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)]
+                self._statements[sql] = entry
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+            entry[3][bucket] += 1
+        if ms >= self.slow_ms:
+            self._log("%.1fms %s", ms, normalize(sql))
+
+    def record_error(self, sql, error):
+        """SQL 오류를 기록합니다."""
+        with self._lock:
+            self.errors += 1
+        self._log("오류 %s: %s | %s", type(error).__name__, error, normalize(sql))
+
+    def snapshot(self, top=20):
+        """시간 합계가 큰 순서로 top개 문장의 통계를 반환합니다."""
+        with self._lock:
+            items = [(statement, entry[0], entry[1], entry[2], list(entry[3]))
+                     for statement, entry in self._by_statement.items()]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return [{
+            'statement': statement,
+            'count': count,
+            'total_ms': total * 1000,
+            'mean_ms': total * 1000 / count,
+            'max_ms': maximum * 1000,
+            'histogram': histogram,
+        } for statement, count, total, maximum, histogram in items[:top]]
+
+    def reset(self):
+        """기록을 모두 지웁니다."""
+        with self._lock:
+            self._by_statement.clear()
+            self._statements.clear()
+            self.errors = 0
+
+
+class TracedCursor(sqlite3.Cursor):
+    """execute/executemany 시간을 연결의 QueryStats에 기록하는 커서"""
+
+    def _traced(self, method, sql, parameters):
+        stats = self.connection.stats
+        start = time.perf_counter()
+        try:
+            result = method(sql, parameters)
+        except sqlite3.Error as e:
+            stats.record_error(sql, e)
+            raise
+        stats.record_span(sql, start, time.perf_counter())
+        return result
+
+    def execute(self, sql, parameters=()):
+        return self._traced(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._traced(super().executemany, sql, seq_of_parameters)
+
+
+class TracedConnection(sqlite3.Connection):
+    """TracedCursor를 사용하는 연결 (sqlite3.connect의 factory로 지정)
+
+    연결을 연 뒤 stats에 QueryStats를 지정합니다.
+    """
+
+    stats = QueryStats()
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    # Connection.execute는 cursor()를 거치지 않으므로 따로 기록
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            cursor = super().execute(sql, parameters)
+        except sqlite3.Error as e:
+            self.stats.record_error(sql, e)
+            raise
+        self.stats.record_span(sql, start, time.perf_counter())
+        return cursor
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            cursor = super().executemany(sql, seq_of_parameters)
+        except sqlite3.Error as e:
+            self.stats.record_error(sql, e)
+            raise
+        self.stats.record_span(sql, start, time.perf_counter())
+        return cursor
+
+    def commit(self):
+        start = time.perf_counter()
+        super().commit()
+        self.stats.record_span('COMMIT', start, time.perf_counter())
+
+
+def default_log_file(db_file):
+    """데이터베이스 파일 옆의 느린 문장 로그 파일 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(db_file)), SLOW_LOG_NAME)
@@ -0,0 +1,80 @@
+"""시작 시간 측정 모듈
+
+main.py를 --profile-startup 옵션으로 실행하면 단계별 소요 시간과
+시간이 오래 걸린 모듈 가져오기(import) 목록을 출력합니다.
+옵션이 없으면 아무 일도 하지 않습니다.
+"""
+
+import builtins
+import sys
+import time
+
+
+class StartupProfiler:
+    """시작 단계와 모듈 가져오기 시간을 기록하는 클래스"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []  # (단계 이름, 소요 시간)
+        self.imports = {} # 모듈 이름 -> 자체 시간 (하위 모듈 가져오기 시간 제외)
+        self._start = self._last = time.perf_counter()
+        self._original_import = None
+
+    def install(self):
+        """모듈 가져오기 시간 측정을 시작합니다."""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        original_import = self._original_import
+        imports = self.imports
+        stack = [] # 가져오는 중인 모듈의 하위 모듈 시간 합계
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # 이미 가져온 모듈은 측정하지 않음 (상대 경로 가져오기는 항상 측정)
+            if level == 0 and name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                if elapsed - children > 0.0001:
+                    imports[name] = imports.get(name, 0.0) + elapsed - children
+
+        builtins.__import__ = timed_import
+
+    def uninstall(self):
+        """모듈 가져오기 시간 측정을 멈춥니다."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def phase(self, name):
+        """직전 기록 이후의 시간을 name 단계로 기록합니다."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def skip(self):
+        """직전 기록 이후의 시간을 단계에서 제외합니다. (암호 입력 대기 등)"""
+        self._last = time.perf_counter()
+
+    def report(self, top=15):
+        """단계별 시간과 가장 오래 걸린 모듈 가져오기를 출력합니다."""
+        if not self.enabled:
+            return
+        self.uninstall()
+        print("=== 시작 단계별 시간 ===")
+        for name, elapsed in self.phases:
+            print(f"{elapsed * 1000:9.1f} ms  {name}")
+        print(f"{sum(elapsed for _, elapsed in self.phases) * 1000:9.1f} ms  합계 (사용자 입력 대기 제외)")
+        print(f"=== 모듈 가져오기 (자체 시간 상위 {top}개) ===")
+        for name, elapsed in sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"{elapsed * 1000:9.1f} ms  {name}")
+        print(f"{sum(self.imports.values()) * 1000:9.1f} ms  모듈 가져오기 합계")
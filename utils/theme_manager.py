@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 import darkdetect
 from PySide6.QtCore import QFile, QTextStream, QIODevice
 from PySide6.QtWidgets import QApplication
@@ -6,15 +9,45 @@ from PySide6.QtWidgets import QApplication
 # main.py에서 프로젝트 루트를 sys.path에 추가하므로 이 경로가 동작합니다.
 from ui.theme import PALETTE_LIGHT, PALETTE_DARK
 
+# 스타일시트의 {{이름}} 플레이스홀더
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+# 기억해 두는 완성된 스타일시트 수 (라이트/다크 x 최근 글꼴 크기)
+STYLESHEET_CACHE_SIZE = 8
+
+
+class StylesheetTemplate:
+    """플레이스홀더 위치를 한 번만 찾아 둔 스타일시트 템플릿
+
+    템플릿을 (문자열, 이름, 문자열, 이름, ..., 문자열) 조각으로 나눠 두고,
+    render()는 이름 조각만 값으로 바꿔 한 번에 이어 붙입니다.
+    값이 없는 플레이스홀더는 그대로 남습니다.
+    """
+
+    def __init__(self, text):
+        self._parts = PLACEHOLDER_PATTERN.split(text)
+
+    def render(self, values):
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            value = values.get(parts[i])
+            parts[i] = f"{{{{{parts[i]}}}}}" if value is None else value
+        return ''.join(parts)
+
 
 class ThemeManager:
     """애플리케이션의 테마(라이트/다크)를 관리하는 클래스."""
 
-    def __init__(self, font_size="14px"):
+    def __init__(self, font_size="14px", font_family=None):
         """ThemeManager를 초기화합니다."""
         self.is_dark_mode = (darkdetect.theme() == "Dark")
         self.base_style = self._load_stylesheet_from_resource()
+        self.template = StylesheetTemplate(self.base_style)
         self.font_size = font_size
+        self.font_family = font_family
+        self._applied_key = None
+        # (다크 모드 여부, 글꼴 크기, 글꼴)별 완성된 스타일시트
+        self._render = lru_cache(maxsize=STYLESHEET_CACHE_SIZE)(self._create_stylesheet)
 
     def _load_stylesheet_from_resource(self):
         """Qt 리소스 시스템에서 base.qss 파일을 안전하게 로드합니다."""
@@ -25,23 +58,21 @@ class ThemeManager:
         stream = QTextStream(qss_file)
         return stream.readAll()
 
-    def _create_stylesheet(self, palette):
-        """주어진 팔레트를 사용하여 QSS를 동적으로 생성합니다."""
-        stylesheet = self.base_style
-        # 팔레트의 값을 스타일시트의 플레이스홀더에 적용합니다.
-        for key, value in palette.items():
-            stylesheet = stylesheet.replace(f"{{{{{key}}}}}", value)
-        
-        # 글꼴 설정 적용
-        stylesheet = stylesheet.replace("{{font_size}}", self.font_size)
-
-        return stylesheet
+    def _create_stylesheet(self, is_dark_mode, font_size, font_family):
+        """팔레트와 글꼴 설정으로 QSS를 생성합니다."""
+        values = dict(PALETTE_DARK if is_dark_mode else PALETTE_LIGHT)
+        values['font_size'] = font_size
+        if font_family is not None:
+            values['font_family'] = font_family
+        return self.template.render(values)
 
     def apply_theme(self):
-        """현재 테마 설정에 따라 스타일시트를 적용합니다."""
-        palette = PALETTE_DARK if self.is_dark_mode else PALETTE_LIGHT
-        stylesheet = self._create_stylesheet(palette)
-        QApplication.instance().setStyleSheet(stylesheet)
+        """현재 테마 설정에 따라 스타일시트를 적용합니다. (같은 스타일시트는 다시 적용하지 않음)"""
+        key = (self.is_dark_mode, self.font_size, self.font_family)
+        if key == self._applied_key:
+            return
+        QApplication.instance().setStyleSheet(self._render(*key))
+        self._applied_key = key
 
     def set_font_size(self, size):
         self.font_size = f"{size}px"
@@ -0,0 +1,245 @@
+"""사용자 동작 추적 (Chrome trace event 형식)
+
+학생 선택, 저장 등 한 번의 사용자 동작이 메인 창, 워커 스레드, Database 메서드, SQL 문장,
+목록 그리기에서 각각 얼마나 걸리는지 구간(span)으로 기록합니다.
+구간에는 시작 시각(time.perf_counter 기준), 길이, 스레드 이름과 동작 이름(예: save_student_info#3)이 붙고,
+워커 요청과 응답은 요청 ID로 이어집니다.
+
+    python main.py --trace trace.json
+
+으로 실행하거나 설정 탭의 진단 정보에서 추적을 시작하고, 저장한 파일을 chrome://tracing 또는
+https://ui.perfetto.dev 에서 엽니다.
+
+추적하지 않을 때는 각 지점에서 전역 변수 하나만 확인하므로 비용이 거의 없습니다.
+"""
+
+import collections
+import functools
+import itertools
+import os
+import threading
+import time
+
+# 보관할 최대 이벤트 수 (넘으면 오래된 것부터 버림)
+MAX_EVENTS = 200_000
+
+# 동작 이름을 기억해 둘 최대 요청 수
+MAX_REQUESTS = 10_000
+
+# 이 분류의 구간은 동작 밖에서 실행되면 같은 스레드에서 마지막으로 끝난 동작의 이름을 붙임
+# (목록 그리기는 응답 처리가 끝난 뒤 이벤트 루프에서 따로 실행되므로)
+RENDER_CAT = 'render'
+
+enabled = False
+
+_events = collections.deque(maxlen=MAX_EVENTS)  # (ph, 이름, 분류, 시작, 끝, 스레드 id, 동작, 인자, 흐름 id)
+_thread_names = {}       # 스레드 id -> 이름
+_request_actions = {}    # 요청 ID -> 요청을 보낸 동작 이름
+_action_ids = itertools.count(1)
+_local = threading.local()
+
+
+def enable(max_events=MAX_EVENTS):
+    """추적을 시작합니다. 이전 기록은 지웁니다."""
+    global enabled, _events
+    _events = collections.deque(maxlen=max_events)
+    _thread_names.clear()
+    _request_actions.clear()
+    enabled = True
+
+
+def disable():
+    """추적을 멈춥니다. 기록은 export_chrome_trace로 저장할 수 있도록 남겨 둡니다."""
+    global enabled
+    enabled = False
+
+
+def event_count():
+    """기록된 이벤트 수"""
+    return len(_events)
+
+
+def _current_thread():
+    thread_id = threading.get_ident()
+    if thread_id not in _thread_names:
+        _thread_names[thread_id] = threading.current_thread().name
+    return thread_id
+
+
+def _current_action():
+    return getattr(_local, 'action', None)
+
+
+class _Span:
+    """추적 중일 때만 만들어지는 구간
+
+    request_id가 있으면 구간 동안 그 요청을 보낸 동작 이름을 이어받고,
+    flow_in/flow_out 분류로 요청을 보낸 구간과 이어지는 화살표(흐름 이벤트)를 남깁니다.
+    """
+
+    __slots__ = ('name', 'cat', 'args', 'request_id', 'flow_in', 'flow_out', 'start', 'previous_action')
+
+    def __init__(self, name, cat, args=None, request_id=None, flow_in=None, flow_out=None):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.request_id = request_id
+        self.flow_in = flow_in
+        self.flow_out = flow_out
+
+    def __enter__(self):
+        self.previous_action = _current_action()
+        thread_id = _current_thread()
+        self.start = time.perf_counter()
+        if self.cat == RENDER_CAT and self.previous_action is None:
+            _local.action = getattr(_local, 'last_action', None)
+        if self.request_id is not None:
+            _local.action = _request_actions.get(self.request_id, self.previous_action)
+            if self.flow_in:
+                _events.append(('f', self.flow_in, self.flow_in, self.start, None, thread_id, None, None, self.request_id))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        thread_id = _current_thread()
+        if self.flow_out:
+            _events.append(('s', self.flow_out, self.flow_out, end, None, thread_id, None, None, self.request_id))
+        action_name = _current_action()
+        _events.append(('X', self.name, self.cat, self.start, end, thread_id, action_name, self.args, None))
+        if action_name is not None and self.cat != RENDER_CAT:
+            _local.last_action = action_name
+        _local.action = self.previous_action
+        return False
+
+
+class _Action(_Span):
+    """새 동작 이름을 정하고 그 동안의 구간과 요청에 붙이는 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        super().__enter__()
+        _local.action = f"{self.name}#{next(_action_ids)}"
+        return self
+
+
+class _NullSpan:
+    """추적하지 않을 때 돌려주는 아무 일도 하지 않는 구간 (하나를 재사용)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, cat='app', **args):
+    """with 문으로 감싼 부분을 구간으로 기록합니다."""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args or None)
+
+
+def action(name):
+    """with 문으로 감싼 부분을 새 사용자 동작으로 기록합니다. 그 안에서 보낸 요청과 응답 처리에 동작 이름이 붙습니다."""
+    if not enabled:
+        return _NULL_SPAN
+    return _Action(name, 'action')
+
+
+def request_span(request_id, name, cat='worker'):
+    """워커가 요청을 처리하는 구간 (요청을 보낸 동작 이름을 이어받고, 응답 처리 구간으로 흐름을 남김)"""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, {'request_id': request_id}, request_id, flow_in='request', flow_out='reply')
+
+
+def bind_request(request_id):
+    """현재 동작을 요청 ID에 기억하고 워커의 처리 구간으로 이어지는 흐름을 남깁니다. (요청을 보낼 때 호출)"""
+    if not enabled:
+        return
+    _request_actions[request_id] = _current_action()
+    if len(_request_actions) > MAX_REQUESTS:
+        del _request_actions[next(iter(_request_actions))]
+    _events.append(('s', 'request', 'request', time.perf_counter(), None, _current_thread(), None, None, request_id))
+
+
+def record_span(name, cat, start, end):
+    """이미 잰 구간(time.perf_counter 값)을 기록합니다. (SQL 문장 등)"""
+    if enabled:
+        _events.append(('X', name, cat, start, end, _current_thread(), _current_action(), None, None))
+
+
+def traced(name=None, cat='app'):
+    """함수 실행을 구간으로 기록하는 데코레이터 (이름을 생략하면 함수의 정규화된 이름)"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Span(label, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_reply(func):
+    """워커 응답 시그널을 받는 슬롯(첫 인자가 요청 ID)을 요청을 보낸 동작의 구간으로 기록하는 데코레이터"""
+    label = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self, request_id, *args, **kwargs):
+        if not enabled:
+            return func(self, request_id, *args, **kwargs)
+        with _Span(label, 'reply', {'request_id': request_id}, request_id, flow_in='reply'):
+            return func(self, request_id, *args, **kwargs)
+    return wrapper
+
+
+def user_action(name=None):
+    """메서드 실행을 새 사용자 동작으로 기록하는 데코레이터 (이름을 생략하면 함수 이름)"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Action(label, 'action'):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def export_chrome_trace(path):
+    """기록을 Chrome trace event JSON 파일로 저장하고 저장한 이벤트 수를 반환합니다."""
+    import json
+
+    events = list(_events)
+    origin = min((event[3] for event in events), default=0.0)
+    pid = os.getpid()
+    trace_events = [
+        {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name}}
+        for thread_id, thread_name in list(_thread_names.items())
+    ]
+    for ph, name, cat, start, end, thread_id, action_name, args, flow_id in events:
+        event = {'name': name, 'cat': cat, 'ph': ph, 'ts': (start - origin) * 1_000_000, 'pid': pid, 'tid': thread_id}
+        if ph == 'X':
+            event['dur'] = (end - start) * 1_000_000
+            if action_name or args:
+                event['args'] = dict(args or {}, **({'action': action_name} if action_name else {}))
+        else:
+            event['id'] = flow_id
+            if ph == 'f':
+                event['bp'] = 'e'
+        trace_events.append(event)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return len(events)
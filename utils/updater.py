@@ -1,35 +1,91 @@
-import requests
+import json
+import logging
+import re
+import time
+import urllib.error
+import urllib.request
+
 from PySide6.QtCore import QObject, Signal
 
+from .config_manager import get_update_cache, set_update_cache
+
+logger = logging.getLogger(__name__)
+
 # 현재 애플리케이션 버전
 CURRENT_VERSION = "1.4"  # 실제 버전에 맞게 수정
 
+REQUEST_TIMEOUT = 5 # 초
+
+
+def parse_version(version):
+    """'v1.10.2' 같은 버전 문자열을 비교할 수 있는 정수 튜플로 바꿉니다.
+
+    각 부분의 앞쪽 숫자만 사용하며('2-beta' -> 2), 끝의 0은 무시합니다. ('1.4.0' == '1.4')
+    """
+    numbers = []
+    for part in version.strip().lstrip('vV').split('.'):
+        match = re.match(r'\d+', part)
+        numbers.append(int(match.group()) if match else 0)
+    while numbers and numbers[-1] == 0:
+        numbers.pop()
+    return tuple(numbers)
+
+
+def is_newer_version(latest, current):
+    """latest가 current보다 새 버전인지 확인합니다. ('1.10' > '1.9')"""
+    return parse_version(latest) > parse_version(current)
+
+
 class UpdateChecker(QObject):
     # 백그라운드에서 업데이트를 확인하고 완료되면 시그널을 발생시키는 클래스
-    
+    #
+    # 확인 결과와 ETag를 settings.ini에 저장해 두고, 설정한 주기(기본 24시간) 안에는
+    # 네트워크 요청 없이 저장된 결과를 사용합니다. 주기가 지나면 If-None-Match로 요청하여
+    # 바뀐 내용이 없으면(304) 본문 없이 저장된 결과를 그대로 사용합니다.
+
     update_available = Signal(str, str)
     error_occurred = Signal(str)
 
-    def __init__(self, repo_owner, repo_name):
+    def __init__(self, repo_owner, repo_name, api_url=None):
         super().__init__()
         self.repo_owner = repo_owner
         self.repo_name = repo_name
+        self.api_url = api_url or f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
 
-    def check_for_updates(self):
-        # GitHub에서 최신 릴리스 버전 정보를 가져와서 필요한 경우 시그널을 발생
+    def _fetch_latest(self, cache):
+        """최신 릴리스 정보를 받아 (버전, 업데이트 내용)을 반환합니다. 바뀐 내용이 없으면 저장된 결과"""
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': f'HeartWings-Lite/{CURRENT_VERSION}',
+        }
+        if cache['etag'] and cache['latest_version']:
+            headers['If-None-Match'] = cache['etag']
+        request = urllib.request.Request(self.api_url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                release_info = json.load(response)
+                etag = response.headers.get('ETag', '')
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            set_update_cache(time.time())
+            return cache['latest_version'], cache['notes']
+        latest_version = release_info["tag_name"].lstrip('v')
+        update_content = release_info.get("body") or ""
+        set_update_cache(time.time(), etag, latest_version, update_content)
+        return latest_version, update_content
 
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases/latest"
+    def check_for_updates(self):
+        # 최신 릴리스 버전 정보를 (필요하면 GitHub에서) 가져와서 새 버전이면 시그널을 발생
         try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            release_info = response.json()
-            latest_version = release_info["tag_name"].lstrip('v')
-            update_content = release_info.get("body", "")
-            
-            # 버전 비교 (v 접두사 제거 후)
-            if latest_version > CURRENT_VERSION:
+            cache = get_update_cache()
+            if cache['latest_version'] and time.time() - cache['last_checked'] < cache['interval_hours'] * 3600:
+                latest_version, update_content = cache['latest_version'], cache['notes']
+            else:
+                latest_version, update_content = self._fetch_latest(cache)
+            if is_newer_version(latest_version, CURRENT_VERSION):
                 self.update_available.emit(latest_version, update_content)
-        except requests.RequestException as e:
+        except (urllib.error.URLError, OSError, ValueError, KeyError) as e:
             error_message = f"Error fetching latest version: {e}"
-            print(error_message)
+            logger.exception(error_message)
             self.error_occurred.emit(error_message)